@@ -0,0 +1,82 @@
+# benchmarks/bench_clean_html.py
+
+"""
+Micro-benchmark for the scraper's HTML cleaning and Markdown conversion.
+
+Compares the original path (html.parser, one select() sweep per excluded tag, serialise the body and let
+markdownify parse it again) with the current one in scripts/scrape.py, on the saved pages in
+benchmarks/fixtures/html. Reports the mean time per page for each, and whether both produce byte-identical Markdown.
+
+Usage: python benchmarks/bench_clean_html.py [--repeat N] [--selector SELECTOR] [FIXTURE ...]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from typing import Callable, List, Optional
+
+from bs4 import BeautifulSoup
+from markdownify import markdownify as md
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from scrape import TAGS_TO_EXCLUDE, html_to_markdown  # noqa: E402
+
+FIXTURES_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'html')
+
+def baseline_markdown(html: str, selector: Optional[str] = None) -> Optional[str]:
+    """The cleaning and conversion path the scraper used before lxml and the single exclusion traversal."""
+    soup = BeautifulSoup(html, 'html.parser')
+    container = soup.select_one(selector) if selector else soup.body
+    if container is None:
+        return None
+    for tag_selector in TAGS_TO_EXCLUDE:
+        for tag in container.select(tag_selector):
+            tag.decompose()
+    return md(str(container), heading_style="ATX")
+
+def time_per_page(convert: Callable[[str, Optional[str]], Optional[str]], pages: List[str],
+                  selector: Optional[str], repeat: int) -> float:
+    """Returns the mean wall time in milliseconds to convert one page."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            convert(html, selector)
+    return (time.perf_counter() - start) * 1000 / (repeat * len(pages))
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark HTML cleaning and Markdown conversion.")
+    parser.add_argument('fixtures', nargs='*', help="HTML files to convert (default: benchmarks/fixtures/html/*.html).")
+    parser.add_argument('--repeat', type=int, default=20, help="Times to convert each page (default: 20).")
+    parser.add_argument('--selector', default=None, help="Content selector to scope cleaning to (default: <body>).")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    paths = args.fixtures or sorted(glob.glob(os.path.join(FIXTURES_DIR, '*.html')))
+    if not paths:
+        print("No HTML fixtures found.")
+        return 1
+    pages = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            pages.append(f.read())
+
+    mismatches = [os.path.basename(path) for path, html in zip(paths, pages)
+                  if baseline_markdown(html, args.selector) != html_to_markdown(html, args.selector)]
+
+    size_kb = sum(len(html.encode('utf-8')) for html in pages) / 1024 / len(pages)
+    baseline_ms = time_per_page(baseline_markdown, pages, args.selector, args.repeat)
+    current_ms = time_per_page(html_to_markdown, pages, args.selector, args.repeat)
+    print(f"{len(pages)} pages, {size_kb:.1f} KB each on average, {args.repeat} repeats")
+    print(f"baseline: {baseline_ms:8.2f} ms/page")
+    print(f"current:  {current_ms:8.2f} ms/page ({baseline_ms / current_ms:.2f}x)")
+    if mismatches:
+        print(f"Markdown differs from the baseline for: {', '.join(mismatches)}")
+        return 1
+    print("Markdown matches the baseline for every page.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
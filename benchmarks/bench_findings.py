@@ -0,0 +1,116 @@
+# benchmarks/bench_findings.py
+
+"""
+Micro-benchmark for the linter's report writing.
+
+Compares keeping every finding as a dict in one list, sorted and dumped at the end, with ReportWriter's columns in
+scripts/lint.py. The regex findings of the scraped/*.md fixtures are repeated --copies times, as freshly built
+findings of another file.
+
+Reports the time of each, the peak memory traced while holding the report's findings, the time of a full garbage
+collection at that point, and whether both write the same report.
+
+Usage: python benchmarks/bench_findings.py [--copies N] [FIXTURE ...]
+"""
+
+import argparse
+import gc
+import glob
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+REPO_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+import lint  # noqa: E402
+
+FIXTURES_GLOB: str = os.path.join(REPO_DIR, 'scraped', '*.md')
+RULEBOOK_FILE: str = os.path.join(REPO_DIR, 'Trinity.json')
+
+def corpus_findings(fixture_findings: List[List[Dict[str, Any]]], copies: int):
+    """Yields the findings of each fixture, once per copy, as freshly built findings of a file of that copy."""
+    for copy in range(copies):
+        for findings in fixture_findings:
+            yield [dict(finding, fileName=f"{copy}-{finding['fileName']}", githubUrl=f"{copy}-{finding['githubUrl']}")
+                   for finding in findings]
+
+def baseline_report(findings_per_file, report_file: str) -> Callable[[], None]:
+    all_findings: List[Dict[str, Any]] = []
+    for findings in findings_per_file:
+        all_findings.extend(findings)
+
+    def write() -> None:
+        all_findings.sort(key=lambda x: (x['fileName'], x['lineNumber'], x['ruleId']))
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(all_findings, f, indent=2)
+    return write
+
+def current_report(findings_per_file, report_file: str) -> Callable[[], None]:
+    report = lint.ReportWriter(report_file, 'json')
+    for findings in findings_per_file:
+        report.add(findings)
+    return report.close
+
+def measure_report(build: Callable[..., Callable[[], None]], fixture_findings: List[List[Dict[str, Any]]],
+                   copies: int, report_file: str) -> Dict[str, float]:
+    """Returns the wall time of collecting and writing the findings, the traced peak and a full collection's time."""
+    gc.collect()
+    start = time.perf_counter()
+    write = build(corpus_findings(fixture_findings, copies), report_file)
+    collect_start = time.perf_counter()
+    gc.collect()
+    gc_ms = (time.perf_counter() - collect_start) * 1000
+    write()
+    seconds = time.perf_counter() - start - gc_ms / 1000
+    del write
+    gc.collect()
+
+    tracemalloc.start()
+    write = build(corpus_findings(fixture_findings, copies), report_file)
+    peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+    del write
+    return {"seconds": seconds, "peakMb": peak_mb, "gcMs": gc_ms}
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the storage of findings in the report writer.")
+    parser.add_argument('fixtures', nargs='*', help="Markdown files to use (default: scraped/*.md).")
+    parser.add_argument('--copies', type=int, default=20, help="Copies of the fixtures' findings in the report (default: 20).")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    paths = args.fixtures or sorted(glob.glob(FIXTURES_GLOB))
+    if not paths:
+        print("No Markdown fixtures found.")
+        return 1
+    contents = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            contents.append((os.path.basename(path), f.read()))
+
+    rules = [rule for rule in lint.load_rules_from_rulebook(RULEBOOK_FILE, ['*-R-*']) if rule['type'] == 'regex']
+    fixture_findings = [lint.lint_content(content, file_name, rules) for file_name, content in contents]
+    finding_count = sum(map(len, fixture_findings)) * args.copies
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline_file, current_file = os.path.join(tmp, 'baseline.json'), os.path.join(tmp, 'current.json')
+        baseline = measure_report(baseline_report, fixture_findings, args.copies, baseline_file)
+        current = measure_report(current_report, fixture_findings, args.copies, current_file)
+        with open(baseline_file, 'rb') as f, open(current_file, 'rb') as g:
+            same = f.read() == g.read()
+
+    print(f"{len(contents)} fixtures, report of {finding_count} findings ({args.copies} copies)")
+    for name, result in (("baseline", baseline), ("current", current)):
+        print(f"  {name + ':':10}{result['seconds']:8.2f} s  peak {result['peakMb']:8.1f} MB  full collection {result['gcMs']:8.1f} ms")
+    if not same:
+        print("The reports differ.")
+        return 1
+    print("The reports match.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
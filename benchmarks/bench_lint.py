@@ -0,0 +1,264 @@
+# benchmarks/bench_lint.py
+
+"""
+Benchmark suite for the linter.
+
+Each scenario lints a corpus with a rulebook: the checked-in scraped/*.md fixtures, or a synthetic Markdown file of
+a given size made by sampling their paragraphs, against Trinity.json, an evenly spread subset of its rules, or
+several copies of them. A scenario runs in its own process and reports the time of each phase (load rules cold and
+then warm from the compiled rulebook, spaCy load, parse, regex, heuristics, report write), lint throughput in KB/s
+(Markdown linted per second of parse, regex and heuristics) and the peak RSS of the process.
+
+Results are saved as JSON. Given the results of an earlier run with --baseline, the run fails if any scenario's
+throughput dropped, or its peak RSS grew, by more than the allowed fraction.
+
+Usage: python benchmarks/bench_lint.py [--sizes 10KB,100KB,1MB] [--rulebook-scales 0.5,1,2]
+                                       [--output FILE] [--baseline FILE] [--max-slowdown 0.2]
+"""
+
+import argparse
+import glob
+import json
+import math
+import os
+import platform
+import random
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+REPO_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+
+FIXTURES_GLOB: str = os.path.join(REPO_DIR, 'scraped', '*.md')
+RULEBOOK_FILE: str = os.path.join(REPO_DIR, 'Trinity.json')
+DEFAULT_SIZES: str = '10KB,100KB,1MB'
+DEFAULT_RULEBOOK_SCALES: str = '1'
+DEFAULT_MAX_SLOWDOWN: float = 0.2
+DEFAULT_MAX_RSS_GROWTH: float = 0.2
+PHASES: Tuple[str, ...] = ('loadRulesCold', 'loadRulesWarm', 'spacyLoad', 'parse', 'regex', 'heuristics', 'reportWrite')
+SIZE_UNITS: Dict[str, int] = {'KB': 1024, 'MB': 1024 * 1024}
+
+# --- Corpus and Rulebook Generation ---
+def parse_size(text: str) -> int:
+    """Parses a size such as '10KB' or '1MB' into bytes."""
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*(KB|MB)\s*', text, re.IGNORECASE)
+    if not match:
+        raise argparse.ArgumentTypeError(f"Invalid size '{text}', expected e.g. 10KB or 1MB.")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2).upper()])
+
+def generate_markdown(size: int, seed: int, fixtures: List[str]) -> str:
+    """Returns at least `size` bytes of Markdown made of paragraphs drawn at random from the fixtures."""
+    blocks = []
+    for path in fixtures:
+        with open(path, 'r', encoding='utf-8') as f:
+            blocks.extend(block.strip() for block in f.read().split('\n\n') if block.strip())
+    rng = random.Random(seed)
+    parts, total = [], 0
+    while total < size:
+        block = rng.choice(blocks)
+        parts.append(block)
+        total += len(block.encode('utf-8')) + 2
+    return '\n\n'.join(parts) + '\n'
+
+def scale_rulebook(rule_sets: List[Dict[str, Any]], scale: float) -> List[Dict[str, Any]]:
+    """
+    Returns a rulebook with `scale` times as many rules: an evenly spread subset below 1, and copies of every rule
+    (with suffixed ids) above it.
+    """
+    rules = [rule for rule_set in rule_sets for rule in rule_set.get('rules', [])]
+    count = max(1, round(len(rules) * scale))
+    if scale <= 1:
+        scaled = [rules[math.floor(i * len(rules) / count)] for i in range(count)]
+    else:
+        scaled = [dict(rules[i % len(rules)], id=f"{rules[i % len(rules)].get('id')}~{i // len(rules)}") if i >= len(rules) else rules[i]
+                  for i in range(count)]
+    return [{"ruleSet": f"Trinity x{scale:g}", "rules": scaled}]
+
+# --- Scenarios ---
+def peak_rss_mb() -> float:
+    """Returns the peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def load_rules_cold_and_warm(rulebook_file: str, phases: Dict[str, float]) -> List[Dict[str, Any]]:
+    """
+    Loads the rulebook twice, first compiling it and then from its compiled form, and records the time of each.
+    The loads run in a temporary working directory, so the compiled rulebook is written under its .lint_cache
+    rather than into the checkout's, where it would make the first load of a later run warm.
+    """
+    import lint
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            start = time.perf_counter()
+            lint.load_rules_from_rulebook(rulebook_file)
+            phases['loadRulesCold'] = time.perf_counter() - start
+            start = time.perf_counter()
+            rules = lint.load_rules_from_rulebook(rulebook_file)
+            phases['loadRulesWarm'] = time.perf_counter() - start
+        finally:
+            os.chdir(cwd)
+    return rules
+
+def run_scenario(corpus: List[Tuple[str, str]], rulebook_file: str, repeat: int) -> Dict[str, Any]:
+    """Lints the (file_path, file_name) corpus with the rulebook and returns the time of each phase and the peak RSS."""
+    import lint
+
+    phases = dict.fromkeys(PHASES, 0.0)
+    rules = load_rules_cold_and_warm(rulebook_file, phases)
+    regex_rules = [rule for rule in rules if rule.get('type') == 'regex']
+    heuristic_rules = [rule for rule in rules if rule.get('type') == 'heuristic']
+
+    model = None
+    if heuristic_rules:
+        start = time.perf_counter()
+        model = lint.load_spacy_model(lint.required_spacy_components(rules))
+        phases['spacyLoad'] = time.perf_counter() - start
+
+    size = 0
+    findings: List[Dict[str, Any]] = []
+    for file_path, file_name in corpus:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        size += len(content.encode('utf-8'))
+        lines = content.splitlines()
+        # The fastest of `repeat` runs of each phase, so one-off pauses do not count as regressions.
+        best = dict.fromkeys(('parse', 'regex', 'heuristics'), math.inf)
+        for _ in range(repeat):
+            doc = None
+            if model is not None:
+                model.max_length = max(model.max_length, len(content) + 1)
+                start = time.perf_counter()
+                doc = model(lint.extract_prose(content)[0])
+                best['parse'] = min(best['parse'], time.perf_counter() - start)
+            start = time.perf_counter()
+            file_findings = lint.scan_regex_rules(content, lines, file_name, regex_rules)
+            best['regex'] = min(best['regex'], time.perf_counter() - start)
+            if doc is not None:
+                start = time.perf_counter()
+                file_findings = file_findings + lint.lint_content(content, file_name, heuristic_rules, doc)
+                best['heuristics'] = min(best['heuristics'], time.perf_counter() - start)
+        for phase, seconds in best.items():
+            phases[phase] += seconds if seconds != math.inf else 0.0
+        findings.extend(file_findings)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        lint.write_report(findings, os.path.join(tmp, 'report.json'))
+        phases['reportWrite'] = time.perf_counter() - start
+
+    lint_seconds = phases['parse'] + phases['regex'] + phases['heuristics']
+    return {
+        "files": len(corpus), "sizeKB": round(size / 1024, 1), "rules": len(rules),
+        "regexRules": len(regex_rules), "heuristicRules": len(heuristic_rules), "findings": len(findings),
+        "phases": {phase: round(seconds, 4) for phase, seconds in phases.items()},
+        "throughputKBps": round(size / 1024 / lint_seconds, 1) if lint_seconds > 0 else None,
+        "peakRssMB": round(peak_rss_mb(), 1),
+    }
+
+def run_isolated(corpus: List[Tuple[str, str]], rulebook_file: str, repeat: int) -> Dict[str, Any]:
+    """Runs a scenario in a fresh worker process, so its peak RSS and model load are its own."""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(run_scenario, corpus, rulebook_file, repeat).result()
+
+# --- Regression Checks ---
+def find_regressions(results: Dict[str, Any], baseline: Dict[str, Any], max_slowdown: float, max_rss_growth: float) -> List[str]:
+    """Compares scenarios present in both runs and returns a description of each regression beyond the thresholds."""
+    regressions = []
+    previous = {scenario['name']: scenario for scenario in baseline.get('scenarios', [])}
+    for scenario in results['scenarios']:
+        before = previous.get(scenario['name'])
+        if before is None:
+            continue
+        if before.get('throughputKBps') and scenario.get('throughputKBps'):
+            drop = 1 - scenario['throughputKBps'] / before['throughputKBps']
+            if drop > max_slowdown:
+                regressions.append(f"{scenario['name']}: throughput {before['throughputKBps']} -> {scenario['throughputKBps']} KB/s ({drop:.0%} slower)")
+        if before.get('peakRssMB'):
+            growth = scenario['peakRssMB'] / before['peakRssMB'] - 1
+            if growth > max_rss_growth:
+                regressions.append(f"{scenario['name']}: peak RSS {before['peakRssMB']} -> {scenario['peakRssMB']} MB ({growth:.0%} more)")
+    return regressions
+
+def git_commit() -> Optional[str]:
+    """Returns the commit being benchmarked, if the repository is a git checkout."""
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_DIR, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the linter on fixtures and synthetic Markdown.")
+    parser.add_argument('--sizes', default=DEFAULT_SIZES,
+                        help=f"Comma-separated sizes of synthetic documents, from 10KB to 10MB; empty for none (default: {DEFAULT_SIZES}).")
+    parser.add_argument('--rulebook-scales', default=DEFAULT_RULEBOOK_SCALES,
+                        help="Comma-separated rulebook sizes relative to Trinity.json, e.g. 0.25,1,4 (default: 1).")
+    parser.add_argument('--no-fixtures', action='store_true', help="Skip the scenario that lints scraped/*.md.")
+    parser.add_argument('--seed', type=int, default=0, help="Seed for the synthetic corpus (default: 0).")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs of each timed phase per file; the fastest counts (default: 3).")
+    parser.add_argument('--output', default='bench_lint.json', help="File to save the results to (default: bench_lint.json).")
+    parser.add_argument('--baseline', default=None, help="Results of an earlier run to check for regressions against.")
+    parser.add_argument('--max-slowdown', type=float, default=DEFAULT_MAX_SLOWDOWN,
+                        help=f"Allowed fractional drop in throughput (default: {DEFAULT_MAX_SLOWDOWN}).")
+    parser.add_argument('--max-rss-growth', type=float, default=DEFAULT_MAX_RSS_GROWTH,
+                        help=f"Allowed fractional growth in peak RSS (default: {DEFAULT_MAX_RSS_GROWTH}).")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    sizes = [parse_size(size) for size in args.sizes.split(',') if size.strip()]
+    scales = [float(scale) for scale in args.rulebook_scales.split(',') if scale.strip()]
+    fixtures = sorted(glob.glob(FIXTURES_GLOB))
+    with open(RULEBOOK_FILE, 'r', encoding='utf-8') as f:
+        rule_sets = json.load(f)
+
+    results: Dict[str, Any] = {"commit": git_commit(), "python": platform.python_version(),
+                               "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S'), "scenarios": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        corpora: List[Tuple[str, List[Tuple[str, str]]]] = []
+        if not args.no_fixtures and fixtures:
+            corpora.append(('fixtures', [(path, os.path.basename(path)) for path in fixtures]))
+        for size in sizes:
+            label = f"{size // SIZE_UNITS['MB']}MB" if size % SIZE_UNITS['MB'] == 0 else f"{size // SIZE_UNITS['KB']}KB"
+            path = os.path.join(tmp, f"synthetic-{label}.md")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(generate_markdown(size, args.seed, fixtures))
+            corpora.append((f"synthetic-{label}", [(path, os.path.basename(path))]))
+
+        for scale in scales:
+            rulebook_file = os.path.join(tmp, f"rulebook-x{scale:g}.json")
+            with open(rulebook_file, 'w', encoding='utf-8') as f:
+                json.dump(scale_rulebook(rule_sets, scale), f)
+            for corpus_name, corpus in corpora:
+                name = f"{corpus_name}@rules-x{scale:g}"
+                scenario = dict(name=name, **run_isolated(corpus, rulebook_file, max(args.repeat, 1)))
+                results['scenarios'].append(scenario)
+                phases = ', '.join(f"{phase} {seconds:.3f}s" for phase, seconds in scenario['phases'].items())
+                print(f"{name}: {scenario['sizeKB']} KB, {scenario['rules']} rules, {scenario['throughputKBps']} KB/s, "
+                      f"peak RSS {scenario['peakRssMB']} MB ({phases})")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.max_slowdown, args.max_rss_growth)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline}.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+# scripts/audit.py
+
+import os
+import json
+import queue
+import logging
+import argparse
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+# --- Setup Structured Logging ---
+# Configured before the stages are imported, so their own basicConfig calls leave this one in place.
+LOG_DIR: str = 'logs'
+os.makedirs(LOG_DIR, exist_ok=True)
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s [%(levelname)s] [%(threadName)s] - %(message)s',
+    handlers=[
+        logging.FileHandler(os.path.join(LOG_DIR, 'audit.log')),
+        logging.StreamHandler()
+    ]
+)
+
+import scrape
+import lint
+
+# --- Configuration ---
+DEFAULT_QUEUE_SIZE: int = 32  # Scraped documents waiting to be linted before the scraper blocks
+
+# --- Pipeline ---
+# The scraper runs in a background thread and puts the path of each finished Markdown file on a bounded queue;
+# the lint stage consumes them as they arrive, so spaCy loads and parses while pages are still being fetched.
+# When the lint stage falls behind, the queue fills and the scraper's sessions block until there is room.
+_END_OF_SCRAPE = None
+
+def scrape_stage(targets: List[Dict[str, str]], args: argparse.Namespace, manifest: scrape.ScrapeManifest,
+                 documents: "queue.Queue[Optional[str]]", errors: List[BaseException]) -> None:
+    """Scrapes the targets, putting each finished file's path on `documents`, then marks the end of the scrape."""
+    try:
+        rate_limiter = scrape.create_rate_limiter(args.host_rate, args.host_burst)
+        scrape.scrape_targets(targets, args.sessions, rate_limiter, manifest, args.fetch == "auto", documents.put, not args.load_all_resources)
+    except BaseException as e:
+        errors.append(e)
+    finally:
+        documents.put(_END_OF_SCRAPE)
+
+def next_batch(documents: "queue.Queue[Optional[str]]", batch_size: int) -> Tuple[List[str], bool]:
+    """
+    Waits for the next document, then takes up to `batch_size` in total without waiting for more.
+    Returns the paths taken and whether the end of the scrape was reached.
+    """
+    batch = []
+    item = documents.get()
+    while item is not _END_OF_SCRAPE:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            return batch, False
+        try:
+            item = documents.get_nowait()
+        except queue.Empty:
+            return batch, False
+    return batch, True
+
+def lint_stage(documents: "queue.Queue[Optional[str]]", linting_rules: List[Dict[str, Any]], args: argparse.Namespace,
+               cache: Optional[lint.LintCache], report: lint.ReportWriter, profile: Optional[lint.LintProfile] = None) -> None:
+    """
+    Lints documents from the queue until the scrape ends, then any other Markdown files in the scraped directory
+    (pages kept from earlier runs), adding each file's findings to `report` as it is linted. With more than one job,
+    batches are linted in a process pool, with at most two batches per worker in flight. With a `profile`, every
+    file's measurements are added to it.
+    """
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    batch_size = max(args.batch_size, 1)
+    seen: Set[str] = set()
+    executor = None
+    pending: Set[Future] = set()
+
+    def collect(done: Set[Future]) -> None:
+        for future in done:
+            chunk_results, chunk_profile, chunk_counters = future.result()
+            if profile is not None:
+                profile.merge(chunk_profile)
+            if cache is not None and chunk_counters is not None:
+                cache.add_counters(chunk_counters)
+            for file_name, findings in chunk_results:
+                report.add(findings)
+                logging.info(f"Linted {os.path.join(lint.MARKDOWN_DIR, file_name)} ({len(findings)} findings).")
+
+    def submit(paths: List[str]) -> None:
+        nonlocal pending
+        files = [(path, os.path.basename(path)) for path in paths if path.endswith('.md')]
+        seen.update(file_name for _, file_name in files)
+        if executor is None:
+            for _, findings in lint.lint_files(files, linting_rules, batch_size, cache, profile, args.chunk_chars,
+                                               args.incremental, args.share_segments):
+                report.add(findings)
+            return
+        pending.add(executor.submit(lint._lint_files_in_worker, files))
+        if len(pending) >= jobs * 2:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done)
+
+    if jobs > 1:
+        logging.info(f"Linting with {jobs} worker processes.")
+        cache_settings = (args.cache_dir, args.cache_max_mb) if cache is not None else None
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=lint._init_lint_worker,
+                                       initargs=(args.rulebook, batch_size, cache_settings, profile is not None, args.chunk_chars,
+                                                 args.incremental, args.share_segments, args.rules, args.severity))
+    elif lint._has_heuristics(linting_rules):
+        lint.load_spacy_model(lint.required_spacy_components(linting_rules))
+
+    try:
+        finished = False
+        while not finished:
+            paths, finished = next_batch(documents, batch_size)
+            if paths:
+                submit(paths)
+
+        if os.path.exists(lint.MARKDOWN_DIR):
+            remaining = [os.path.join(lint.MARKDOWN_DIR, file_name) for file_name in sorted(os.listdir(lint.MARKDOWN_DIR))
+                         if file_name.endswith('.md') and file_name not in seen]
+            for start in range(0, len(remaining), batch_size):
+                submit(remaining[start:start + batch_size])
+        collect(pending)
+        if cache is not None:
+            logging.info(f"Lint cache: {cache.hits} hits, {cache.misses} misses.")
+            if args.share_segments:
+                logging.info(f"Shared segments: {cache.segment_hits} hits, {cache.segment_misses} misses.")
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parses command-line options for the combined scrape and lint pipeline."""
+    parser = argparse.ArgumentParser(description="Scrape the pages in config.json and lint them as they arrive.")
+    scrape.add_scrape_arguments(parser)
+    lint.add_lint_arguments(parser)
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE,
+                        help=f"Scraped documents allowed to wait for the linter before scraping pauses (default: {DEFAULT_QUEUE_SIZE}).")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Runs the scraper and the linter as overlapping stages and writes the same report as running them one after the other."""
+    args = parse_args(argv)
+    try:
+        with open(scrape.CONFIG_FILE, 'r') as f:
+            targets = json.load(f)
+    except FileNotFoundError:
+        logging.error(f"Configuration file '{scrape.CONFIG_FILE}' not found. Exiting.")
+        return
+
+    manifest = scrape.ScrapeManifest(force=args.force)
+    if args.force:
+        logging.info("Forced scrape: loading every page without revalidating it.")
+
+    linting_rules = lint.load_rules_from_rulebook(args.rulebook, args.rules, args.severity)
+    if not linting_rules:
+        logging.warning("No linting rules were loaded. An empty report will be created.")
+    cache = None
+    if not args.no_cache:
+        cache = lint.create_lint_cache(linting_rules, args.cache_dir, args.cache_max_mb)
+        if args.clear_cache:
+            cache.clear()
+    profile = None
+    if args.profile:
+        logging.info("Profiling: every file is linted without the lint cache.")
+        profile = lint.LintProfile()
+        cache = None
+
+    documents: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=max(args.queue_size, 1))
+    scrape_errors: List[BaseException] = []
+    scraper = threading.Thread(target=scrape_stage, name="scrape", args=(targets, args, manifest, documents, scrape_errors))
+    scraper.start()
+    report = lint.ReportWriter(args.report_file, args.report_format)
+    try:
+        lint_stage(documents, linting_rules, args, cache, report, profile)
+    finally:
+        # Keep draining so a scraper blocked on a full queue can finish if linting stopped early.
+        while scraper.is_alive():
+            try:
+                documents.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        scraper.join()
+    if scrape_errors:
+        raise scrape_errors[0]
+
+    manifest.save()
+    logging.info(f"{len(manifest.changed)} outputs changed, {len(manifest.unchanged)} unchanged: {', '.join(sorted(manifest.changed)) or 'none'}")
+    if cache is not None:
+        cache.evict()
+
+    report.close()
+    if profile is not None:
+        profile.write(lint.PROFILE_FILE, args.profile_top, args.rule_budget_ms)
+    logging.info(f"Audit complete. Report generated at {args.report_file}")
+    logging.info(f"Found {report.count} issues.")
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,49 @@
 # scripts/lint.py
 
+from __future__ import annotations
+
 import os
 import re
 import json
-import spacy
 import logging
 import bisect
-from typing import List, Dict, Callable, Any, Optional, Pattern
-from spacy.tokens import Doc, Span, Token
+import difflib
+import fnmatch
+import argparse
+import hashlib
+import shutil
+import heapq
+import tempfile
+import functools
+import time
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, List, Dict, Callable, Any, Optional, Pattern, Set, Tuple, Iterable, Iterator
+
+# spaCy takes about a second to import, so it is only imported once a heuristic rule, a cached Doc or the cache
+# fingerprint needs it; a regex-only run never imports it.
+if TYPE_CHECKING:
+    from spacy.language import Language
+    from spacy.tokens import Doc, Span, Token
+    from spacy.vocab import Vocab
+
+try:
+    import re._parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
 
 # --- Configuration ---
 MARKDOWN_DIR: str = 'scraped'  # Updated to read from the new directory
 REPORT_FILE: str = 'report.json'
 LOG_DIR: str = 'logs'
 RULEBOOK_FILE: str = 'Trinity.json' 
+CACHE_DIR: str = '.lint_cache'
+CACHE_MAX_MB: int = 256
+PROFILE_FILE: str = 'profile.json'
+PROFILE_TOP_N: int = 10
+CHUNK_CHARS: int = 100_000  # Files larger than this are linted in chunks of about this many characters
+RULE_BUDGET_MS: float = 250.0  # Time one rule may take on one file before --profile flags it
 
 # --- Setup Structured Logging ---
 os.makedirs(LOG_DIR, exist_ok=True)
@@ -27,196 +57,493 @@ logging.basicConfig(
 )
 
 # --- spaCy Model Loading ---
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    logging.error("spaCy model 'en_core_web_sm' not found. Please ensure it's in your requirements.txt or run 'python -m spacy download en_core_web_sm'")
-    exit()
+SPACY_MODEL: str = "en_core_web_sm"
+SPACY_COMPONENTS: Set[str] = {"tok2vec", "tagger", "parser", "senter", "attribute_ruler", "lemmatizer", "ner"}
+DEFAULT_BATCH_SIZE: int = 16
+nlp: Optional[Language] = None
+_nlp_components: Optional[Set[str]] = None
+
+def load_spacy_model(components: Optional[Set[str]] = None) -> Language:
+    """
+    Loads the spaCy model into the module-level `nlp`, once per process.
+    When `components` is given, every other pipeline component is excluded so it is neither loaded nor run.
+    """
+    global nlp, _nlp_components
+    if nlp is None or _nlp_components != components:
+        import spacy
+        exclude = sorted(SPACY_COMPONENTS - components) if components is not None else []
+        try:
+            nlp = spacy.load(SPACY_MODEL, exclude=exclude)
+        except OSError:
+            logging.error(f"spaCy model '{SPACY_MODEL}' not found. Please ensure it's in your requirements.txt or run 'python -m spacy download {SPACY_MODEL}'")
+            raise SystemExit(1)
+        _nlp_components = components
+        logging.info(f"Loaded spaCy model '{SPACY_MODEL}' with components: {', '.join(nlp.pipe_names)}")
+    return nlp
+
+_english_vocab: Optional[Vocab] = None
+
+def english_vocab() -> Vocab:
+    """
+    Returns a shared English vocabulary, for Docs and matchers that must not wait for the model to load.
+    Unlike a bare Vocab it computes lexical attributes such as LOWER, which matcher patterns rely on.
+    """
+    global _english_vocab
+    if _english_vocab is None:
+        import spacy
+        _english_vocab = spacy.blank("en").vocab
+    return _english_vocab
 
 # --- Helper Functions ---
 def get_line_number_from_offset(offset: int, line_offsets: List[int]) -> int:
     """Finds the line number for a given character offset using binary search."""
     return bisect.bisect_right(line_offsets, offset)
 
+class FindingList(list):
+    """The findings of one check, with a set of their (line_number, offending_text) pairs for O(1) duplicate checks."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.seen: Set[Tuple[int, str]] = set()
+
 def _add_finding(findings: List[Dict], line_number: int, offending_text: str):
     """Helper to prevent duplicate findings for the same line and rule."""
-    if not any(f['line_number'] == line_number and f['offending_text'] == offending_text.strip() for f in findings):
-        findings.append({
-            "line_number": line_number,
-            "offending_text": offending_text.strip()
-        })
+    offending_text = offending_text.strip()
+    seen = getattr(findings, 'seen', None)
+    if seen is None:  # A plain list from a caller outside the engine.
+        if any(f['line_number'] == line_number and f['offending_text'] == offending_text for f in findings):
+            return
+    elif (line_number, offending_text) in seen:
+        return
+    else:
+        seen.add((line_number, offending_text))
+    findings.append({
+        "line_number": line_number,
+        "offending_text": offending_text
+    })
+
+# --- Profiling ---
+# With --profile, every rule records its wall time, calls (regex searches, heuristic callbacks or matcher runs),
+# lines scanned and findings on every file, and every file its spaCy parse time. Time spent once on behalf of
+# several rules, in a check shared by several rule IDs or a run of the pattern matcher, is split evenly between them.
+RuleStats = List[float]  # [seconds, calls, lines scanned, findings]
+
+class LintProfile:
+    """Per-rule and per-file measurements of a lint run."""
+
+    def __init__(self) -> None:
+        self.rules: Dict[str, Dict[str, RuleStats]] = {}  # file name -> rule ID -> stats
+        self.parse_seconds: Dict[str, float] = {}
+
+    def add_rule(self, file_name: str, rule_id: str, seconds: float, calls: int, lines: int, findings: int) -> None:
+        """Adds measurements of a rule on a file (rule IDs that occur twice in the rulebook are added together)."""
+        stats = self.rules.setdefault(file_name, {}).setdefault(rule_id, [0.0, 0, 0, 0])
+        stats[0] += seconds
+        stats[1] += calls
+        stats[2] += lines
+        stats[3] += findings
+
+    def add_parse(self, file_name: str, seconds: float) -> None:
+        self.parse_seconds[file_name] = self.parse_seconds.get(file_name, 0.0) + seconds
+
+    def merge(self, other: "LintProfile") -> None:
+        """Adds the measurements of another profile, such as one collected in a worker process."""
+        for file_name, rules in other.rules.items():
+            for rule_id, stats in rules.items():
+                self.add_rule(file_name, rule_id, *stats)
+        for file_name, seconds in other.parse_seconds.items():
+            self.add_parse(file_name, seconds)
+
+    def rule_totals(self) -> Dict[str, Dict[str, Any]]:
+        """Returns each rule's measurements summed over all files, with its slowest file."""
+        totals: Dict[str, Dict[str, Any]] = {}
+        for file_name, rules in self.rules.items():
+            for rule_id, (seconds, calls, lines, findings) in rules.items():
+                total = totals.setdefault(rule_id, {"timeMs": 0.0, "calls": 0, "linesScanned": 0, "findings": 0,
+                                                    "slowestFile": None, "slowestFileMs": 0.0})
+                total["timeMs"] += seconds * 1000
+                total["calls"] += calls
+                total["linesScanned"] += lines
+                total["findings"] += findings
+                if seconds * 1000 > total["slowestFileMs"]:
+                    total["slowestFile"], total["slowestFileMs"] = file_name, seconds * 1000
+        return totals
+
+    def to_dict(self, budget_ms: float = RULE_BUDGET_MS) -> Dict[str, Any]:
+        """Returns the profile as written to the profile artifact, flagging rules that took over `budget_ms` on a file."""
+        totals = self.rule_totals()
+        for total in totals.values():
+            total["timeMs"] = round(total["timeMs"], 3)
+            total["slowestFileMs"] = round(total["slowestFileMs"], 3)
+            total["overBudget"] = total["slowestFileMs"] > budget_ms
+        files = {
+            file_name: {
+                "parseMs": round(self.parse_seconds.get(file_name, 0.0) * 1000, 3),
+                "rules": {rule_id: {"timeMs": round(seconds * 1000, 3), "calls": calls, "linesScanned": lines, "findings": findings}
+                          for rule_id, (seconds, calls, lines, findings) in sorted(self.rules.get(file_name, {}).items())},
+            }
+            for file_name in sorted(set(self.rules) | set(self.parse_seconds))
+        }
+        return {"ruleBudgetMs": budget_ms, "rules": dict(sorted(totals.items(), key=lambda item: -item[1]["timeMs"])), "files": files}
+
+    def write(self, profile_file: str = PROFILE_FILE, top_n: int = PROFILE_TOP_N, budget_ms: float = RULE_BUDGET_MS) -> None:
+        """Writes the profile artifact and logs the slowest rules and every rule over the time budget."""
+        profile = self.to_dict(budget_ms)
+        with open(profile_file, 'w', encoding='utf-8') as f:
+            json.dump(profile, f, indent=2)
+        parse_ms = sum(file["parseMs"] for file in profile["files"].values())
+        logging.info(f"Profile written to {profile_file}. spaCy parse: {parse_ms:.1f} ms over {len(self.parse_seconds)} files.")
+        for rank, (rule_id, total) in enumerate(list(profile["rules"].items())[:top_n], 1):
+            logging.info(f"Slowest rules {rank}. {rule_id}: {total['timeMs']:.1f} ms, {total['calls']} calls, "
+                         f"{total['linesScanned']} lines, {total['findings']} findings (slowest file {total['slowestFile']}: {total['slowestFileMs']:.1f} ms)")
+        for rule_id, total in profile["rules"].items():
+            if total["overBudget"]:
+                logging.warning(f"Rule '{rule_id}' took {total['slowestFileMs']:.1f} ms on {total['slowestFile']}, over the {budget_ms:g} ms budget.")
+
+def _timed(callback: Callable, timings: Dict[Any, List[float]], key: Any) -> Callable:
+    """Wraps `callback` to add its wall time and a call to `timings[key]`."""
+    entry = timings.setdefault(key, [0.0, 0])
+    def timed(*args: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return callback(*args)
+        finally:
+            entry[0] += time.perf_counter() - start
+            entry[1] += 1
+    return timed
+
+# --- Fused Heuristic Engine ---
+# Heuristic checks are written as per-token or per-sentence callbacks and registered with the
+# `token_check`/`sentence_check` decorators. `run_heuristic_checks` walks a Doc once, sentence by sentence
+# and token by token, and dispatches to every registered callback of the requested checks, so each distinct
+# check runs once per document however many rule IDs map to it. The decorated name is a whole-document
+# check, `check(doc, line_offsets)`, which runs the callback on its own.
+HeuristicCheck = Callable[["Doc", List[int]], List[Dict[str, Any]]]
+TokenCallback = Callable[["Token", "Span", List[int], List[Dict[str, Any]]], None]
+SentenceCallback = Callable[["Span", List[int], List[Dict[str, Any]]], None]
+
+TOKEN_CALLBACKS: Dict[HeuristicCheck, TokenCallback] = {}
+SENTENCE_CALLBACKS: Dict[HeuristicCheck, SentenceCallback] = {}
+
+def _register_check(callback: Callable, registry: Dict[HeuristicCheck, Any]) -> HeuristicCheck:
+    """Registers a callback and returns the whole-document check that stands for it in HEURISTIC_CHECKS."""
+    def check(doc: Doc, line_offsets: List[int]) -> List[Dict[str, Any]]:
+        results, errors = run_heuristic_checks(doc, line_offsets, [check])
+        if check in errors:
+            raise errors[check]
+        return results[check]
+    check.__name__ = check.__qualname__ = callback.__name__
+    check.__doc__ = callback.__doc__
+    registry[check] = callback
+    return check
+
+def token_check(callback: TokenCallback) -> HeuristicCheck:
+    """Decorator registering `callback(token, sent, line_offsets, findings)` to be called for every token."""
+    return _register_check(callback, TOKEN_CALLBACKS)
+
+def sentence_check(callback: SentenceCallback) -> HeuristicCheck:
+    """Decorator registering `callback(sent, line_offsets, findings)` to be called for every sentence."""
+    return _register_check(callback, SENTENCE_CALLBACKS)
+
+def run_heuristic_checks(doc: Doc, line_offsets: List[int], checks: List[HeuristicCheck],
+                         timings: Optional[Dict[HeuristicCheck, List[float]]] = None) -> Tuple[Dict[HeuristicCheck, List[Dict[str, Any]]], Dict[HeuristicCheck, Exception]]:
+    """
+    Runs each distinct check in a single traversal of the document. Returns the findings keyed by check, and the
+    exception of any check that failed; a failed check is dropped from the traversal and has no findings.
+    Pattern checks are answered by one run of their matcher, and other checks without registered callbacks
+    are called on the whole document. With `timings`, each check's [seconds, calls] are added to it.
+    """
+    results: Dict[HeuristicCheck, List[Dict[str, Any]]] = {check: FindingList() for check in checks}
+    errors: Dict[HeuristicCheck, Exception] = {}
+
+    def callback_of(check: HeuristicCheck, registry: Dict[HeuristicCheck, Callable]) -> Callable:
+        return registry[check] if timings is None else _timed(registry[check], timings, check)
+    token_callbacks = [(check, callback_of(check, TOKEN_CALLBACKS), results[check]) for check in results if check in TOKEN_CALLBACKS]
+    sentence_callbacks = [(check, callback_of(check, SENTENCE_CALLBACKS), results[check]) for check in results if check in SENTENCE_CALLBACKS]
+
+    pattern_matches: Dict[int, Dict[str, List[Dict[str, Any]]]] = {}
+    matcher_timings: Dict[int, List[float]] = {}
+    matcher_checks: Dict[int, List[HeuristicCheck]] = {}
+    for check in results:
+        if check in TOKEN_CALLBACKS or check in SENTENCE_CALLBACKS:
+            continue
+        try:
+            if isinstance(check, PatternCheck):
+                # All pattern checks of a matcher share one run of it.
+                matcher, key = check.matcher, check.key
+                matcher_checks.setdefault(id(matcher), []).append(check)
+                if id(matcher) not in pattern_matches:
+                    run = matcher if timings is None else _timed(matcher, matcher_timings, id(matcher))
+                    pattern_matches[id(matcher)] = run(doc, line_offsets)
+                results[check] = pattern_matches[id(matcher)].get(key, [])
+            else:
+                results[check] = (check if timings is None else _timed(check, timings, check))(doc, line_offsets)
+        except Exception as e:
+            errors[check] = e
+    for matcher_id, (seconds, calls) in matcher_timings.items():
+        for check in matcher_checks[matcher_id]:
+            timings[check] = [seconds / len(matcher_checks[matcher_id]), calls]
+
+    if token_callbacks or sentence_callbacks:
+        try:
+            sentences = list(doc.sents)
+        except ValueError:  # No sentence boundaries: the checks in use only look at tokens.
+            sentences = [doc[:]]
+        for sent in sentences:
+            for check, callback, findings in sentence_callbacks:
+                try:
+                    callback(sent, line_offsets, findings)
+                except Exception as e:
+                    errors[check] = e
+            for token in sent:
+                for check, callback, findings in token_callbacks:
+                    try:
+                        callback(token, sent, line_offsets, findings)
+                    except Exception as e:
+                        errors[check] = e
+            if errors:
+                token_callbacks = [entry for entry in token_callbacks if entry[0] not in errors]
+                sentence_callbacks = [entry for entry in sentence_callbacks if entry[0] not in errors]
+
+    for check in errors:
+        results.pop(check, None)
+    return results, errors
 
 # --- Heuristic Rule Implementations ---
-def check_passive_voice(doc: Doc, line_offsets: List[int]) -> List[Dict[str, Any]]:
+_COLLECTIVE_NOUNS = {"government", "committee", "crowd", "team", "family", "group", "staff"}
+_PLURAL_VERBS = {"are", "were", "have", "do"}
+_LATIN_FORMS = {'e.g.', 'i.e.', 'etc.'}
+_FILLER_ADVERBS = {"very", "really", "quite", "extremely", "highly", "absolutely", "totally", "actually", "basically", "literally"}
+_VOWEL_SOUNDS = 'aeiou'
+_U_EXCEPTIONS = {'university', 'universal', 'unique', 'user', 'unit'}
+_H_EXCEPTIONS = {'hour', 'honor', 'honour', 'honest', 'heir'}
+_INITIALISM_EXCEPTIONS = {'f', 'h', 'l', 'm', 'n', 'r', 's', 'x'}
+
+@token_check
+def check_passive_voice(token: Token, sent: Span, line_offsets: List[int], findings: List[Dict[str, Any]]) -> None:
     """Heuristic check for passive voice constructions (Rule: APS-GPC-Partsofsentences-H-009)."""
-    findings = []
-    for token in doc:
-        if token.dep_ in ("nsubjpass", "auxpass"):
-            _add_finding(findings, get_line_number_from_offset(token.sent.start_char, line_offsets), token.sent.text)
-    return findings
+    if token.dep_ in ("nsubjpass", "auxpass"):
+        _add_finding(findings, get_line_number_from_offset(sent.start_char, line_offsets), sent.text)
 
-def check_complete_sentence(doc: Doc, line_offsets: List[int]) -> List[Dict[str, Any]]:
+@sentence_check
+def check_complete_sentence(sent: Span, line_offsets: List[int], findings: List[Dict[str, Any]]) -> None:
     """Heuristic to check for potential sentence fragments (Rule: APS-GPC-Partsofsentences-H-001)."""
-    findings = []
-    for sent in doc.sents:
-        has_root = any(token.dep_ == "ROOT" for token in sent)
-        has_subject = any("subj" in token.dep_ for token in sent)
-        if not (has_root and has_subject) and len(sent.text.strip().split()) > 3:
-            _add_finding(findings, get_line_number_from_offset(sent.start_char, line_offsets), sent.text)
-    return findings
+    has_root = any(token.dep_ == "ROOT" for token in sent)
+    has_subject = any("subj" in token.dep_ for token in sent)
+    if not (has_root and has_subject) and len(sent.text.strip().split()) > 3:
+        _add_finding(findings, get_line_number_from_offset(sent.start_char, line_offsets), sent.text)
 
-def check_collective_noun_agreement(doc: Doc, line_offsets: List[int]) -> List[Dict[str, Any]]:
+@token_check
+def check_collective_noun_agreement(token: Token, sent: Span, line_offsets: List[int], findings: List[Dict[str, Any]]) -> None:
     """Checks for plural verbs with typically singular collective nouns (Rule: APS-GPC-Nouns-R-004)."""
-    findings = []
-    collective_nouns = {"government", "committee", "crowd", "team", "family", "group", "staff"}
-    plural_verbs = {"are", "were", "have", "do"}
-    for token in doc:
-        if token.lemma_.lower() in collective_nouns and token.head.lemma_.lower() in plural_verbs:
-            _add_finding(findings, get_line_number_from_offset(token.idx, line_offsets), token.sent.text)
-    return findings
+    if token.lemma_.lower() in _COLLECTIVE_NOUNS and token.head.lemma_.lower() in _PLURAL_VERBS:
+        _add_finding(findings, get_line_number_from_offset(token.idx, line_offsets), sent.text)
 
-def check_hyphenated_modifier(doc: Doc, line_offsets: List[int]) -> List[Dict[str, Any]]:
+@token_check
+def check_hyphenated_modifier(token: Token, sent: Span, line_offsets: List[int], findings: List[Dict[str, Any]]) -> None:
     """Checks for unhyphenated compound modifiers before a noun (Rule: APS-GPC-Adjectives-H-002)."""
-    findings = []
-    for i in range(len(doc) - 2):
-        token1, token2, token3 = doc[i], doc[i+1], doc[i+2]
-        is_potential_compound = (token1.pos_ in ['ADJ', 'ADV']) and (token2.pos_ in ['NOUN', 'ADJ', 'VERB'])
-        is_before_noun = token3.pos_ == 'NOUN'
-        if is_potential_compound and is_before_noun and token2.head == token3 and token1.head == token2:
-             _add_finding(findings, get_line_number_from_offset(token1.idx, line_offsets), f"{token1.text} {token2.text} {token3.text}")
-    return findings
+    doc = token.doc
+    if token.i >= len(doc) - 2:
+        return
+    token1, token2, token3 = token, doc[token.i + 1], doc[token.i + 2]
+    is_potential_compound = (token1.pos_ in ['ADJ', 'ADV']) and (token2.pos_ in ['NOUN', 'ADJ', 'VERB'])
+    is_before_noun = token3.pos_ == 'NOUN'
+    if is_potential_compound and is_before_noun and token2.head == token3 and token1.head == token2:
+        _add_finding(findings, get_line_number_from_offset(token1.idx, line_offsets), f"{token1.text} {token2.text} {token3.text}")
 
-def check_that_vs_which(doc: Doc, line_offsets: List[int]) -> List[Dict[str, Any]]:
+@token_check
+def check_that_vs_which(token: Token, sent: Span, line_offsets: List[int], findings: List[Dict[str, Any]]) -> None:
     """Checks for 'which' without a preceding comma, suggesting it might need to be 'that' for a restrictive clause (Rule: APS-GPC-Pronouns-H-005)."""
-    findings = []
-    for i, token in enumerate(doc):
-        if token.text.lower() == 'which' and i > 0 and doc[i-1].text != ',':
-            if token.dep_ == 'relcl':
-                 _add_finding(findings, get_line_number_from_offset(token.idx, line_offsets), token.sent.text)
-    return findings
+    if token.text.lower() == 'which' and token.i > 0 and token.doc[token.i - 1].text != ',':
+        if token.dep_ == 'relcl':
+            _add_finding(findings, get_line_number_from_offset(token.idx, line_offsets), sent.text)
 
-def check_missing_determiner(doc: Doc, line_offsets: List[int]) -> List[Dict[str, Any]]:
+@token_check
+def check_missing_determiner(token: Token, sent: Span, line_offsets: List[int], findings: List[Dict[str, Any]]) -> None:
     """Checks for singular countable nouns used as subjects that might be missing a determiner (e.g., 'a', 'the') (Rule: APS-GPC-Nouns-H-001)."""
-    findings = []
-    for token in doc:
-        if token.pos_ == 'NOUN' and token.tag_ == 'NN' and 'subj' in token.dep_:
-            children_deps = {child.dep_ for child in token.children}
-            if 'det' not in children_deps and 'poss' not in children_deps:
-                 _add_finding(findings, get_line_number_from_offset(token.idx, line_offsets), token.sent.text)
-    return findings
+    if token.pos_ == 'NOUN' and token.tag_ == 'NN' and 'subj' in token.dep_:
+        children_deps = {child.dep_ for child in token.children}
+        if 'det' not in children_deps and 'poss' not in children_deps:
+            _add_finding(findings, get_line_number_from_offset(token.idx, line_offsets), sent.text)
 
-def check_exclamation_marks(doc: Doc, line_offsets: List[int]) -> List[Dict[str, Any]]:
+@token_check
+def check_exclamation_marks(token: Token, sent: Span, line_offsets: List[int], findings: List[Dict[str, Any]]) -> None:
     """Flags any use of exclamation marks in formal text (Rule: APS-GPC-Exclamationmarks-H-001)."""
-    findings = []
-    for token in doc:
-        if token.text == '!':
-            _add_finding(findings, get_line_number_from_offset(token.idx, line_offsets), token.sent.text)
-    return findings
+    if token.text == '!':
+        _add_finding(findings, get_line_number_from_offset(token.idx, line_offsets), sent.text)
 
-def check_matched_correlatives(doc: Doc, line_offsets: List[int]) -> List[Dict[str, Any]]:
+@sentence_check
+def check_matched_correlatives(sent: Span, line_offsets: List[int], findings: List[Dict[str, Any]]) -> None:
     """Checks for mismatched correlative conjunctions like 'either/nor' or 'neither/or' (Rule: APS-GPC-Conjunctions-H-001)."""
-    findings = []
-    text = doc.text.lower()
-    if ('either' in text and 'nor' in text) or ('neither' in text and 'or' in text):
-        for sent in doc.sents:
-            sent_text = sent.text.lower()
-            if ('either' in sent_text and 'nor' in sent_text) or ('neither' in sent_text and 'or' in sent_text):
-                _add_finding(findings, get_line_number_from_offset(sent.start_char, line_offsets), sent.text)
-    return findings
+    sent_text = sent.text.lower()
+    if ('either' in sent_text and 'nor' in sent_text) or ('neither' in sent_text and 'or' in sent_text):
+        _add_finding(findings, get_line_number_from_offset(sent.start_char, line_offsets), sent.text)
 
-def check_prefer_english_forms(doc: Doc, line_offsets: List[int]) -> List[Dict[str, Any]]:
+@token_check
+def check_prefer_english_forms(token: Token, sent: Span, line_offsets: List[int], findings: List[Dict[str, Any]]) -> None:
     """Flags common Latin abbreviations that should be written in English for clarity (Rule: APS-GPC-Latinshortenedforms-H-001)."""
-    findings = []
-    latin_forms = {'e.g.', 'i.e.', 'etc.'}
-    for token in doc:
-        if token.text.lower() in latin_forms:
-            _add_finding(findings, get_line_number_from_offset(token.idx, line_offsets), token.sent.text)
-    return findings
-    
-def check_unique_grading(doc: Doc, line_offsets: List[int]) -> List[Dict[str, Any]]:
-    """Flags phrases that grade the absolute adjective 'unique', such as 'very unique' (Rule: APS-GPC-Adjectives-R-002)."""
-    findings = []
-    graders = {"very", "more", "most", "less", "least", "extremely", "highly", "quite"}
-    for i, token in enumerate(doc):
-        if token.lemma_.lower() == "unique" and i > 0:
-            if doc[i-1].lemma_.lower() in graders:
-                _add_finding(findings, get_line_number_from_offset(doc[i-1].idx, line_offsets), f"{doc[i-1].text} {token.text}")
-    return findings
+    if token.text.lower() in _LATIN_FORMS:
+        _add_finding(findings, get_line_number_from_offset(token.idx, line_offsets), sent.text)
 
-def check_misplaced_only(doc: Doc, line_offsets: List[int]) -> List[Dict[str, Any]]:
+@token_check
+def check_misplaced_only(token: Token, sent: Span, line_offsets: List[int], findings: List[Dict[str, Any]]) -> None:
     """Flags the word 'only' to prompt a manual review of its placement, as it's often misplaced (Rule: APS-GPC-Typesofwords-H-002)."""
-    findings = []
-    for token in doc:
-        if token.lemma_.lower() == "only":
-            _add_finding(findings, get_line_number_from_offset(token.idx, line_offsets), token.sent.text)
-    return findings
+    if token.lemma_.lower() == "only":
+        _add_finding(findings, get_line_number_from_offset(token.idx, line_offsets), sent.text)
 
-def check_filler_adverbs(doc: Doc, line_offsets: List[int]) -> List[Dict[str, Any]]:
+@token_check
+def check_filler_adverbs(token: Token, sent: Span, line_offsets: List[int], findings: List[Dict[str, Any]]) -> None:
     """Flags common, often unnecessary, adverbs and intensifiers that can be removed for more direct writing (Rule: APS-GPC-Adverbs-H-001)."""
-    findings = []
-    filler_adverbs = {"very", "really", "quite", "extremely", "highly", "absolutely", "totally", "actually", "basically", "literally"}
-    for token in doc:
-        if token.lemma_.lower() in filler_adverbs:
-                _add_finding(findings, get_line_number_from_offset(token.idx, line_offsets), token.sent.text)
-    return findings
-
-def check_modal_verb_to(doc: Doc, line_offsets: List[int]) -> List[Dict[str, Any]]:
-    """Checks for the incorrect use of 'to' immediately following a modal verb (e.g., 'must to go') (Rule: APS-GPC-Verbs-R-007)."""
-    findings = []
-    for i in range(len(doc) - 1):
-        token = doc[i]
-        next_token = doc[i+1]
-        if token.tag_ == 'MD' and next_token.lemma_.lower() == 'to':
-            offending_phrase = f"{token.text} {next_token.text}"
-            _add_finding(findings, get_line_number_from_offset(token.idx, line_offsets), offending_phrase)
-    return findings
+    if token.lemma_.lower() in _FILLER_ADVERBS:
+        _add_finding(findings, get_line_number_from_offset(token.idx, line_offsets), sent.text)
 
-def check_improper_reflexive_pronoun(doc: Doc, line_offsets: List[int]) -> List[Dict[str, Any]]:
+@token_check
+def check_improper_reflexive_pronoun(token: Token, sent: Span, line_offsets: List[int], findings: List[Dict[str, Any]]) -> None:
     """Checks for reflexive pronouns used incorrectly as a subject (e.g., 'Myself and John went...') (Rule: APS-GPC-Pronouns-H-004)."""
-    findings = []
-    for token in doc:
-        is_reflexive = token.text.lower().endswith(('self', 'selves'))
-        if is_reflexive and "subj" in token.dep_:
-            _add_finding(findings, get_line_number_from_offset(token.idx, line_offsets), token.sent.text)
-    return findings
+    is_reflexive = token.text.lower().endswith(('self', 'selves'))
+    if is_reflexive and "subj" in token.dep_:
+        _add_finding(findings, get_line_number_from_offset(token.idx, line_offsets), sent.text)
 
-def check_a_vs_an(doc: Doc, line_offsets: List[int]) -> List[Dict[str, Any]]:
+@token_check
+def check_a_vs_an(token: Token, sent: Span, line_offsets: List[int], findings: List[Dict[str, Any]]) -> None:
     """Checks for incorrect use of 'a' vs 'an' based on the following word's sound (Covers rules APS-GPC-Determiners-R-001 to R-006)."""
-    findings = []
-    vowel_sounds = 'aeiou'
-    u_exceptions = {'university', 'universal', 'unique', 'user', 'unit'}
-    h_exceptions = {'hour', 'honor', 'honour', 'honest', 'heir'}
-    initialism_exceptions = {'f', 'h', 'l', 'm', 'n', 'r', 's', 'x'}
-
-    for i in range(len(doc) - 1):
-        det = doc[i]
-        next_word = doc[i+1]
-        
-        if det.lemma_.lower() not in ['a', 'an']:
-            continue
+    det = token
+    if det.i >= len(det.doc) - 1 or det.lemma_.lower() not in ['a', 'an']:
+        return
+    next_word = det.doc[det.i + 1]
 
-        next_word_lower = next_word.text.lower()
-        starts_with_vowel_sound = False
+    next_word_lower = next_word.text.lower()
+    starts_with_vowel_sound = False
 
-        if next_word.pos_ == 'NOUN' and all(c.isupper() for c in next_word.text if c.isalpha()):
-            if next_word_lower[0] in initialism_exceptions:
-                starts_with_vowel_sound = True
-        elif next_word_lower.startswith('h') and any(next_word_lower.startswith(ex) for ex in h_exceptions):
-             starts_with_vowel_sound = True
-        elif next_word_lower.startswith('u') and any(next_word_lower.startswith(ex) for ex in u_exceptions):
-            starts_with_vowel_sound = False
-        elif next_word_lower[0] in vowel_sounds:
+    if next_word.pos_ == 'NOUN' and all(c.isupper() for c in next_word.text if c.isalpha()):
+        if next_word_lower[0] in _INITIALISM_EXCEPTIONS:
             starts_with_vowel_sound = True
+    elif next_word_lower.startswith('h') and any(next_word_lower.startswith(ex) for ex in _H_EXCEPTIONS):
+        starts_with_vowel_sound = True
+    elif next_word_lower.startswith('u') and any(next_word_lower.startswith(ex) for ex in _U_EXCEPTIONS):
+        starts_with_vowel_sound = False
+    elif next_word_lower[0] in _VOWEL_SOUNDS:
+        starts_with_vowel_sound = True
 
-        if det.lemma_.lower() == 'an' and not starts_with_vowel_sound:
-            _add_finding(findings, get_line_number_from_offset(det.idx, line_offsets), f"{det.text} {next_word.text}")
-        elif det.lemma_.lower() == 'a' and starts_with_vowel_sound:
-            _add_finding(findings, get_line_number_from_offset(det.idx, line_offsets), f"{det.text} {next_word.text}")
-    
-    return findings
+    if det.lemma_.lower() == 'an' and not starts_with_vowel_sound:
+        _add_finding(findings, get_line_number_from_offset(det.idx, line_offsets), f"{det.text} {next_word.text}")
+    elif det.lemma_.lower() == 'a' and starts_with_vowel_sound:
+        _add_finding(findings, get_line_number_from_offset(det.idx, line_offsets), f"{det.text} {next_word.text}")
+
+# --- Declarative Pattern Heuristics ---
+# A heuristic rule can be written as spaCy patterns instead of Python, with these keys on the rule:
+#   "tokenPatterns":      Matcher patterns (lists of token attribute dicts)
+#   "dependencyPatterns": DependencyMatcher patterns
+#   "phrases":            phrases matched case-insensitively with a PhraseMatcher
+#   "report":             "match" (default) to report the matched tokens, or "sentence" for the sentence
+# The patterns of all such rules are compiled into one Matcher, one DependencyMatcher and one PhraseMatcher,
+# which run once per document. A finding is reported on the line of the first matched token.
+PATTERN_KEYS = ("tokenPatterns", "dependencyPatterns", "phrases")
+
+# Patterns for rules that have no patterns of their own in the rulebook.
+BUILTIN_PATTERN_HEURISTICS: Dict[str, Dict[str, Any]] = {
+    # Flags phrases that grade the absolute adjective 'unique', such as 'very unique'.
+    "APS-GPC-Adjectives-R-002": {
+        "tokenPatterns": [[
+            {"LEMMA": {"REGEX": "^(?i:very|more|most|less|least|extremely|highly|quite)$"}},
+            {"LEMMA": {"REGEX": "^(?i:unique)$"}},
+        ]],
+    },
+    # Checks for the incorrect use of 'to' immediately following a modal verb (e.g., 'must to go').
+    "APS-GPC-Verbs-R-007": {
+        "tokenPatterns": [[{"TAG": "MD"}, {"LEMMA": {"REGEX": "^(?i:to)$"}}]],
+    },
+}
+
+# Token attributes that patterns can test, mapped to the annotations they read (see ANNOTATION_COMPONENTS).
+PATTERN_ATTRIBUTE_ANNOTATIONS: Dict[str, Set[str]] = {
+    "LEMMA": {"lemma"}, "POS": {"pos"}, "TAG": {"tag"}, "MORPH": {"pos"}, "DEP": {"dep"},
+    "SENT_START": {"sents"}, "IS_SENT_START": {"sents"}, "ENT_TYPE": {"ents"}, "ENT_IOB": {"ents"},
+    "ENT_ID": {"ents"}, "ENT_KB_ID": {"ents"},
+}
+
+class PatternMatcher:
+    """The compiled patterns of every declarative heuristic rule in a rulebook."""
+
+    def __init__(self) -> None:
+        import spacy
+        from spacy.matcher import DependencyMatcher, Matcher, PhraseMatcher
+        vocab = english_vocab()
+        self.matcher = Matcher(vocab, validate=True)
+        self.dependency_matcher = DependencyMatcher(vocab, validate=True)
+        self.phrase_matcher = PhraseMatcher(vocab, attr="LOWER")
+        self.report_sentence: Dict[int, bool] = {}
+        self._make_doc = spacy.blank("en").make_doc
+
+    def add(self, key: str, spec: Dict[str, Any]) -> Tuple[HeuristicCheck, Set[str]]:
+        """
+        Compiles the patterns of one rule under `key`. Returns the rule's check and the annotations its
+        patterns read; raises ValueError if the patterns are invalid.
+        """
+        annotations: Set[str] = set()
+        try:
+            if spec.get("tokenPatterns"):
+                self.matcher.add(key, spec["tokenPatterns"])
+                for pattern in spec["tokenPatterns"]:
+                    for token_spec in pattern:
+                        annotations |= _pattern_annotations(token_spec)
+            if spec.get("dependencyPatterns"):
+                self.dependency_matcher.add(key, spec["dependencyPatterns"])
+                annotations.add("dep")
+                for pattern in spec["dependencyPatterns"]:
+                    for node in pattern:
+                        annotations |= _pattern_annotations(node.get("RIGHT_ATTRS", {}))
+            if spec.get("phrases"):
+                self.phrase_matcher.add(key, [self._make_doc(phrase) for phrase in spec["phrases"]])
+        except Exception as e:
+            raise ValueError(str(e)) from e
+        report_sentence = spec.get("report", "match") == "sentence"
+        if report_sentence:
+            annotations.add("sents")
+        self.report_sentence[self.matcher.vocab.strings[key]] = report_sentence
+        return PatternCheck(self, key), annotations
+
+    def __call__(self, doc: Doc, line_offsets: List[int]) -> Dict[str, List[Dict[str, Any]]]:
+        """Runs all compiled patterns over the document and returns the findings keyed by rule key."""
+        matches: List[Tuple[int, List[int]]] = [(match_id, list(range(start, end))) for match_id, start, end in self.matcher(doc)]
+        matches.extend((match_id, list(range(start, end))) for match_id, start, end in self.phrase_matcher(doc))
+        if len(self.dependency_matcher) and doc.has_annotation("DEP"):
+            matches.extend((match_id, sorted(token_ids)) for match_id, token_ids in self.dependency_matcher(doc))
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        for match_id, token_ids in sorted(matches, key=lambda match: match[1]):
+            first = doc[token_ids[0]]
+            if self.report_sentence.get(match_id):
+                offending_text = first.sent.text
+            else:
+                offending_text = " ".join(doc[i].text for i in token_ids)
+            findings = results.setdefault(self.matcher.vocab.strings[match_id], FindingList())
+            _add_finding(findings, get_line_number_from_offset(first.idx, line_offsets), offending_text)
+        return results
+
+class PatternCheck:
+    """
+    The check of a rule compiled from patterns. It holds the matcher that produces its findings and its key in it,
+    so a matcher lives only as long as the rules whose checks refer to it.
+    """
+
+    def __init__(self, matcher: PatternMatcher, key: str):
+        self.matcher = matcher
+        self.key = key
+        self.__name__ = self.__qualname__ = f"pattern:{key}"
+
+    def __call__(self, doc: Doc, line_offsets: List[int]) -> List[Dict[str, Any]]:
+        return self.matcher(doc, line_offsets).get(self.key, [])
+
+def _pattern_annotations(token_spec: Dict[str, Any]) -> Set[str]:
+    """Returns the annotations a token pattern reads."""
+    annotations: Set[str] = set()
+    for attribute in token_spec:
+        annotations |= PATTERN_ATTRIBUTE_ANNOTATIONS.get(attribute.upper(), set())
+    return annotations
 
 # --- Master Dictionary of Heuristic Checks ---
-HEURISTIC_CHECKS: Dict[str, Callable[[Doc, List[int]], List[Dict[str, Any]]]] = {
+HEURISTIC_CHECKS: Dict[str, HeuristicCheck] = {
     "APS-GPC-Partsofsentences-H-009": check_passive_voice,
     "APS-GPC-Partsofsentences-H-001": check_complete_sentence,
     "APS-GPC-Nouns-R-004": check_collective_noun_agreement,
@@ -226,10 +553,8 @@ HEURISTIC_CHECKS: Dict[str, Callable[[Doc, List[int]], List[Dict[str, Any]]]] =
     "APS-GPC-Exclamationmarks-H-001": check_exclamation_marks,
     "APS-GPC-Conjunctions-H-001": check_matched_correlatives,
     "APS-GPC-Latinshortenedforms-H-001": check_prefer_english_forms,
-    "APS-GPC-Adjectives-R-002": check_unique_grading,
     "APS-GPC-Typesofwords-H-002": check_misplaced_only,
     "APS-GPC-Adverbs-H-001": check_filler_adverbs,
-    "APS-GPC-Verbs-R-007": check_modal_verb_to,
     "APS-GPC-Pronouns-H-004": check_improper_reflexive_pronoun,
     "APS-GPC-Determiners-R-001": check_a_vs_an,
     "APS-GPC-Determiners-R-002": check_a_vs_an,
@@ -239,141 +564,1617 @@ HEURISTIC_CHECKS: Dict[str, Callable[[Doc, List[int]], List[Dict[str, Any]]]] =
     "APS-GPC-Determiners-R-006": check_a_vs_an,
 }
 
-def load_rules_from_rulebook(file_path: str) -> List[Dict[str, Any]]:
-    """Loads, validates, and compiles linting rules from the specified JSON rulebook."""
-    if not os.path.exists(file_path):
-        logging.error(f"Rulebook file '{file_path}' not found.")
-        return []
+# --- Pipeline Requirements of Heuristic Checks ---
+# The token annotations each check reads, and the pipeline components that produce them in en_core_web_sm.
+# A check missing from HEURISTIC_ANNOTATIONS is assumed to need the full pipeline.
+ANNOTATION_COMPONENTS: Dict[str, Set[str]] = {
+    "tag": {"tok2vec", "tagger"},
+    "pos": {"tok2vec", "tagger", "attribute_ruler"},
+    "lemma": {"tok2vec", "tagger", "attribute_ruler", "lemmatizer"},
+    "dep": {"tok2vec", "parser"},
+    "sents": {"tok2vec", "parser"},
+    "ents": {"tok2vec", "ner"},
+}
+
+HEURISTIC_ANNOTATIONS: Dict[HeuristicCheck, Set[str]] = {
+    check_passive_voice: {"dep", "sents"},
+    check_complete_sentence: {"dep", "sents"},
+    check_collective_noun_agreement: {"lemma", "dep", "sents"},
+    check_hyphenated_modifier: {"pos", "dep"},
+    check_that_vs_which: {"dep", "sents"},
+    check_missing_determiner: {"pos", "tag", "dep", "sents"},
+    check_exclamation_marks: {"sents"},
+    check_matched_correlatives: {"sents"},
+    check_prefer_english_forms: {"sents"},
+    check_misplaced_only: {"lemma", "sents"},
+    check_filler_adverbs: {"lemma", "sents"},
+    check_improper_reflexive_pronoun: {"dep", "sents"},
+    check_a_vs_an: {"lemma", "pos"},
+}
+
+def required_spacy_components(linting_rules: List[Dict[str, Any]]) -> Optional[Set[str]]:
+    """
+    Returns the pipeline components the enabled heuristic rules need: an empty set if there are none
+    (so no parse is required), or None if any of them needs the full pipeline.
+    """
+    components: Set[str] = set()
+    for rule in linting_rules:
+        if rule.get('type') != 'heuristic':
+            continue
+        annotations = rule["annotations"] if "annotations" in rule else HEURISTIC_ANNOTATIONS.get(rule['check'])
+        if annotations is None:
+            return None
+        for annotation in annotations:
+            components |= ANNOTATION_COMPONENTS[annotation]
+    return components
+
+# --- Regex Rule Engine ---
+# Every regex rule is compiled with IGNORECASE, so the literals that a pattern requires are extracted
+# in case-folded form and looked up in a case-folded copy of the text. A rule whose required literals
+# are absent from a file can never match any of its lines and is skipped without running the regex.
+MAX_LITERAL_ALTERNATIVES: int = 64
+_REPEAT_OPS = {sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, getattr(sre_parse, 'POSSESSIVE_REPEAT', None)}
+_ZERO_WIDTH_OPS = {sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT}
+
+LiteralSets = Tuple[Optional[Set[str]], Optional[Set[str]]]
+
+def fold_case(text: str) -> str:
+    """Case-folds text so that every character IGNORECASE would match against an ASCII literal folds to that literal."""
+    return text.replace('İ', 'i').casefold().replace('ı', 'i')
+
+def _fold_literal(code: int) -> Optional[str]:
+    """Returns the folded form of a pattern literal, or None if it is not ASCII and so cannot be prefiltered safely."""
+    char = chr(code)
+    return char.casefold() if char.isascii() else None
+
+def _best_required(candidates: List[Optional[Set[str]]]) -> Optional[Set[str]]:
+    """Picks the candidate literal set whose shortest member is longest, as that filters out the most files."""
+    best, best_score = None, 0
+    for candidate in candidates:
+        if not candidate or "" in candidate:
+            continue
+        score = min(len(literal) for literal in candidate)
+        if score > best_score or (score == best_score and best is not None and len(candidate) < len(best)):
+            best, best_score = candidate, score
+    if best is None:
+        return None
+    # A literal that contains another alternative is redundant for a substring test.
+    return {literal for literal in best if not any(other != literal and other in literal for other in best)}
+
+def _analyse_sequence(subpattern: Any) -> LiteralSets:
+    """
+    Returns (exact, required) literal sets for a parsed pattern sequence. `exact` is the finite set of strings
+    the sequence can match (or None), `required` is a set of which at least one member occurs in every match.
+    """
+    run: Set[str] = {""}
+    broken = False
+    candidates: List[Optional[Set[str]]] = []
+    for op, av in subpattern:
+        exact, required = _analyse_item(op, av)
+        if exact is not None and len(run) * len(exact) <= MAX_LITERAL_ALTERNATIVES:
+            run = {prefix + suffix for prefix in run for suffix in exact}
+            continue
+        broken = True
+        candidates.extend([run, required])
+        run = {""}
+    candidates.append(run)
+    return (None if broken else run), _best_required(candidates)
 
+def _analyse_item(op: Any, av: Any) -> LiteralSets:
+    """Returns (exact, required) literal sets for a single parsed pattern item."""
+    if op == sre_parse.LITERAL:
+        literal = _fold_literal(av)
+        return ({literal}, {literal}) if literal is not None else (None, None)
+    if op == sre_parse.IN:
+        if not all(item_op == sre_parse.LITERAL for item_op, _ in av):
+            return None, None
+        literals = {_fold_literal(code) for _, code in av}
+        if None in literals:
+            return None, None
+        return literals, literals
+    if op == sre_parse.SUBPATTERN:
+        return _analyse_sequence(av[-1])
+    if op == getattr(sre_parse, 'ATOMIC_GROUP', None):
+        return _analyse_sequence(av)
+    if op == sre_parse.BRANCH:
+        results = [_analyse_sequence(alternative) for alternative in av[1]]
+        exacts = [exact for exact, _ in results]
+        requireds = [required for _, required in results]
+        exact = None
+        if all(e is not None for e in exacts):
+            exact = set().union(*exacts)
+            if len(exact) > MAX_LITERAL_ALTERNATIVES:
+                exact = None
+        required = None
+        if all(r is not None for r in requireds):
+            required = set().union(*requireds)
+        return exact, required
+    if op in _REPEAT_OPS:
+        minimum, maximum, item = av
+        exact, required = _analyse_sequence(item)
+        if minimum == 0:
+            return ((exact | {""}) if maximum == 1 and exact is not None else None), None
+        return (exact if minimum == maximum == 1 else None), required
+    if op in _ZERO_WIDTH_OPS:
+        return {""}, None
+    return None, None
+
+def extract_required_literals(pattern: str, flags: int) -> Optional[Set[str]]:
+    """
+    Returns case-folded literals of which at least one must appear in any text the pattern matches,
+    or None if no such literals can be determined.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            rule_sets = json.load(f)
-    except json.JSONDecodeError as e:
-        logging.error(f"Error decoding JSON from rulebook: {e}")
-        return []
+        parsed = sre_parse.parse(pattern, flags)
+    except Exception:
+        return None
+    return _analyse_sequence(parsed)[1]
 
-    all_rules = [rule for rule_set in rule_sets for rule in rule_set.get('rules', [])]
-    
-    transformed_rules = []
+def _regex_finding(file_name: str, line_num: int, rule: Dict[str, Any], offending_text: str) -> Dict[str, Any]:
+    """Builds a report entry for a regex rule that matched a line."""
+    return {
+        "fileName": file_name, "lineNumber": line_num,
+        "ruleId": rule.get('id'), "ruleDescription": rule.get('description'),
+        "severity": rule.get('severity'), "offendingText": offending_text,
+        "githubUrl": build_github_url(file_name, line_num)
+    }
+
+def scan_regex_rules(content: str, lines: List[str], file_name: str, regex_rules: List[Dict[str, Any]],
+                     profile: Optional[LintProfile] = None) -> List[Dict[str, Any]]:
+    """
+    Applies regex rules in a single pass over the file's lines. Rules whose required literals do not occur in the
+    file are dropped up front; the remaining candidates are tried on each line only if their literals occur in it.
+    With a `profile`, each rule's search time, searched lines and findings are added to it.
+    """
+    folded_content = fold_case(content)
+    candidates = [
+        rule for rule in regex_rules
+        if rule.get("compiled_pattern") is not None and (
+            rule.get("required_literals") is None
+            or any(literal in folded_content for literal in rule["required_literals"])
+        )
+    ]
+
+    findings: List[Dict[str, Any]] = []
+    failed_rules: Set[str] = set()
+    timings: Dict[int, List[float]] = {}
+    searches = [rule["compiled_pattern"].search if profile is None else _timed(rule["compiled_pattern"].search, timings, index)
+                for index, rule in enumerate(candidates)]
+    for line_num, line in enumerate(lines, 1):
+        folded_line = fold_case(line)
+        for rule, search in zip(candidates, searches):
+            literals = rule.get("required_literals")
+            if literals is not None and not any(literal in folded_line for literal in literals):
+                continue
+            try:
+                if search(line):
+                    findings.append(_regex_finding(file_name, line_num, rule, line.strip()))
+            except Exception as e:
+                if rule.get('id') not in failed_rules:
+                    failed_rules.add(rule.get('id'))
+                    logging.error(f"Error applying rule '{rule.get('id', 'N/A')}' to {file_name}: {e}")
+
+    if profile is not None:
+        found = Counter(finding['ruleId'] for finding in findings)
+        searched = {id(rule): timings[index] for index, rule in enumerate(candidates)}
+        for rule in regex_rules:
+            seconds, calls = searched.get(id(rule), (0.0, 0))
+            profile.add_rule(file_name, rule.get('id'), seconds, calls, calls, found.pop(rule.get('id'), 0))
+    return findings
+
+# --- Rulebook Loading ---
+# A rulebook is compiled once into an artifact in the cache directory, keyed by a hash of the rulebook and of this
+# script: the rules that are valid and implemented, each regex with its prefilter literals, and the warnings from
+# compiling it. Later runs read the artifact instead of validating the whole rulebook again, select the rules
+# asked for with --rules and --severity, and compile only those. Rulebooks are either a JSON array of rule sets
+# (Trinity.json) or a stream of concatenated rule set objects (Codebook.json).
+COMPILED_RULEBOOK_DIR: str = os.path.join(CACHE_DIR, 'rulebooks')
+COMPILED_RULEBOOK_VERSION: int = 1
+
+def read_rule_sets(file_path: str) -> List[Dict[str, Any]]:
+    """Reads the rule sets of a rulebook, either a JSON array of them or a stream of concatenated JSON objects."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    decoder = json.JSONDecoder()
+    rule_sets: List[Dict[str, Any]] = []
+    index = 0
+    while True:
+        while index < len(text) and text[index].isspace():
+            index += 1
+        if index == len(text):
+            return rule_sets
+        value, index = decoder.raw_decode(text, index)
+        rule_sets.extend(value if isinstance(value, list) else [value])
+
+def compile_rulebook(rule_sets: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Validates the rules of a rulebook and returns its compiled form: a JSON-serialisable spec of every usable rule,
+    with the required literals of each regex precomputed, and the warnings for the rules that were skipped.
+    """
+    specs: List[Dict[str, Any]] = []
+    warnings: List[str] = []
     unimplemented_heuristics = 0
-    for rule in all_rules:
+    pattern_matcher: Optional[PatternMatcher] = None
+    for rule in (rule for rule_set in rule_sets for rule in rule_set.get('rules', [])):
         rule_type = rule.get("category")
         rule_id = rule.get("id")
-
-        new_rule = { "id": rule_id, "description": rule.get("message"), "severity": rule.get("severity"), "type": rule_type }
+        spec = {"id": rule_id, "description": rule.get("message"), "severity": rule.get("severity"), "type": rule_type}
 
         if rule_type == "regex" and "pattern" in rule:
             pattern = rule.get("pattern", "")
+            flags = re.IGNORECASE if not pattern.startswith("(?i)") else 0
             try:
-                flags = re.IGNORECASE if not pattern.startswith("(?i)") else 0
-                new_rule["compiled_pattern"] = re.compile(pattern, flags)
-                transformed_rules.append(new_rule)
+                re.compile(pattern, flags)
             except re.error as e:
-                logging.warning(f"Skipping invalid regex for rule '{rule_id}': {e}")
+                warnings.append(f"Skipping invalid regex for rule '{rule_id}': {e}")
+                continue
+            required_literals = extract_required_literals(pattern, flags)
+            spec.update(pattern=pattern, flags=flags, requiredLiterals=sorted(required_literals) if required_literals is not None else None)
+            specs.append(spec)
 
         elif rule_type == "heuristic":
-            if rule_id in HEURISTIC_CHECKS:
-                new_rule["check"] = HEURISTIC_CHECKS[rule_id]
-                transformed_rules.append(new_rule)
+            pattern_spec = rule if any(key in rule for key in PATTERN_KEYS) else BUILTIN_PATTERN_HEURISTICS.get(rule_id)
+            if pattern_spec is not None:
+                if pattern_matcher is None:
+                    pattern_matcher = PatternMatcher()
+                try:
+                    pattern_matcher.add(f"{rule_id}#{len(specs)}", pattern_spec)
+                except ValueError as e:
+                    warnings.append(f"Skipping invalid patterns for rule '{rule_id}': {e}")
+                    continue
+                spec["patterns"] = {key: pattern_spec[key] for key in PATTERN_KEYS + ("report",) if key in pattern_spec}
+                specs.append(spec)
+            elif rule_id in HEURISTIC_CHECKS:
+                spec["check"] = rule_id
+                specs.append(spec)
             else:
                 unimplemented_heuristics += 1
-    
-    if unimplemented_heuristics > 0:
-        logging.info(f"Skipped {unimplemented_heuristics} heuristic rules that do not have a Python implementation.")
+    return {"rules": specs, "warnings": warnings, "unimplementedHeuristics": unimplemented_heuristics}
+
+def compiled_rulebook_path(file_path: str, artifact_dir: str = COMPILED_RULEBOOK_DIR) -> str:
+    """Returns the path of a rulebook's compiled artifact, keyed by the rulebook's content and this script's source."""
+    digest = hashlib.sha256(str(COMPILED_RULEBOOK_VERSION).encode('utf-8'))
+    for path in (file_path, __file__):
+        with open(path, 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return os.path.join(artifact_dir, f"{os.path.splitext(os.path.basename(file_path))[0]}-{digest.hexdigest()[:16]}.json")
+
+def load_compiled_rulebook(file_path: str, artifact_dir: str = COMPILED_RULEBOOK_DIR) -> Dict[str, Any]:
+    """Returns the compiled form of a rulebook, building and saving it first if it is missing or out of date."""
+    artifact_path = compiled_rulebook_path(file_path, artifact_dir)
+    try:
+        with open(artifact_path, 'r', encoding='utf-8') as f:
+            compiled = json.load(f)
+        if isinstance(compiled, dict) and all(key in compiled for key in ("rules", "warnings", "unimplementedHeuristics")):
+            return compiled
+        logging.warning(f"Ignoring malformed compiled rulebook {artifact_path}.")
+    except (OSError, json.JSONDecodeError):
+        pass
+    compiled = compile_rulebook(read_rule_sets(file_path))
+    os.makedirs(artifact_dir, exist_ok=True)
+    temp_path = f"{artifact_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(compiled, f)
+        os.replace(temp_path, artifact_path)
+        logging.info(f"Compiled {file_path} to {artifact_path}.")
+    except OSError as e:
+        logging.warning(f"Could not save the compiled rulebook {artifact_path}: {e}")
+    return compiled
 
+def select_rules(specs: List[Dict[str, Any]], rule_ids: Optional[List[str]] = None, severities: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Returns the rules whose id matches one of `rule_ids` (shell-style wildcards allowed) and whose severity is one of `severities`."""
+    if rule_ids:
+        specs = [spec for spec in specs if any(fnmatch.fnmatchcase(spec.get('id') or '', rule_id) for rule_id in rule_ids)]
+    if severities:
+        specs = [spec for spec in specs if spec.get('severity') in severities]
+    return specs
+
+def load_rules_from_rulebook(file_path: str, rule_ids: Optional[List[str]] = None, severities: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Loads the compiled form of the specified rulebook and compiles the selected linting rules."""
+    if not os.path.exists(file_path):
+        logging.error(f"Rulebook file '{file_path}' not found.")
+        return []
+
+    try:
+        compiled = load_compiled_rulebook(file_path)
+    except json.JSONDecodeError as e:
+        logging.error(f"Error decoding JSON from rulebook: {e}")
+        return []
+
+    for warning in compiled["warnings"]:
+        logging.warning(warning)
+    if compiled["unimplementedHeuristics"] > 0:
+        logging.info(f"Skipped {compiled['unimplementedHeuristics']} heuristic rules that have neither patterns nor a Python implementation.")
+    specs = select_rules(compiled["rules"], rule_ids, severities)
+    if rule_ids or severities:
+        logging.info(f"Selected {len(specs)} of {len(compiled['rules'])} rules.")
+
+    transformed_rules = []
+    pattern_matcher: Optional[PatternMatcher] = None
+    for spec in specs:
+        new_rule = {key: spec[key] for key in ("id", "description", "severity", "type")}
+        if "pattern" in spec:
+            new_rule["compiled_pattern"] = re.compile(spec["pattern"], spec["flags"])
+            new_rule["required_literals"] = set(spec["requiredLiterals"]) if spec["requiredLiterals"] is not None else None
+        elif "patterns" in spec:
+            if pattern_matcher is None:
+                pattern_matcher = PatternMatcher()
+            new_rule["check"], new_rule["annotations"] = pattern_matcher.add(f"{spec['id']}#{len(transformed_rules)}", spec["patterns"])
+            new_rule["patterns"] = spec["patterns"]
+        else:
+            new_rule["check"] = HEURISTIC_CHECKS[spec["check"]]
+        transformed_rules.append(new_rule)
     return transformed_rules
 
-def build_github_url(file_name: str, line_number: int) -> str:
-    """Constructs a permalink to a specific line in a file on GitHub if CI environment variables are present."""
+@functools.lru_cache(maxsize=None)
+def _github_blob_url() -> Optional[str]:
+    """The URL of the scraped directory at the commit being audited, or None outside CI. Read once per process."""
     server_url = os.getenv("GITHUB_SERVER_URL")
     repository = os.getenv("GITHUB_REPOSITORY")
     sha = os.getenv("GITHUB_SHA")
 
     if not all([server_url, repository, sha]):
-        return f"local://{file_name}#L{line_number}"
+        return None
 
     # Updated to use the correct directory in the URL path
-    return f"{server_url}/{repository}/blob/{sha}/{MARKDOWN_DIR}/{file_name}#L{line_number}"
+    return f"{server_url}/{repository}/blob/{sha}/{MARKDOWN_DIR}"
 
-def lint_file(file_path: str, file_name: str, linting_rules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Applies all defined linting rules to a single file."""
-    findings: List[Dict[str, Any]] = []
+def build_github_url(file_name: str, line_number: int) -> str:
+    """Constructs a permalink to a specific line in a file on GitHub if CI environment variables are present."""
+    blob_url = _github_blob_url()
+    if blob_url is None:
+        return f"local://{file_name}#L{line_number}"
+    return f"{blob_url}/{file_name}#L{line_number}"
+
+# --- Lint Cache ---
+# Parsed Docs are keyed by a hash of the file content plus the model fingerprint (spaCy and model versions
+# and the loaded components); findings are additionally keyed by the rules fingerprint, which covers the
+# enabled rules and the source of this script. Findings are stored without fileName and githubUrl, which
+# are filled in again on a hit, so renamed files and new commits still reuse them. For incremental linting, the
+# last linted content, findings and sentence-starting lines of each file are kept as a snapshot under its name,
+# and for shared segments, the findings of every segment of text under a hash of the segment (see Repeated Text).
+CACHE_FORMAT_VERSION: int = 2
+
+class LintCache:
+    """Size-bounded, content-addressed on-disk cache of serialized Docs and per-file findings."""
+
+    # The directories the entries are stored in. Anything else under cache_dir, such as the compiled rulebooks
+    # in its rulebooks/ directory, is not an entry: it is neither counted, evicted nor cleared.
+    KINDS: Tuple[str, ...] = ('findings', 'docs', 'snapshots', 'segments', 'segment-starts')
+
+    def __init__(self, cache_dir: str, max_bytes: int, rules_fingerprint: str, model_fingerprint: str):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.rules_fingerprint = rules_fingerprint
+        self.model_fingerprint = model_fingerprint
+        self.hits = 0
+        self.misses = 0
+        self.segment_hits = 0
+        self.segment_misses = 0
+
+    @staticmethod
+    def hash_content(content: str) -> str:
+        """Returns the content hash that cache entries are addressed by."""
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def hash_file(file_path: str) -> str:
+        """Returns `hash_content` of a Markdown file's content, reading it a line at a time."""
+        digest = hashlib.sha256()
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                digest.update(line.encode('utf-8'))
+        return digest.hexdigest()
+
+    def counters(self) -> Tuple[int, int, int, int]:
+        """Returns the (hits, misses, segment_hits, segment_misses) counted so far."""
+        return self.hits, self.misses, self.segment_hits, self.segment_misses
+
+    def add_counters(self, counters: Tuple[int, int, int, int]) -> None:
+        """Adds hits and misses counted elsewhere, such as by a worker process's cache, to this cache's counters."""
+        self.hits += counters[0]
+        self.misses += counters[1]
+        self.segment_hits += counters[2]
+        self.segment_misses += counters[3]
+
+    def _path(self, kind: str, content_hash: str, *fingerprints: str) -> str:
+        key = hashlib.sha256("\0".join((str(CACHE_FORMAT_VERSION), content_hash) + fingerprints).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, kind, key[:2], key)
+
+    def _read(self, path: str) -> Optional[bytes]:
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        os.utime(path)  # Marks the entry as recently used for eviction.
+        return data
+
+    def _write(self, path: str, data: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logging.warning(f"Could not write cache entry {path}: {e}")
+
+    def get_findings(self, content_hash: str, file_name: str) -> Optional[List[Dict[str, Any]]]:
+        """Returns the cached findings for content, re-anchored to `file_name`, or None on a miss."""
+        data = self._read(self._path('findings', content_hash, self.rules_fingerprint, self.model_fingerprint))
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._to_findings(json.loads(data), file_name)
+
+    def put_findings(self, content_hash: str, findings: List[Dict[str, Any]]) -> None:
+        """Stores the findings for content."""
+        self._write(self._path('findings', content_hash, self.rules_fingerprint, self.model_fingerprint),
+                    json.dumps(self._to_entries(findings)).encode('utf-8'))
+
+    @staticmethod
+    def _to_entries(findings: List[Dict[str, Any]], first_line: int = 1) -> List[List[Any]]:
+        """Converts findings to stored entries, numbering lines from `first_line`."""
+        return [[f['lineNumber'] - first_line + 1, f['ruleId'], f['ruleDescription'], f['severity'], f['offendingText']] for f in findings]
+
+    @staticmethod
+    def _to_findings(entries: List[List[Any]], file_name: str, first_line: int = 1) -> List[Dict[str, Any]]:
+        """Converts stored entries back to findings in `file_name`, starting at line `first_line`."""
+        findings = []
+        for line_number, rule_id, description, severity, offending_text in entries:
+            line_number += first_line - 1
+            findings.append({
+                "fileName": file_name, "lineNumber": line_number,
+                "ruleId": rule_id, "ruleDescription": description,
+                "severity": severity, "offendingText": offending_text,
+                "githubUrl": build_github_url(file_name, line_number)
+            })
+        return findings
+
+    def get_doc(self, content_hash: str) -> Optional[Doc]:
+        """Returns the cached parse of content, or None on a miss."""
+        data = self._read(self._path('docs', content_hash, self.model_fingerprint))
+        if data is None:
+            return None
+        from spacy.tokens import DocBin
+        try:
+            return next(DocBin().from_bytes(data).get_docs(english_vocab()))
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable cached Doc: {e}")
+            return None
+
+    def put_doc(self, content_hash: str, doc: Doc) -> None:
+        """Stores the parse of content."""
+        from spacy.tokens import DocBin
+        self._write(self._path('docs', content_hash, self.model_fingerprint), DocBin(docs=[doc]).to_bytes())
+
+    def get_snapshot(self, file_name: str) -> Optional[Tuple[str, List[Dict[str, Any]], Optional[List[int]]]]:
+        """
+        Returns the content, findings and sentence-starting lines of the last version of `file_name` linted with
+        these rules, or None.
+        """
+        data = self._read(self._path('snapshots', file_name, self.rules_fingerprint, self.model_fingerprint))
+        if data is None:
+            return None
+        content, entries, sentence_lines = json.loads(data)
+        return content, self._to_findings(entries, file_name), sentence_lines
+
+    def put_snapshot(self, file_name: str, content: str, findings: List[Dict[str, Any]], sentence_lines: Optional[List[int]]) -> None:
+        """Stores the content, findings and sentence-starting lines of the version of `file_name` just linted."""
+        self._write(self._path('snapshots', file_name, self.rules_fingerprint, self.model_fingerprint),
+                    json.dumps([content, self._to_entries(findings), sentence_lines]).encode('utf-8'))
+
+    def get_segment_lengths(self, paragraph_hash: str) -> List[int]:
+        """Returns the line counts of the cached segments that begin with the paragraph."""
+        data = self._read(self._path('segment-starts', paragraph_hash, self.rules_fingerprint, self.model_fingerprint))
+        return json.loads(data) if data is not None else []
+
+    def get_segment(self, segment_hash: str, file_name: str, first_line: int) -> Optional[Tuple[List[Dict[str, Any]], Optional[List[int]]]]:
+        """
+        Returns the cached findings and sentence-starting lines of a segment, re-anchored to `file_name` with the
+        segment starting at `first_line`, or None on a miss.
+        """
+        data = self._read(self._path('segments', segment_hash, self.rules_fingerprint, self.model_fingerprint))
+        if data is None:
+            return None
+        entries, sentence_lines = json.loads(data)
+        if sentence_lines is not None:
+            sentence_lines = [line + first_line - 1 for line in sentence_lines]
+        return self._to_findings(entries, file_name, first_line), sentence_lines
+
+    def put_segment(self, segment_hash: str, paragraph_hash: str, line_count: int, findings: List[Dict[str, Any]],
+                    sentence_lines: Optional[List[int]], first_line: int) -> None:
+        """Stores the findings and sentence-starting lines of a segment that starts at `first_line` and begins with the paragraph."""
+        if sentence_lines is not None:
+            sentence_lines = [line - first_line + 1 for line in sentence_lines]
+        self._write(self._path('segments', segment_hash, self.rules_fingerprint, self.model_fingerprint),
+                    json.dumps([self._to_entries(findings, first_line), sentence_lines]).encode('utf-8'))
+        lengths = self.get_segment_lengths(paragraph_hash)
+        if line_count not in lengths:
+            self._write(self._path('segment-starts', paragraph_hash, self.rules_fingerprint, self.model_fingerprint),
+                        json.dumps(sorted(lengths + [line_count], reverse=True)).encode('utf-8'))
+
+    def evict(self) -> None:
+        """Removes the least recently used entries until the cache is within its size bound."""
+        entries = []
+        for kind in self.KINDS:
+            for root, _, names in os.walk(os.path.join(self.cache_dir, kind)):
+                for name in names:
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        logging.info(f"Evicted {removed} cache entries from {self.cache_dir}.")
+
+    def clear(self) -> None:
+        """Invalidates the cache by deleting every entry."""
+        for kind in self.KINDS:
+            shutil.rmtree(os.path.join(self.cache_dir, kind), ignore_errors=True)
+        logging.info(f"Cleared lint cache at {self.cache_dir}.")
+
+def rules_fingerprint(linting_rules: List[Dict[str, Any]]) -> str:
+    """Fingerprints the enabled rules and the linter source, so that editing either invalidates cached findings."""
+    digest = hashlib.sha256()
+    with open(__file__, 'rb') as f:
+        digest.update(f.read())
+    for rule in linting_rules:
+        pattern = rule["compiled_pattern"].pattern if rule.get("compiled_pattern") is not None else ""
+        check = rule["check"].__name__ if rule.get("check") is not None else ""
+        digest.update(json.dumps([rule.get('id'), rule.get('type'), rule.get('description'), rule.get('severity'), pattern, check,
+                                  rule.get('patterns')], sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+def model_fingerprint(components: Optional[Set[str]]) -> str:
+    """Fingerprints the spaCy installation and pipeline components whose output cached Docs hold."""
+    if components is not None and not components:
+        return "no-parse"
+    import spacy
+    component_names = ",".join(sorted(components)) if components is not None else "all"
+    model_version = spacy.util.get_package_version(SPACY_MODEL) or "unknown"
+    return f"spacy-{spacy.__version__}/{SPACY_MODEL}-{model_version}/{component_names}"
+
+def create_lint_cache(linting_rules: List[Dict[str, Any]], cache_dir: str = CACHE_DIR, max_mb: int = CACHE_MAX_MB) -> LintCache:
+    """Creates the cache for a run with the given rules."""
+    return LintCache(cache_dir, max_mb * 1024 * 1024, rules_fingerprint(linting_rules),
+                     model_fingerprint(required_spacy_components(linting_rules)))
+
+def _read_markdown(file_path: str) -> Optional[str]:
+    """Reads a Markdown file, logging and returning None if it does not exist."""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+            return f.read()
     except FileNotFoundError:
         logging.error(f"Could not find file {file_path}")
-        return []
+        return None
 
-    lines = content.splitlines()
+# --- Markdown Prose Extraction ---
+# Heuristic checks only need the prose of a page, so the parser is given Markdown with its markup removed:
+# link and image targets, bare URLs, inline code, HTML tags, emphasis, heading, list and quote markers, and table
+# pipes and separator rows. Block markup is removed line by line, but inline markup on the whole content, since
+# a link's text may span several lines (and paragraphs). Line breaks are kept, including those inside dropped
+# markup, so the offset at which each source line starts in the prose serves as the line offsets that map the
+# parsed Doc back to source line numbers.
+_BLOCK_PREFIX = re.compile(r'^(?:(?:\s{0,3}#{1,6}(?=\s|$)|\s*>|\s*(?:[*+-]|\d{1,9}[.)])(?=\s))\s*)+')
+_TABLE_SEPARATOR = re.compile(r'^\s*\|?\s*:?-{3,}:?\s*(?:\|\s*:?-{3,}:?\s*)*\|?\s*$')
+_INLINE_MARKUP = re.compile(r"""
+    \\(?P<escaped>[\\`*_{}\[\]()#+\-.!|>~])            # escaped punctuation: kept as the character
+  | !\[[^\]]*\]\([^)]*\)                                # image: dropped
+  | \[(?P<link>[^\]]*)\]\([^)\s]*(?:\s+"[^"]*")?\)      # link: kept as its text
+  | <https?://[^>]*> | https?://[^\s<>]*[^\s<>.,;:!?)\]'"]  # URL: dropped
+  | <[^>\s][^>]*>                                         # HTML tag: dropped
+  | `[^`\n]*`                                             # inline code: dropped
+  | \*+ | (?<!\w)_+ | _+(?!\w)                            # emphasis: dropped
+  | (?P<pipe>\|)                                          # table cell boundary: a space
+""", re.VERBOSE)
+
+def _inline_prose(text: str) -> str:
+    def replace(match: re.Match) -> str:
+        if match.group('escaped') is not None:
+            return match.group('escaped')
+        if match.group('link') is not None:
+            return _inline_prose(match.group('link'))
+        return ' ' if match.group('pipe') else '\n' * match.group().count('\n')
+    return _INLINE_MARKUP.sub(replace, text)
+
+def extract_prose(content: str) -> Tuple[str, List[int]]:
+    """
+    Returns the prose of Markdown content, and the offset in it at which each source line starts (with the
+    prose length + 1 last), for `get_line_number_from_offset` to map prose offsets to source line numbers.
+    """
+    source_lines = content.splitlines()
+    block_text = '\n'.join(
+        '' if _TABLE_SEPARATOR.match(line) else _BLOCK_PREFIX.sub('', line, count=1) for line in source_lines
+    )
+    prose_lines = [' '.join(line.split()) for line in _inline_prose(block_text).split('\n')] if source_lines else []
     line_offsets = [0]
-    for line in lines:
+    for line in prose_lines:
         line_offsets.append(line_offsets[-1] + len(line) + 1)
+    return '\n'.join(prose_lines), line_offsets
+
+def lint_content(content: str, file_name: str, linting_rules: List[Dict[str, Any]], doc: Optional[Doc] = None,
+                 profile: Optional[LintProfile] = None) -> List[Dict[str, Any]]:
+    """
+    Applies all defined linting rules to the content of a single file. `doc` is the parsed prose of the content
+    (see `extract_prose`), or the parsed content itself, and is only required when heuristic rules are enabled.
+    With a `profile`, every rule's measurements on the file are added to it.
+    """
+    findings: List[Dict[str, Any]] = []
+    lines = content.splitlines()
 
-    doc = nlp(content)
     reported_findings = set()
 
-    for rule in linting_rules:
-        try:
-            if rule.get('type') == 'regex':
-                compiled_pattern = rule.get("compiled_pattern")
-                if not compiled_pattern: continue
-                for line_num, line in enumerate(lines, 1):
-                    if compiled_pattern.search(line):
-                        finding_tuple = (file_name, line_num, rule.get('id'), line.strip())
-                        if finding_tuple not in reported_findings:
-                            findings.append({
-                                "fileName": file_name, "lineNumber": line_num,
-                                "ruleId": rule.get('id'), "ruleDescription": rule.get('description'),
-                                "severity": rule.get('severity'), "offendingText": line.strip(),
-                                "githubUrl": build_github_url(file_name, line_num)
-                            })
-                            reported_findings.add(finding_tuple)
-
-            elif rule.get('type') == 'heuristic':
-                heuristic_findings = rule['check'](doc, line_offsets)
-                for h_finding in heuristic_findings:
-                    finding_tuple = (file_name, h_finding['line_number'], rule.get('id'), h_finding['offending_text'])
-                    if finding_tuple not in reported_findings:
-                        findings.append({
-                            "fileName": file_name, "lineNumber": h_finding['line_number'],
-                            "ruleId": rule.get('id'), "ruleDescription": rule.get('description'),
-                            "severity": rule.get('severity'), "offendingText": h_finding['offending_text'],
-                            "githubUrl": build_github_url(file_name, h_finding['line_number'])
-                        })
-                        reported_findings.add(finding_tuple)
-        except Exception as e:
-            logging.error(f"Error applying rule '{rule.get('id', 'N/A')}' to {file_name}: {e}")
+    regex_rules = [rule for rule in linting_rules if rule.get('type') == 'regex']
+    regex_findings = scan_regex_rules(content, lines, file_name, regex_rules, profile)
+
+    for finding in regex_findings:
+        finding_tuple = (file_name, finding['lineNumber'], finding['ruleId'], finding['offendingText'])
+        if finding_tuple not in reported_findings:
+            findings.append(finding)
+            reported_findings.add(finding_tuple)
+
+    if doc is None:
+        return findings
+
+    if doc.text == content:
+        line_offsets = [0]
+        for line in lines:
+            line_offsets.append(line_offsets[-1] + len(line) + 1)
+    else:
+        line_offsets = extract_prose(content)[1]
+
+    # Rules that share a check (such as the six determiner rules) run it once and each report its findings.
+    heuristic_rules = [rule for rule in linting_rules if rule.get('type') == 'heuristic']
+    timings: Optional[Dict[HeuristicCheck, List[float]]] = {} if profile is not None else None
+    check_results, check_errors = run_heuristic_checks(doc, line_offsets, [rule['check'] for rule in heuristic_rules], timings)
+    rules_per_check = Counter(rule['check'] for rule in heuristic_rules)
+    for rule in heuristic_rules:
+        if profile is not None:
+            seconds, calls = timings.get(rule['check'], (0.0, 0))
+            found = len(check_results.get(rule['check'], []))
+            profile.add_rule(file_name, rule.get('id'), seconds / rules_per_check[rule['check']], calls, len(lines), found)
+        if rule['check'] in check_errors:
+            logging.error(f"Error applying rule '{rule.get('id', 'N/A')}' to {file_name}: {check_errors[rule['check']]}")
+            continue
+        for h_finding in check_results[rule['check']]:
+            finding_tuple = (file_name, h_finding['line_number'], rule.get('id'), h_finding['offending_text'])
+            if finding_tuple not in reported_findings:
+                findings.append({
+                    "fileName": file_name, "lineNumber": h_finding['line_number'],
+                    "ruleId": rule.get('id'), "ruleDescription": rule.get('description'),
+                    "severity": rule.get('severity'), "offendingText": h_finding['offending_text'],
+                    "githubUrl": build_github_url(file_name, h_finding['line_number'])
+                })
+                reported_findings.add(finding_tuple)
+
+    return findings
+
+def _has_heuristics(linting_rules: List[Dict[str, Any]]) -> bool:
+    """Returns True if any heuristic rule is enabled, i.e. the files have to be parsed."""
+    return any(rule.get('type') == 'heuristic' for rule in linting_rules)
+
+def _lint_and_cache(content: str, file_name: str, linting_rules: List[Dict[str, Any]], doc: Optional[Doc], cache: Optional[LintCache], content_hash: Optional[str],
+                    profile: Optional[LintProfile] = None, snapshot: bool = False, segments: bool = False) -> List[Dict[str, Any]]:
+    """
+    Lints content and stores the findings in the cache, if one is in use, with `snapshot` as the file's snapshot
+    and with `segments` as cached segments.
+    """
+    findings = lint_content(content, file_name, linting_rules, doc, profile)
+    if cache is not None:
+        cache.put_findings(content_hash, findings)
+        if snapshot or segments:
+            _remember_lint(cache, file_name, content, findings, _sentence_lines(content, doc), snapshot, segments)
+    return findings
+
+def lint_file(file_path: str, file_name: str, linting_rules: List[Dict[str, Any]], cache: Optional[LintCache] = None,
+              chunk_chars: int = CHUNK_CHARS) -> List[Dict[str, Any]]:
+    """
+    Applies all defined linting rules to a single file, reusing cached findings or a cached parse if available.
+    A file larger than `chunk_chars` (0 for no limit) is linted in chunks.
+    """
+    if _needs_chunking(file_path, chunk_chars):
+        return _lint_large_file(file_path, file_name, linting_rules, chunk_chars, cache)
+    content = _read_markdown(file_path)
+    if content is None:
+        return []
+    content_hash = LintCache.hash_content(content) if cache is not None else None
+    if cache is not None:
+        cached_findings = cache.get_findings(content_hash, file_name)
+        if cached_findings is not None:
+            return cached_findings
+    doc = None
+    if _has_heuristics(linting_rules):
+        doc = cache.get_doc(content_hash) if cache is not None else None
+        if doc is None:
+            doc = load_spacy_model(required_spacy_components(linting_rules))(extract_prose(content)[0])
+            if cache is not None:
+                cache.put_doc(content_hash, doc)
+    return _lint_and_cache(content, file_name, linting_rules, doc, cache, content_hash)
+
+def _parse_timed(model: Language, texts: Iterable[Tuple[str, Tuple[str, Any]]], profile: LintProfile) -> Iterator[Tuple[Doc, Tuple[str, Any]]]:
+    """Parses (text, (file_name, ...)) pairs one at a time, adding each parse time to its file in the profile."""
+    for content, context in texts:
+        start = time.perf_counter()
+        doc = model(content)
+        profile.add_parse(context[0], time.perf_counter() - start)
+        yield doc, context
+
+def lint_files(files: List[Tuple[str, str]], linting_rules: List[Dict[str, Any]], batch_size: int = DEFAULT_BATCH_SIZE, cache: Optional[LintCache] = None,
+               profile: Optional[LintProfile] = None, chunk_chars: int = CHUNK_CHARS, incremental: bool = False,
+               segments: bool = False) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    Lints (file_path, file_name) pairs and yields (file_name, findings) for each readable file.
+    Files are taken in windows of `batch_size`: cached findings and cached parses are used where available,
+    and the remaining contents are streamed through `nlp.pipe` together. If no heuristic rule is enabled,
+    the files are never parsed. With a `profile`, the cache is not used and files are parsed one at a time,
+    so every file is linted and parsed on its own clock. Files larger than `chunk_chars` (0 for no limit)
+    are linted in chunks. With `incremental` (and a cache), a file that changed since it was last linted is
+    only re-linted around the changes; with `segments`, text already linted in other files is not linted again.
+    """
+    if profile is not None:
+        cache = None
+    incremental = incremental and cache is not None
+    segments = segments and cache is not None
+    needs_parse = _has_heuristics(linting_rules)
+    remaining = list(files)
+    while remaining:
+        window, remaining = remaining[:max(batch_size, 1)], remaining[max(batch_size, 1):]
+        to_parse: List[Tuple[str, Tuple[str, Optional[str], str]]] = []
+        held_back: List[Tuple[str, str]] = []
+        queued_paragraphs: Set[str] = set()
+        for file_path, file_name in window:
+            if _needs_chunking(file_path, chunk_chars):
+                logging.info(f"Linting {file_path} in chunks...")
+                yield file_name, _lint_large_file(file_path, file_name, linting_rules, chunk_chars, cache, profile)
+                continue
+            content = _read_markdown(file_path)
+            if content is None:
+                continue
+            content_hash = LintCache.hash_content(content) if cache is not None else None
+            if cache is not None:
+                cached_findings = cache.get_findings(content_hash, file_name)
+                if cached_findings is not None:
+                    logging.info(f"Using cached findings for {file_path}.")
+                    yield file_name, cached_findings
+                    continue
+            if incremental or segments:
+                findings = _lint_known_text(content, file_name, linting_rules, cache, content_hash, incremental, segments)
+                if findings is not None:
+                    yield file_name, findings
+                    continue
+            doc = cache.get_doc(content_hash) if cache is not None and needs_parse else None
+            if needs_parse and doc is None:
+                if segments:
+                    hashes = paragraph_hashes(content.splitlines())
+                    if queued_paragraphs and len(hashes & queued_paragraphs) >= SEGMENT_MIN_SHARE * len(hashes):
+                        held_back.append((file_path, file_name))
+                        continue
+                    queued_paragraphs |= hashes
+                to_parse.append((extract_prose(content)[0], (file_name, content_hash, content)))
+                continue
+            logging.info(f"Linting {file_path}...")
+            yield file_name, _lint_and_cache(content, file_name, linting_rules, doc, cache, content_hash, profile, incremental, segments)
+
+        remaining = held_back + remaining
+        if not to_parse:
+            continue
+        model = load_spacy_model(required_spacy_components(linting_rules))
+        if profile is None:
+            parsed = model.pipe(to_parse, batch_size=batch_size, as_tuples=True)
+        else:
+            parsed = _parse_timed(model, to_parse, profile)
+        for doc, (file_name, content_hash, content) in parsed:
+            logging.info(f"Linting {os.path.join(MARKDOWN_DIR, file_name)}...")
+            if cache is not None:
+                cache.put_doc(content_hash, doc)
+            yield file_name, _lint_and_cache(content, file_name, linting_rules, doc, cache, content_hash, profile, incremental, segments)
+
+# --- Chunked Linting ---
+# A file larger than the chunk size is read a line at a time and split at paragraph or heading boundaries.
+# Each chunk is parsed and checked as a document of its own, and the line numbers of its findings (found with
+# `get_line_number_from_offset` against the chunk's own line offsets) are shifted by the lines before it, so
+# memory is bounded by the chunk size rather than the file size. A sentence can run across paragraphs (a list
+# introduced by a colon, say), so with heuristic rules only the text before the chunk's last sentence that begins
+# a line is reported; the rest is carried over and parsed again with the next chunk. A chunk in which no sentence
+# begins a line is carried over whole, however long, so the findings stay those of the whole file; a chunk that
+# grows past CHUNK_CARRY_LIMIT chunk sizes this way is logged, as memory is then bounded by the sentence instead.
+_HEADING_LINE = re.compile(r'#{1,6}\s')
+CHUNK_CARRY_LIMIT: int = 4  # Chunk sizes a carried-over sentence may reach before a warning is logged
+
+def iter_markdown_chunks(lines: Iterable[str], chunk_chars: int) -> Iterator[str]:
+    """
+    Groups lines (with their line endings) into chunks of at least `chunk_chars` characters, each ending after
+    the blank lines that close a paragraph or before a heading. A chunk with no such boundary by twice
+    `chunk_chars` ends at any line.
+    """
+    chunk: List[str] = []
+    size = 0
+    for line in lines:
+        if size >= chunk_chars and line.strip() and (not chunk[-1].strip() or _HEADING_LINE.match(line) or size >= 2 * chunk_chars):
+            yield ''.join(chunk)
+            chunk, size = [], 0
+        chunk.append(line)
+        size += len(line)
+    if chunk:
+        yield ''.join(chunk)
 
+def _last_line_sentence_start(doc: Doc) -> Optional[int]:
+    """
+    Returns the offset of the document's last sentence that starts a line (other than the first), 0 if none does,
+    or None if the document has no sentence boundaries.
+    """
+    if not doc.has_annotation("SENT_START"):
+        return None
+    for sent in reversed(list(doc.sents)):
+        if sent.start_char > 0 and doc.text[sent.start_char - 1] == '\n':
+            return sent.start_char
+    return 0
+
+def _needs_chunking(file_path: str, chunk_chars: int) -> bool:
+    """Returns True if a file has more than `chunk_chars` characters, too many to be linted as one document."""
+    if chunk_chars <= 0:
+        return False
+    try:
+        if os.path.getsize(file_path) <= chunk_chars:
+            return False  # Every character takes at least one byte.
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return len(f.read(chunk_chars + 1)) > chunk_chars
+    except (OSError, UnicodeDecodeError):
+        return False
+
+def _lint_large_file(file_path: str, file_name: str, linting_rules: List[Dict[str, Any]], chunk_chars: int,
+                     cache: Optional[LintCache], profile: Optional[LintProfile] = None) -> List[Dict[str, Any]]:
+    """Lints a file in chunks, reusing and storing its findings in the cache (under its hash and chunk size) if one is in use."""
+    content_hash = f"{LintCache.hash_file(file_path)}:chunks={chunk_chars}" if cache is not None else None
+    if cache is not None:
+        cached_findings = cache.get_findings(content_hash, file_name)
+        if cached_findings is not None:
+            return cached_findings
+    findings = lint_file_chunked(file_path, file_name, linting_rules, chunk_chars, profile)
+    if cache is not None:
+        cache.put_findings(content_hash, findings)
+    return findings
+
+def lint_file_chunked(file_path: str, file_name: str, linting_rules: List[Dict[str, Any]], chunk_chars: int = CHUNK_CHARS,
+                      profile: Optional[LintProfile] = None) -> List[Dict[str, Any]]:
+    """Lints a file chunk by chunk and returns findings numbered by file line."""
+    model = load_spacy_model(required_spacy_components(linting_rules)) if _has_heuristics(linting_rules) else None
+    findings: List[Dict[str, Any]] = []
+    lines_before = 0
+    carry = ''
+    warned = False
+    with open(file_path, 'r', encoding='utf-8') as f:
+        pieces = iter_markdown_chunks(f, chunk_chars)
+        piece = next(pieces, None)
+        while piece is not None:
+            next_piece = next(pieces, None)
+            chunk = carry + piece
+            doc = None
+            kept_lines = None
+            if model is not None:
+                prose, prose_line_offsets = extract_prose(chunk)
+                start = time.perf_counter()
+                doc = model(prose)
+                if profile is not None:
+                    profile.add_parse(file_name, time.perf_counter() - start)
+                sentence_start = _last_line_sentence_start(doc) if next_piece is not None else None
+                if sentence_start == 0:
+                    if not warned and len(chunk) >= CHUNK_CARRY_LIMIT * chunk_chars:
+                        logging.warning(f"{file_name}: no sentence begins a line in {len(chunk)} characters from line {lines_before + 1}; "
+                                        f"carrying them over until one does. Consider a larger --chunk-chars.")
+                        warned = True
+                    carry, piece = chunk, next_piece
+                    continue
+                if sentence_start:
+                    kept_lines = bisect.bisect_left(prose_line_offsets, sentence_start)
+            source_lines = chunk.splitlines(keepends=True)
+            if kept_lines is None:
+                kept_lines = len(source_lines)
+            cut = sum(len(line) for line in source_lines[:kept_lines])
+            for finding in lint_content(chunk, file_name, linting_rules, doc, profile):
+                if finding['lineNumber'] <= kept_lines:
+                    finding['lineNumber'] += lines_before
+                    finding['githubUrl'] = build_github_url(file_name, finding['lineNumber'])
+                    findings.append(finding)
+            lines_before += kept_lines
+            carry, piece = chunk[cut:], next_piece
+    return findings
+
+# --- Incremental Linting ---
+# With --incremental, a file whose findings are not cached is diffed line by line against its snapshot: the
+# content, findings and sentence-starting lines of the version last linted with the same rules. Only the
+# paragraphs around each change are linted again, and the snapshot's findings elsewhere are carried over to their
+# lines in the new version. Heuristic findings depend on whole sentences, so each re-linted window is widened a
+# paragraph at a time until, on either side of the changes, it reaches a line that begins a sentence in both
+# versions; everything between those lines is taken from the new findings. When most of a file changed, it is
+# linted in full instead.
+INCREMENTAL_MAX_CHANGE: float = 0.5  # Fraction of a file's lines that may be re-linted before it is linted in full
+
+def _paragraph_bounds(lines: List[str]) -> List[int]:
+    """Returns the index of every line that starts a paragraph, followed by the number of lines."""
+    bounds = [i for i, line in enumerate(lines) if line.strip() and (i == 0 or not lines[i - 1].strip() or _HEADING_LINE.match(line))]
+    if not bounds or bounds[0] != 0:
+        bounds.insert(0, 0)
+    bounds.append(len(lines))
+    return bounds
+
+def _changed_paragraphs(old_lines: List[str], new_lines: List[str]) -> Tuple[Dict[int, int], List[Tuple[int, int]]]:
+    """
+    Diffs two versions of a file. Returns the new index of every unchanged old line, and the changed lines of the
+    new version widened to whole paragraphs, as merged [start, end) ranges.
+    """
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    line_map: Dict[int, int] = {}
+    ranges: List[Tuple[int, int]] = []
+    bounds = _paragraph_bounds(new_lines)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            line_map.update(zip(range(i1, i2), range(j1, j2)))
+            continue
+        start = bounds[max(bisect.bisect_right(bounds, j1) - 1, 0)]
+        end = bounds[min(bisect.bisect_left(bounds, max(j2, j1 + 1)), len(bounds) - 1)]
+        if ranges and start <= ranges[-1][1]:
+            ranges[-1] = (ranges[-1][0], max(ranges[-1][1], end))
+        else:
+            ranges.append((start, end))
+    return line_map, ranges
+
+def _line_sentence_starts(doc: Doc, prose_line_offsets: List[int]) -> Optional[List[int]]:
+    """Returns the lines (after the first) at which a sentence of the parsed prose begins, or None without sentence boundaries."""
+    if not doc.has_annotation("SENT_START"):
+        return None
+    return [bisect.bisect_left(prose_line_offsets, sent.start_char) for sent in doc.sents
+            if sent.start_char > 0 and doc.text[sent.start_char - 1] == '\n']
+
+def _relint_window(lines: List[str], bounds: List[int], start: int, end: int, known_sentence_lines: Optional[Set[int]],
+                   file_name: str, linting_rules: List[Dict[str, Any]],
+                   model: Optional[Language]) -> Tuple[int, int, List[Dict[str, Any]], List[int]]:
+    """
+    Lints the changed lines [start, end) with enough of the surrounding paragraphs that no sentence is cut.
+    `known_sentence_lines` holds the lines known to begin a sentence, from the previous version or cached segments.
+    Returns the range of lines the new findings are complete for, those findings numbered by file line, and the
+    lines in that range that begin a sentence.
+    """
+    first = bisect.bisect_left(bounds, start)
+    last = bisect.bisect_left(bounds, end)
+    while True:
+        window_start, window_end = bounds[max(first - 1, 0)], bounds[min(last + 1, len(bounds) - 1)]
+        text = ''.join(line + '\n' for line in lines[window_start:window_end])
+        doc = None
+        valid_start, valid_end = window_start, window_end
+        sentence_lines: List[int] = []
+        if model is not None:
+            prose, prose_line_offsets = extract_prose(text)
+            doc = model(prose)
+            window_sentence_lines = _line_sentence_starts(doc, prose_line_offsets)
+            if window_sentence_lines is not None and known_sentence_lines is not None:
+                sentence_lines = [window_start + line for line in window_sentence_lines]
+                shared = [line for line in sentence_lines if line in known_sentence_lines]
+                if window_start > 0:
+                    valid_start = max((line for line in shared if line <= start), default=None)
+                if window_end < len(lines):
+                    valid_end = min((line for line in shared if line >= end), default=None)
+                if valid_start is None or valid_end is None:
+                    first -= valid_start is None
+                    last += valid_end is None
+                    continue
+        findings = []
+        for finding in lint_content(text, file_name, linting_rules, doc):
+            line_number = finding['lineNumber'] + window_start
+            if valid_start < line_number <= valid_end:
+                finding['lineNumber'] = line_number
+                finding['githubUrl'] = build_github_url(file_name, line_number)
+                findings.append(finding)
+        return valid_start, valid_end, findings, [line for line in sentence_lines if valid_start <= line < valid_end]
+
+def _relint_changes(lines: List[str], changed: List[Tuple[int, int]], kept_findings: List[Dict[str, Any]], known_sentence_lines: Optional[Set[int]],
+                    file_name: str, linting_rules: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Optional[List[int]], int]:
+    """
+    Lints the changed line ranges of a file whose other findings are known. `kept_findings` are the known findings
+    and `known_sentence_lines` the lines known to begin a sentence, both numbered in the file. Returns all the
+    file's findings, its sentence-starting lines (None if unknown) and the number of lines that were linted.
+    """
+    model = load_spacy_model(required_spacy_components(linting_rules)) if _has_heuristics(linting_rules) else None
+    bounds = _paragraph_bounds(lines)
+    relinted: List[Tuple[int, int]] = []
+    findings: List[Dict[str, Any]] = []
+    sentence_lines: List[int] = []
+    pending = list(changed)
+    while pending:
+        start, end = pending.pop(0)
+        valid_start, valid_end, window_findings, window_sentence_lines = _relint_window(
+            lines, bounds, start, end, known_sentence_lines, file_name, linting_rules, model)
+        # A window widened into the next change is linted again together with it.
+        if pending and pending[0][0] < valid_end:
+            pending[0] = (start, max(end, pending[0][1]))
+            continue
+        if relinted and valid_start < relinted[-1][1]:
+            valid_start = relinted[-1][1]
+            window_findings = [finding for finding in window_findings if finding['lineNumber'] > valid_start]
+            window_sentence_lines = [line for line in window_sentence_lines if line >= valid_start]
+        relinted.append((valid_start, valid_end))
+        findings.extend(window_findings)
+        sentence_lines.extend(window_sentence_lines)
+
+    def is_relinted(line: int) -> bool:
+        window = bisect.bisect_right(relinted, (line, len(lines) + 1)) - 1
+        return window >= 0 and line < relinted[window][1]
+
+    findings.extend(finding for finding in kept_findings if not is_relinted(finding['lineNumber'] - 1))
+    findings.sort(key=lambda f: f['lineNumber'])
+    if known_sentence_lines is None:
+        return findings, None, sum(end - start for start, end in relinted)
+    sentence_lines.extend(line for line in known_sentence_lines if not is_relinted(line))
+    return findings, sorted(sentence_lines), sum(end - start for start, end in relinted)
+
+def lint_content_incrementally(content: str, file_name: str, linting_rules: List[Dict[str, Any]], old_content: str,
+                               old_findings: List[Dict[str, Any]],
+                               old_sentence_lines: Optional[List[int]]) -> Optional[Tuple[List[Dict[str, Any]], Optional[List[int]]]]:
+    """
+    Lints a new version of a file given the content, findings and sentence-starting lines of the previous one,
+    re-linting only around the changes. Returns the findings and the new version's sentence-starting lines, or
+    None if so much changed that the file should be linted in full.
+    """
+    old_lines, lines = old_content.splitlines(), content.splitlines()
+    line_map, changed = _changed_paragraphs(old_lines, lines)
+    if sum(end - start for start, end in changed) > INCREMENTAL_MAX_CHANGE * len(lines):
+        return None
+    kept_findings = []
+    for finding in old_findings:
+        new_index = line_map.get(finding['lineNumber'] - 1)
+        if new_index is not None:
+            finding['lineNumber'] = new_index + 1
+            finding['githubUrl'] = build_github_url(file_name, new_index + 1)
+            kept_findings.append(finding)
+    known_sentence_lines = None
+    if old_sentence_lines is not None:
+        known_sentence_lines = {line_map[line] for line in old_sentence_lines if line in line_map}
+    findings, sentence_lines, relinted = _relint_changes(lines, changed, kept_findings, known_sentence_lines, file_name,
+                                                         linting_rules)
+    logging.info(f"Re-linted {relinted} of {len(lines)} lines of {file_name}.")
+    return findings, sentence_lines
+
+def _sentence_lines(content: str, doc: Optional[Doc]) -> Optional[List[int]]:
+    """Returns the lines of content at which a sentence of its parsed prose begins, or None if it was not parsed."""
+    return _line_sentence_starts(doc, extract_prose(content)[1]) if doc is not None else None
+
+def _lint_from_snapshot(content: str, file_name: str, linting_rules: List[Dict[str, Any]],
+                        cache: LintCache) -> Optional[Tuple[List[Dict[str, Any]], Optional[List[int]]]]:
+    """Lints content against the file's snapshot, or returns None if it needs a full lint."""
+    snapshot = cache.get_snapshot(file_name)
+    if snapshot is None:
+        return None
+    old_content, old_findings, old_sentence_lines = snapshot
+    if _has_heuristics(linting_rules) and old_sentence_lines is None:
+        return None
+    return lint_content_incrementally(content, file_name, linting_rules, old_content, old_findings, old_sentence_lines)
+
+def _remember_lint(cache: LintCache, file_name: str, content: str, findings: List[Dict[str, Any]], sentence_lines: Optional[List[int]],
+                   snapshot: bool, segments: bool) -> None:
+    """Stores a linted file as its snapshot and/or as cached segments."""
+    if snapshot:
+        cache.put_snapshot(file_name, content, findings, sentence_lines)
+    if segments:
+        store_segments(cache, content.splitlines(), findings, sentence_lines)
+
+def _lint_known_text(content: str, file_name: str, linting_rules: List[Dict[str, Any]], cache: LintCache,
+                     content_hash: str, incremental: bool, segments: bool) -> Optional[List[Dict[str, Any]]]:
+    """
+    Lints content against the file's snapshot (with `incremental`) or the cached segments it shares (with
+    `segments`) and caches the result, or returns None if neither applies and the file needs a full lint.
+    """
+    result = _lint_from_snapshot(content, file_name, linting_rules, cache) if incremental else None
+    if result is None and segments:
+        result = lint_content_with_segments(content, file_name, linting_rules, cache)
+    if result is None:
+        return None
+    findings, sentence_lines = result
+    cache.put_findings(content_hash, findings)
+    _remember_lint(cache, file_name, content, findings, sentence_lines, incremental, segments)
     return findings
 
-def main() -> None:
+# --- Repeated Text ---
+# Pages share a lot of boilerplate. With --share-segments, once a file is linted it is cut into segments at every
+# paragraph that begins with a sentence, and each segment's findings and sentence-starting lines are cached under
+# a hash of its text. Before another file is parsed, segments are looked up at each of its paragraphs (by the
+# line counts of the cached segments that begin with that paragraph); only the text between the segments found
+# is linted, with the same sentence-aligned windows as incremental linting, and the segments' findings are moved
+# to their lines in the file. Within one run, a file that shares most of its paragraphs with a file waiting to be
+# parsed is held back until that file's segments are cached.
+SEGMENT_MIN_SHARE: float = 0.5  # Fraction of a file's paragraphs shared with a queued file for it to be held back
+
+def _hash_lines(lines: List[str]) -> str:
+    """Returns the hash that segments are addressed by: their lines, whatever their original line endings."""
+    return LintCache.hash_content('\n'.join(lines))
+
+def paragraph_hashes(lines: List[str]) -> Set[str]:
+    """Returns the hashes of a file's paragraphs."""
+    bounds = _paragraph_bounds(lines)
+    return {_hash_lines(lines[start:end]) for start, end in zip(bounds, bounds[1:])}
+
+def store_segments(cache: LintCache, lines: List[str], findings: List[Dict[str, Any]], sentence_lines: Optional[List[int]]) -> None:
+    """Caches every segment of a linted file: the runs of lines between paragraphs that begin with a sentence."""
+    bounds = _paragraph_bounds(lines)
+    cuts = bounds if sentence_lines is None else [0] + sorted(set(bounds[1:-1]) & set(sentence_lines)) + [len(lines)]
+    by_line: Dict[int, List[Dict[str, Any]]] = {}
+    for finding in findings:
+        by_line.setdefault(finding['lineNumber'] - 1, []).append(finding)
+    for start, end in zip(cuts, cuts[1:]):
+        if start == end:
+            continue
+        segment_findings = [finding for line in range(start, end) for finding in by_line.get(line, [])]
+        segment_sentence_lines = None
+        if sentence_lines is not None:
+            segment_sentence_lines = [line for line in sentence_lines if start <= line < end]
+        first_paragraph_end = bounds[bisect.bisect_right(bounds, start)]
+        cache.put_segment(_hash_lines(lines[start:end]), _hash_lines(lines[start:first_paragraph_end]), end - start,
+                          segment_findings, segment_sentence_lines, start + 1)
+
+def lint_content_with_segments(content: str, file_name: str, linting_rules: List[Dict[str, Any]],
+                               cache: LintCache) -> Optional[Tuple[List[Dict[str, Any]], Optional[List[int]]]]:
+    """
+    Lints content reusing the cached findings of the segments it shares with files linted before. Returns the
+    findings and sentence-starting lines, or None if no segment was found.
+    """
+    lines = content.splitlines()
+    bounds = _paragraph_bounds(lines)
+    bound_index = {bound: index for index, bound in enumerate(bounds)}
+    needs_sentences = _has_heuristics(linting_rules)
+    kept_findings: List[Dict[str, Any]] = []
+    known_sentence_lines: Set[int] = set()
+    changed: List[Tuple[int, int]] = []
+    reused = 0
+    index = 0
+    while index < len(bounds) - 1:
+        start = bounds[index]
+        segment = None
+        for length in cache.get_segment_lengths(_hash_lines(lines[start:bounds[index + 1]])):
+            if start + length in bound_index:
+                segment = cache.get_segment(_hash_lines(lines[start:start + length]), file_name, start + 1)
+                if segment is not None and (segment[1] is not None or not needs_sentences):
+                    break
+                segment = None
+        if segment is None:
+            cache.segment_misses += 1
+            end = bounds[index + 1]
+            if changed and changed[-1][1] == start:
+                changed[-1] = (changed[-1][0], end)
+            else:
+                changed.append((start, end))
+            index += 1
+            continue
+        cache.segment_hits += 1
+        segment_findings, segment_sentence_lines = segment
+        kept_findings.extend(segment_findings)
+        # Segments were cut where a sentence began, so both their ends are candidate boundaries here too.
+        known_sentence_lines.update([start, start + length] + (segment_sentence_lines or []))
+        reused += length
+        index = bound_index[start + length]
+    if not reused:
+        return None
+    known_sentence_lines.difference_update((0, len(lines)))
+    findings, sentence_lines, relinted = _relint_changes(lines, changed, kept_findings, known_sentence_lines if needs_sentences else None,
+                                                         file_name, linting_rules)
+    logging.info(f"Reused {reused} lines of cached segments and linted {relinted} of {len(lines)} lines of {file_name}.")
+    return findings, sentence_lines
+
+# --- Parallel Linting ---
+# Each worker process loads the spaCy model and compiles the rulebook once, in the pool initializer,
+# rather than receiving them with every task.
+_worker_rules: List[Dict[str, Any]] = []
+_worker_batch_size: int = DEFAULT_BATCH_SIZE
+_worker_cache: Optional[LintCache] = None
+_worker_profile: bool = False
+_worker_chunk_chars: int = CHUNK_CHARS
+_worker_incremental: bool = False
+_worker_segments: bool = False
+
+def _init_lint_worker(rulebook_file: str, batch_size: int, cache_settings: Optional[Tuple[str, int]], profile: bool = False,
+                      chunk_chars: int = CHUNK_CHARS, incremental: bool = False, segments: bool = False, rule_ids: Optional[List[str]] = None,
+                      severities: Optional[List[str]] = None) -> None:
+    """Pool initializer: loads the compiled rulebook, and the spaCy components it needs, into the worker process."""
+    global _worker_rules, _worker_batch_size, _worker_cache, _worker_profile, _worker_chunk_chars, _worker_incremental, _worker_segments
+    _worker_rules = load_rules_from_rulebook(rulebook_file, rule_ids, severities)
+    _worker_batch_size = batch_size
+    _worker_cache = create_lint_cache(_worker_rules, *cache_settings) if cache_settings is not None else None
+    _worker_profile = profile
+    _worker_chunk_chars = chunk_chars
+    _worker_incremental = incremental
+    _worker_segments = segments
+    if _has_heuristics(_worker_rules):
+        load_spacy_model(required_spacy_components(_worker_rules))
+
+def _lint_files_in_worker(files: List[Tuple[str, str]]) -> Tuple[List[Tuple[str, List[Dict[str, Any]]]], Optional[LintProfile],
+                                                                 Optional[Tuple[int, int, int, int]]]:
+    """
+    Pool task: lints a chunk of files with the rules loaded by `_init_lint_worker`, returning the findings, the
+    chunk's profile, and the cache hits and misses of the chunk (see `LintCache.counters`), if there is a cache.
+    """
+    profile = LintProfile() if _worker_profile else None
+    before = _worker_cache.counters() if _worker_cache is not None else None
+    results = list(lint_files(files, _worker_rules, _worker_batch_size, _worker_cache, profile, _worker_chunk_chars,
+                              _worker_incremental, _worker_segments))
+    if before is None:
+        return results, profile, None
+    return results, profile, tuple(after - start for after, start in zip(_worker_cache.counters(), before))
+
+def lint_files_parallel(files: List[Tuple[str, str]], jobs: int, batch_size: int = DEFAULT_BATCH_SIZE, cache_settings: Optional[Tuple[str, int]] = None,
+                        profile: Optional[LintProfile] = None, chunk_chars: int = CHUNK_CHARS, incremental: bool = False,
+                        segments: bool = False, rulebook_file: str = RULEBOOK_FILE, rule_ids: Optional[List[str]] = None,
+                        severities: Optional[List[str]] = None, cache: Optional[LintCache] = None) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    Lints (file_path, file_name) pairs across a pool of `jobs` worker processes and yields (file_name, findings) as chunks finish.
+    Files are dealt out largest first into several chunks per worker, so each task can batch its parses through
+    `nlp.pipe` while a long file does not end up as the last task on one worker. `cache_settings` is the
+    (cache_dir, max_mb) each worker opens the lint cache with, or None to lint without it. With a `profile`,
+    the workers profile their chunks and the measurements are merged into it. With a `cache`, the workers' cache hits
+    and misses are added to its counters.
+    """
+    by_size = sorted(files, key=lambda item: os.path.getsize(item[0]), reverse=True)
+    chunk_count = min(len(by_size), jobs * 4)
+    chunks = [by_size[i::chunk_count] for i in range(chunk_count)]
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_lint_worker,
+                             initargs=(rulebook_file, batch_size, cache_settings, profile is not None, chunk_chars,
+                                       incremental, segments, rule_ids, severities)) as executor:
+        for chunk_results, chunk_profile, chunk_counters in executor.map(_lint_files_in_worker, chunks):
+            if profile is not None:
+                profile.merge(chunk_profile)
+            if cache is not None and chunk_counters is not None:
+                cache.add_counters(chunk_counters)
+            for file_name, findings in chunk_results:
+                logging.info(f"Linted {os.path.join(MARKDOWN_DIR, file_name)} ({len(findings)} findings).")
+                yield file_name, findings
+
+# --- Report Writing ---
+# Findings are handed to a ReportWriter file by file as they are linted, rather than collected into one list.
+# It keeps up to REPORT_BUFFER_FINDINGS of them in memory, as typed columns of file, line and rule indexes plus
+# their text rather than as dicts; when the buffer fills, it is sorted and spilled to a temporary JSON Lines run,
+# and closing the writer merges the runs (an external merge sort), so memory stays flat however many findings a
+# corpus has. Runs are sorted stably and merged earliest run first, so the report is in the same order as sorting
+# all findings at once. The json report is formatted straight from the columns; the other formats turn findings
+# back into dicts one at a time as they are written. The report is written in one of REPORT_FORMATS:
+#   json     the list of findings, as it always has been
+#   jsonl    one finding per line
+#   compact  findings as [file index, line number, rule index, offending text], with each file (and its URL) and
+#            each rule's id, description and severity stored once
+#   sarif    SARIF 2.1.0, for code scanning tools
+REPORT_FORMATS: List[str] = ['json', 'jsonl', 'compact', 'sarif']
+REPORT_BUFFER_FINDINGS: int = 50_000  # Findings kept in memory before they are spilled to a sorted run on disk
+SARIF_LEVELS: Dict[str, str] = {'error': 'error', 'warn': 'warning', 'warning': 'warning', 'info': 'note'}
+
+_json_string = json.encoder.encode_basestring_ascii
+
+def _json_scalar(value: Any) -> str:
+    """Encodes a finding's value as json.dump(..., indent=2) would inside a finding."""
+    if type(value) is str:
+        return _json_string(value)
+    if type(value) is int:
+        return int.__repr__(value)
+    return json.dumps(value, indent=2).replace('\n', '\n    ')
+
+class ReportWriter:
+    """Collects findings with bounded memory and writes them, sorted by file, line and rule, when closed."""
+
+    def __init__(self, report_file: str = REPORT_FILE, report_format: str = 'json', buffer_findings: int = REPORT_BUFFER_FINDINGS):
+        if report_format not in REPORT_FORMATS:
+            raise ValueError(f"Unknown report format '{report_format}'; expected one of {', '.join(REPORT_FORMATS)}.")
+        self.report_file = report_file
+        self.report_format = report_format
+        self.buffer_findings = max(buffer_findings, 1)
+        self.count = 0
+        # Files and rules are stored once; the buffered findings are columns of indexes into them.
+        self._files: Dict[str, int] = {}
+        self._file_names: List[str] = []
+        self._file_urls: List[str] = []
+        self._rules: Dict[Tuple[Any, Any, Any], int] = {}
+        self._rule_list: List[Tuple[Any, Any, Any]] = []
+        self._file_column = array('l')
+        self._line_column = array('q')
+        self._rule_column = array('l')
+        self._texts: List[str] = []
+        self._runs: List[str] = []
+        self._spill_dir: Optional[tempfile.TemporaryDirectory] = None
+
+    def add(self, findings: Iterable[Dict[str, Any]]) -> None:
+        """Adds findings to the report, spilling a sorted run to disk whenever the buffer fills."""
+        for finding in findings:
+            file_index = self._files.get(finding['fileName'])
+            if file_index is None:
+                file_index = self._files[finding['fileName']] = len(self._file_names)
+                self._file_names.append(finding['fileName'])
+                self._file_urls.append(finding['githubUrl'].rsplit('#L', 1)[0])
+            rule = (finding['ruleId'], finding.get('ruleDescription'), finding.get('severity'))
+            rule_index = self._rules.get(rule)
+            if rule_index is None:
+                rule_index = self._rules[rule] = len(self._rule_list)
+                self._rule_list.append(rule)
+            self._file_column.append(file_index)
+            self._line_column.append(finding['lineNumber'])
+            self._rule_column.append(rule_index)
+            self._texts.append(finding['offendingText'])
+            self.count += 1
+            if len(self._texts) >= self.buffer_findings:
+                self._spill()
+
+    def _row_key(self, row: Tuple[int, int, int, str]) -> Tuple[str, int, str]:
+        return self._file_names[row[0]], row[1], self._rule_list[row[2]][0] or ''
+
+    def _sorted_buffer(self) -> List[Tuple[int, int, int, str]]:
+        """Returns the buffered findings as sorted (file, line, rule, text) rows and empties the buffer."""
+        rows = sorted(zip(self._file_column, self._line_column, self._rule_column, self._texts), key=self._row_key)
+        self._file_column, self._line_column, self._rule_column, self._texts = array('l'), array('q'), array('l'), []
+        return rows
+
+    def _spill(self) -> None:
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.TemporaryDirectory(prefix='lint-report-')
+        run_path = os.path.join(self._spill_dir.name, f"run-{len(self._runs)}.jsonl")
+        with open(run_path, 'w', encoding='utf-8') as f:
+            f.writelines(f'[{file_index}, {line_number}, {rule_index}, {_json_string(offending_text)}]\n'
+                         for file_index, line_number, rule_index, offending_text in self._sorted_buffer())
+        self._runs.append(run_path)
+
+    @staticmethod
+    def _read_run(run_path: str) -> Iterator[List[Any]]:
+        with open(run_path, 'r', encoding='utf-8') as f:
+            yield from map(json.loads, f)
+
+    def _finding(self, row: Tuple[int, int, int, str]) -> Dict[str, Any]:
+        file_index, line_number, rule_index, offending_text = row
+        rule_id, description, severity = self._rule_list[rule_index]
+        return {
+            "fileName": self._file_names[file_index], "lineNumber": line_number,
+            "ruleId": rule_id, "ruleDescription": description,
+            "severity": severity, "offendingText": offending_text,
+            "githubUrl": f"{self._file_urls[file_index]}#L{line_number}"
+        }
+
+    def sorted_rows(self) -> Iterator[Tuple[int, int, int, str]]:
+        """Yields every added finding as a (file, line, rule, text) row in report order, merging the spilled runs with the buffer."""
+        rows = self._sorted_buffer()
+        if self._runs:
+            return heapq.merge(*(self._read_run(run_path) for run_path in self._runs), rows, key=self._row_key)
+        return iter(rows)
+
+    def sorted_findings(self) -> Iterator[Dict[str, Any]]:
+        """Yields every added finding in report order, merging the spilled runs with the buffer."""
+        return map(self._finding, self.sorted_rows())
+
+    def close(self) -> None:
+        """Writes the report and removes the spilled runs."""
+        try:
+            with open(self.report_file, 'w', encoding='utf-8') as f:
+                if self.report_format == 'json':
+                    self._write_json(f, self.sorted_rows())
+                else:
+                    getattr(self, f"_write_{self.report_format}")(f, self.sorted_findings())
+        finally:
+            self._runs = []
+            if self._spill_dir is not None:
+                self._spill_dir.cleanup()
+                self._spill_dir = None
+
+    def __enter__(self) -> "ReportWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        elif self._spill_dir is not None:
+            self._spill_dir.cleanup()
+
+    def _write_json(self, f, rows: Iterator[Tuple[int, int, int, str]]) -> None:
+        # Byte for byte what json.dump(findings, f, indent=2) writes, straight from the columns: each file's and each
+        # rule's part of a finding is encoded once, so a finding only costs formatting its line number and text.
+        file_parts = [(f'  {{\n    "fileName": {_json_scalar(name)},\n    "lineNumber": ', f',\n    "githubUrl": {_json_string(url)[:-1]}#L')
+                      for name, url in zip(self._file_names, self._file_urls)]
+        rule_parts = [f',\n    "ruleId": {_json_scalar(rule_id)},\n    "ruleDescription": {_json_scalar(description)},\n'
+                      f'    "severity": {_json_scalar(severity)},\n    "offendingText": '
+                      for rule_id, description, severity in self._rule_list]
+        separator = '[\n'
+        for file_index, line_number, rule_index, offending_text in rows:
+            head, url = file_parts[file_index]
+            f.write(f'{separator}{head}{line_number}{rule_parts[rule_index]}{_json_string(offending_text)}{url}{line_number}"\n  }}')
+            separator = ',\n'
+        f.write('[]' if separator == '[\n' else '\n]')
+
+    @staticmethod
+    def _write_jsonl(f, findings: Iterator[Dict[str, Any]]) -> None:
+        for finding in findings:
+            f.write(json.dumps(finding))
+            f.write('\n')
+
+    @staticmethod
+    def _rule_index(rules: Dict[Tuple[Any, Any, Any], int], finding: Dict[str, Any]) -> int:
+        return rules.setdefault((finding['ruleId'], finding.get('ruleDescription'), finding.get('severity')), len(rules))
+
+    @classmethod
+    def _write_compact(cls, f, findings: Iterator[Dict[str, Any]]) -> None:
+        # The tables are only complete once every finding is written, so they follow the findings.
+        files: Dict[str, int] = {}
+        file_urls: List[str] = []
+        rules: Dict[Tuple[Any, Any, Any], int] = {}
+        f.write('{"format": "compact", "version": 1, "fields": ["file", "lineNumber", "rule", "offendingText"], "findings": [')
+        separator = '\n'
+        for finding in findings:
+            file_index = files.get(finding['fileName'])
+            if file_index is None:
+                file_index = files[finding['fileName']] = len(files)
+                file_urls.append(finding['githubUrl'].rsplit('#L', 1)[0])
+            row = [file_index, finding['lineNumber'], cls._rule_index(rules, finding), finding['offendingText']]
+            f.write(separator + json.dumps(row))
+            separator = ',\n'
+        f.write('\n],\n"files": ')
+        json.dump([{"fileName": name, "url": url} for name, url in zip(files, file_urls)], f)
+        f.write(',\n"rules": ')
+        json.dump([{"ruleId": rule_id, "ruleDescription": description, "severity": severity}
+                   for rule_id, description, severity in rules], f)
+        f.write('}\n')
+
+    @staticmethod
+    def _sarif_message(finding: Dict[str, Any]) -> str:
+        # Descriptions end in a full stop, which would run into the colon before the offending text.
+        description = (finding.get('ruleDescription') or finding['ruleId']).rstrip(' .:;')
+        return f"{description}: {' '.join(finding['offendingText'].split())}"
+
+    @classmethod
+    def _write_sarif(cls, f, findings: Iterator[Dict[str, Any]]) -> None:
+        rules: Dict[Tuple[Any, Any, Any], int] = {}
+        f.write('{"$schema": "https://json.schemastore.org/sarif-2.1.0.json", "version": "2.1.0", "runs": [{"results": [')
+        separator = '\n'
+        for finding in findings:
+            result = {
+                "ruleId": finding['ruleId'], "ruleIndex": cls._rule_index(rules, finding),
+                "level": SARIF_LEVELS.get(finding.get('severity'), 'warning'),
+                "message": {"text": cls._sarif_message(finding)},
+                "locations": [{"physicalLocation": {
+                    "artifactLocation": {"uri": f"{MARKDOWN_DIR}/{finding['fileName']}"},
+                    "region": {"startLine": finding['lineNumber'], "snippet": {"text": finding['offendingText']}}
+                }}]
+            }
+            f.write(separator + json.dumps(result))
+            separator = ',\n'
+        f.write('\n],\n"tool": {"driver": {"name": "aps-style-lint", "rules": ')
+        json.dump([{"id": rule_id, "shortDescription": {"text": description or rule_id},
+                    "defaultConfiguration": {"level": SARIF_LEVELS.get(severity, 'warning')}}
+                   for rule_id, description, severity in rules], f)
+        f.write('}}}]}\n')
+
+def write_report(findings: List[Dict[str, Any]], report_file: str = REPORT_FILE, report_format: str = 'json') -> None:
+    """Sorts findings by file, line and rule (stably, so ties keep the order they were found in) and writes the report."""
+    with ReportWriter(report_file, report_format) as report:
+        report.add(findings)
+
+def comma_list(value: str) -> List[str]:
+    """Parses a comma-separated command-line value."""
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+def add_lint_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the linter's command-line options to `parser`."""
+    parser.add_argument("--rulebook", default=RULEBOOK_FILE,
+                        help=f"Rulebook to lint with: a JSON array of rule sets, or concatenated rule set objects such as "
+                             f"Codebook.json (default: {RULEBOOK_FILE}).")
+    parser.add_argument("--rules", type=comma_list,
+                        help="Only run the rules with these comma-separated ids; * matches any characters (e.g. 'APS-GPC-Adverbs-*').")
+    parser.add_argument("--severity", type=comma_list,
+                        help="Only run the rules of these comma-separated severities (e.g. error,warn).")
+    parser.add_argument("--report-file", default=REPORT_FILE,
+                        help=f"File to write the report to (default: {REPORT_FILE}).")
+    parser.add_argument("--report-format", choices=REPORT_FORMATS, default='json',
+                        help="Report format: json (a list of findings), jsonl (one finding per line), compact (rule metadata "
+                             "stored once and referred to by index) or sarif (default: json).")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Number of worker processes to lint files with (0 = one per CPU, default: 1).")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Number of documents spaCy parses per batch (default: {DEFAULT_BATCH_SIZE}).")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Lint every file from scratch without reading or writing the lint cache.")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="Invalidate the lint cache by deleting its entries (not the compiled rulebooks) before linting.")
+    parser.add_argument("--cache-dir", default=CACHE_DIR,
+                        help=f"Directory of the lint cache (default: {CACHE_DIR}).")
+    parser.add_argument("--cache-max-mb", type=int, default=CACHE_MAX_MB,
+                        help=f"Size bound of the lint cache in MB; least recently used entries are evicted (default: {CACHE_MAX_MB}).")
+    parser.add_argument("--chunk-chars", type=int, default=CHUNK_CHARS,
+                        help=f"Lint files larger than this many characters in chunks of about this size, split at paragraphs "
+                             f"and headings; 0 lints every file as one document (default: {CHUNK_CHARS}).")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Re-lint only the paragraphs of each file that changed since it was last linted, carrying its other "
+                             "findings over (uses the lint cache).")
+    parser.add_argument("--share-segments", action="store_true",
+                        help="Reuse the findings for text that was already linted in another file, such as shared boilerplate "
+                             "(uses the lint cache).")
+    parser.add_argument("--profile", action="store_true",
+                        help=f"Measure every rule and file without the lint cache and write the measurements to {PROFILE_FILE}.")
+    parser.add_argument("--profile-top", type=int, default=PROFILE_TOP_N,
+                        help=f"Number of slowest rules to log with --profile (default: {PROFILE_TOP_N}).")
+    parser.add_argument("--rule-budget-ms", type=float, default=RULE_BUDGET_MS,
+                        help=f"Time a rule may take on one file before --profile flags it (default: {RULE_BUDGET_MS:g}).")
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parses command-line options for the linter."""
+    parser = argparse.ArgumentParser(description="Lint scraped Markdown against the APS style rulebook.")
+    add_lint_arguments(parser)
+    parser.add_argument("--compile-rulebook", action="store_true",
+                        help=f"Compile the rulebook into {COMPILED_RULEBOOK_DIR} without linting, e.g. as a build step.")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> None:
     """Main function to orchestrate the linting process and generate the report."""
-    all_findings = []
-    linting_rules = load_rules_from_rulebook(RULEBOOK_FILE)
+    args = parse_args(argv)
+    if args.compile_rulebook:
+        compiled = load_compiled_rulebook(args.rulebook)
+        logging.info(f"{args.rulebook} has {len(compiled['rules'])} usable rules, compiled at {compiled_rulebook_path(args.rulebook)}.")
+        return
+    linting_rules = load_rules_from_rulebook(args.rulebook, args.rules, args.severity)
     
     if not linting_rules:
         logging.warning("No linting rules were loaded. An empty report will be created.")
     else:
-        logging.info(f"Successfully loaded {len(linting_rules)} rules from {RULEBOOK_FILE}.")
+        logging.info(f"Successfully loaded {len(linting_rules)} rules from {args.rulebook}.")
 
+    files: List[Tuple[str, str]] = []
     if os.path.exists(MARKDOWN_DIR):
-        for file_name in sorted(os.listdir(MARKDOWN_DIR)):
-            if file_name.endswith('.md'):
-                file_path = os.path.join(MARKDOWN_DIR, file_name)
-                logging.info(f"Linting {file_path}...")
-                findings = lint_file(file_path, file_name, linting_rules)
-                all_findings.extend(findings)
+        files = [(os.path.join(MARKDOWN_DIR, file_name), file_name)
+                 for file_name in sorted(os.listdir(MARKDOWN_DIR)) if file_name.endswith('.md')]
     else:
         logging.warning(f"Markdown directory '{MARKDOWN_DIR}' not found. No files to lint.")
 
-    all_findings.sort(key=lambda x: (x['fileName'], x['lineNumber'], x['ruleId']))
+    cache = None
+    if not args.no_cache:
+        cache = create_lint_cache(linting_rules, args.cache_dir, args.cache_max_mb)
+        if args.clear_cache:
+            cache.clear()
+    profile = None
+    if args.profile:
+        logging.info("Profiling: every file is linted without the lint cache.")
+        profile = LintProfile()
+        cache = None
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    parallel = jobs > 1 and len(files) > 1
+    report = ReportWriter(args.report_file, args.report_format)
+    if parallel:
+        logging.info(f"Linting {len(files)} files with {jobs} worker processes.")
+        cache_settings = (args.cache_dir, args.cache_max_mb) if cache is not None else None
+        results = lint_files_parallel(files, jobs, args.batch_size, cache_settings, profile, args.chunk_chars, args.incremental,
+                                      args.share_segments, args.rulebook, args.rules, args.severity, cache)
+    else:
+        results = lint_files(files, linting_rules, args.batch_size, cache, profile, args.chunk_chars, args.incremental,
+                             args.share_segments)
+    for _, findings in results:
+        report.add(findings)
+    if cache is not None:
+        logging.info(f"Lint cache: {cache.hits} hits, {cache.misses} misses.")
+        if args.share_segments:
+            logging.info(f"Shared segments: {cache.segment_hits} hits, {cache.segment_misses} misses.")
+
+    if cache is not None:
+        cache.evict()
 
-    with open(REPORT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(all_findings, f, indent=2)
+    report.close()
+    if profile is not None:
+        profile.write(PROFILE_FILE, args.profile_top, args.rule_budget_ms)
 
-    logging.info(f"Linting complete. Report generated at {REPORT_FILE}")
-    logging.info(f"Found {len(all_findings)} issues.")
+    logging.info(f"Linting complete. Report generated at {args.report_file}")
+    logging.info(f"Found {report.count} issues.")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,70 @@
+# scripts/lint_client.py
+
+import os
+import sys
+import json
+import argparse
+import urllib.error
+import urllib.request
+from typing import List, Dict, Any, Optional
+
+# The client only uses the standard library, so a check starts in milliseconds; the rules and the spaCy model
+# live in the long-running scripts/lint_server.py.
+
+# --- Configuration ---
+DEFAULT_SERVER: str = 'http://127.0.0.1:8737'
+REQUEST_TIMEOUT: float = 300.0
+
+def request_lint(server: str, body: Dict[str, Any], timeout: float = REQUEST_TIMEOUT) -> Dict[str, Any]:
+    """Sends a lint request to the server and returns its JSON response."""
+    request = urllib.request.Request(f"{server.rstrip('/')}/lint", data=json.dumps(body).encode('utf-8'),
+                                     headers={'Content-Type': 'application/json'}, method='POST')
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.load(response)
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parses command-line options for the lint client."""
+    parser = argparse.ArgumentParser(description="Lint Markdown with a running scripts/lint_server.py.")
+    parser.add_argument("files", nargs='+', help="Markdown files to lint, or - to lint standard input.")
+    parser.add_argument("--server", default=DEFAULT_SERVER, help=f"URL of the lint server (default: {DEFAULT_SERVER}).")
+    parser.add_argument("--send-text", action="store_true",
+                        help="Send the files' contents rather than their paths, for a server that cannot read them.")
+    parser.add_argument("--file-name", default="stdin.md", help="File name to report standard input as (default: stdin.md).")
+    parser.add_argument("--output", help="Write the findings to this file as a report instead of printing them.")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Lints the files with the server. Returns 1 if there were findings, 2 if the server could not lint them."""
+    args = parse_args(argv)
+    bodies: List[Dict[str, Any]] = []
+    paths = [path for path in args.files if path != '-']
+    if '-' in args.files:
+        bodies.append({"text": sys.stdin.read(), "fileName": args.file_name})
+    if args.send_text:
+        for path in paths:
+            with open(path, 'r', encoding='utf-8') as f:
+                bodies.append({"text": f.read(), "fileName": os.path.basename(path)})
+    elif paths:
+        bodies.append({"paths": [os.path.abspath(path) for path in paths]})
+
+    findings: List[Dict[str, Any]] = []
+    try:
+        for body in bodies:
+            findings.extend(request_lint(args.server, body)["findings"])
+    except urllib.error.HTTPError as e:
+        print(f"Lint server error: {json.load(e).get('error', e.reason)}", file=sys.stderr)
+        return 2
+    except urllib.error.URLError as e:
+        print(f"Could not reach the lint server at {args.server}: {e.reason}", file=sys.stderr)
+        return 2
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(findings, f, indent=2)
+    else:
+        for finding in findings:
+            print(f"{finding['fileName']}:{finding['lineNumber']}: [{finding['ruleId']}] {finding['ruleDescription']}: {' '.join(finding['offendingText'].split())}")
+    return 1 if findings else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+# scripts/lint_server.py
+
+import os
+import json
+import time
+import logging
+import argparse
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import List, Dict, Any, Optional, Tuple
+
+import lint
+
+# --- Configuration ---
+DEFAULT_HOST: str = '127.0.0.1'
+DEFAULT_PORT: int = 8737
+MAX_REQUEST_BYTES: int = 64 * 1024 * 1024
+
+# --- Warm Linter ---
+# The server loads the rulebook and the spaCy model once and keeps them for every request. Before each request it
+# checks whether the rulebook file has changed, and if so reloads it (and the model, if the rules need other
+# pipeline components), so rulebook edits apply without a restart.
+class WarmLinter:
+    """Holds the rules and model between requests and reloads the rulebook when it changes on disk."""
+
+    def __init__(self, rulebook_file: str, chunk_chars: int = lint.CHUNK_CHARS):
+        self.rulebook_file = rulebook_file
+        self.chunk_chars = chunk_chars
+        self.linting_rules: List[Dict[str, Any]] = []
+        self._rulebook_stamp: Optional[Tuple[int, int]] = None
+        self.reload_if_changed()
+
+    def _stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.rulebook_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload_if_changed(self) -> bool:
+        """Reloads the rulebook if its modification time or size changed. Returns True if it was reloaded."""
+        stamp = self._stamp()
+        if stamp == self._rulebook_stamp:
+            return False
+        try:
+            linting_rules = lint.load_rules_from_rulebook(self.rulebook_file)
+        except (ValueError, TypeError, AttributeError, KeyError) as e:
+            # Valid JSON in the wrong shape (a rule set that is not an object, a pattern that is not a string)
+            # fails while the rules are compiled; the last good rules are kept, and it is retried on its next change.
+            logging.error(f"Keeping the previous {len(self.linting_rules)} rules: could not compile {self.rulebook_file}: {e!r}")
+            self._rulebook_stamp = stamp
+            return False
+        if not linting_rules and self.linting_rules:
+            # An unreadable or half-written rulebook keeps the last good rules; it is retried on its next change.
+            logging.warning(f"Keeping the previous {len(self.linting_rules)} rules: no rules could be loaded from {self.rulebook_file}.")
+            self._rulebook_stamp = stamp
+            return False
+        self.linting_rules = linting_rules
+        self._rulebook_stamp = stamp
+        if lint._has_heuristics(linting_rules):
+            lint.load_spacy_model(lint.required_spacy_components(linting_rules))
+        logging.info(f"Loaded {len(linting_rules)} rules from {self.rulebook_file}.")
+        return True
+
+    def lint_text(self, text: str, file_name: str) -> List[Dict[str, Any]]:
+        """Lints Markdown text as if it were the content of `file_name`."""
+        doc = None
+        if lint._has_heuristics(self.linting_rules):
+            model = lint.load_spacy_model(lint.required_spacy_components(self.linting_rules))
+            prose = lint.extract_prose(text)[0]
+            model.max_length = max(model.max_length, len(prose) + 1)
+            doc = model(prose)
+        return lint.lint_content(text, file_name, self.linting_rules, doc)
+
+    def lint_paths(self, paths: List[str]) -> List[Dict[str, Any]]:
+        """Lints Markdown files on the server's file system, reporting them by base name like lint.py."""
+        findings: List[Dict[str, Any]] = []
+        for path in paths:
+            findings.extend(lint.lint_file(path, os.path.basename(path), self.linting_rules, chunk_chars=self.chunk_chars))
+        return findings
+
+# --- HTTP Interface ---
+# POST /lint with a JSON body of either {"text": "...", "fileName": "page.md"} or {"paths": ["scraped/page.md", ...]}
+# returns {"findings": [...], "rules": N, "elapsedMs": T}, the findings in the report's format and order.
+# GET /health returns the number of loaded rules.
+class LintRequestHandler(BaseHTTPRequestHandler):
+    server: "LintServer"
+
+    def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        if self.path != '/health':
+            self._send_json(404, {"error": f"Unknown path '{self.path}'."})
+            return
+        self.server.linter.reload_if_changed()
+        self._send_json(200, {"status": "ok", "rules": len(self.server.linter.linting_rules)})
+
+    def do_POST(self) -> None:
+        if self.path != '/lint':
+            self._send_json(404, {"error": f"Unknown path '{self.path}'."})
+            return
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_REQUEST_BYTES:
+            self._send_json(413, {"error": f"Request body larger than {MAX_REQUEST_BYTES} bytes."})
+            return
+        try:
+            request = json.loads(self.rfile.read(length) or b'{}')
+        except json.JSONDecodeError as e:
+            self._send_json(400, {"error": f"Invalid JSON: {e}"})
+            return
+        if not isinstance(request, dict) or ('text' not in request and 'paths' not in request):
+            self._send_json(400, {"error": "Expected a JSON object with 'text' or 'paths'."})
+            return
+
+        start = time.perf_counter()
+        linter = self.server.linter
+        linter.reload_if_changed()
+        if 'text' in request:
+            file_name = request.get('fileName') or 'stdin.md'
+            findings = linter.lint_text(str(request['text']), file_name)
+            subject = file_name
+        else:
+            paths = request['paths']
+            if not isinstance(paths, list) or not all(isinstance(path, str) for path in paths):
+                self._send_json(400, {"error": "Expected 'paths' to be a list of file path strings."})
+                return
+            missing = [path for path in paths if not os.path.isfile(path)]
+            if missing:
+                self._send_json(404, {"error": f"Files not found: {', '.join(missing)}"})
+                return
+            findings = linter.lint_paths(paths)
+            subject = f"{len(paths)} files"
+        findings.sort(key=lambda x: (x['fileName'], x['lineNumber'], x['ruleId']))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logging.info(f"Linted {subject} in {elapsed_ms:.1f} ms ({len(findings)} findings).")
+        self._send_json(200, {"findings": findings, "rules": len(linter.linting_rules), "elapsedMs": round(elapsed_ms, 1)})
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logging.debug(f"{self.address_string()} - {format % args}")
+
+class LintServer(HTTPServer):
+    """Serves lint requests one at a time with a warm linter."""
+
+    def __init__(self, address: Tuple[str, int], linter: WarmLinter):
+        super().__init__(address, LintRequestHandler)
+        self.linter = linter
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parses command-line options for the lint server."""
+    parser = argparse.ArgumentParser(description="Keep the linter loaded and lint Markdown sent over localhost HTTP.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Address to listen on (default: {DEFAULT_HOST}).")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port to listen on (default: {DEFAULT_PORT}).")
+    parser.add_argument("--rulebook", default=lint.RULEBOOK_FILE,
+                        help=f"Rulebook to load and watch for changes (default: {lint.RULEBOOK_FILE}).")
+    parser.add_argument("--chunk-chars", type=int, default=lint.CHUNK_CHARS,
+                        help=f"Lint files larger than this many characters in chunks (default: {lint.CHUNK_CHARS}).")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Loads the rulebook and model, then serves lint requests until interrupted."""
+    args = parse_args(argv)
+    linter = WarmLinter(args.rulebook, args.chunk_chars)
+    if not linter.linting_rules:
+        logging.warning("No linting rules were loaded. Requests will return no findings until the rulebook is fixed.")
+    server = LintServer((args.host, args.port), linter)
+    logging.info(f"Lint server listening on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logging.info("Lint server stopped.")
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -6,24 +6,47 @@ import random
 import time
 import logging
 import re
-from typing import Dict, Optional
+import argparse
+import queue
+import threading
+import hashlib
+import functools
+import urllib.request
+import urllib.error
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import WebDriverException, TimeoutException
+from selenium.common.exceptions import WebDriverException, TimeoutException, SessionNotCreatedException
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium_stealth import stealth
-from bs4 import BeautifulSoup
-from markdownify import markdownify as md
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from markdownify import MarkdownConverter
+import soupsieve
 
 # --- Configuration ---
 CONFIG_FILE: str = 'config.json'
 OUTPUT_DIR: str = 'scraped'  # Updated output directory
 LOG_DIR: str = 'logs'
 MAX_RETRIES: int = 2
+DEFAULT_SESSIONS: int = 1
+DEFAULT_HOST_RATE: float = 0.5   # Requests per second to any one host
+DEFAULT_HOST_BURST: int = 1
+MANIFEST_FILE: str = os.path.join(OUTPUT_DIR, '.manifest.json')
+HTTP_TIMEOUT: int = 30
+HTTP_POOL_SIZE: int = 10
+USER_AGENT: str = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36'
+BROWSER_CACHE_DIR: str = '.scrape_cache'
+DRIVER_CACHE_FILE: str = os.path.join(BROWSER_CACHE_DIR, 'chromedriver.json')
+BROWSER_PROFILE_DIR: str = os.path.join(BROWSER_CACHE_DIR, 'chrome-profile')
+PAGE_LOAD_TIMEOUT: int = 45
 
 # --- Setup Structured Logging ---
 os.makedirs(LOG_DIR, exist_ok=True)
@@ -38,15 +61,320 @@ logging.basicConfig(
 
 # --- Content Cleaning & Detection Configuration ---
 TAGS_TO_EXCLUDE: list[str] = ['nav', 'footer', 'header', 'script', 'style', 'aside', '.noprint', '#sidebar', 'iframe']
+HTML_PARSER: str = 'lxml'
 BLOCK_PAGE_SIGNATURES: list[str] = [
     "access denied", "enable javascript", "checking if the site connection is secure",
     "just a moment...", "verifying you are human", "ddos protection by", "site can’t be reached"
 ]
 
-def initialize_driver() -> Optional[webdriver.Chrome]:
+# --- Lean Browser Profile ---
+# Unless --load-all-resources is given, the browser only fetches what the page's HTML needs: requests for
+# images, fonts, stylesheets and media, and any request to a known analytics or advertising host, are blocked
+# through the DevTools protocol. Pages load with the "eager" strategy, returning once the document is parsed,
+# and the scraper then waits for the target's content selector (or, without one, the end of the page load).
+BLOCKED_RESOURCE_EXTENSIONS: list[str] = [
+    'png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico', 'bmp',
+    'woff', 'woff2', 'ttf', 'otf', 'eot', 'css',
+    'mp4', 'webm', 'ogg', 'mp3', 'm4a', 'wav'
+]
+TRACKER_HOSTS: list[str] = [
+    'google-analytics.com', 'googletagmanager.com', 'googleadservices.com', 'doubleclick.net', 'googlesyndication.com',
+    'facebook.net', 'facebook.com', 'hotjar.com', 'clarity.ms', 'siteimproveanalytics.com', 'siteimproveanalytics.io',
+    'newrelic.com', 'nr-data.net', 'segment.io', 'segment.com', 'linkedin.com', 'licdn.com', 'twitter.com',
+    'ads-twitter.com', 'quantserve.com', 'scorecardresearch.com', 'youtube.com', 'ytimg.com', 'vimeo.com'
+]
+BLOCKED_URL_PATTERNS: list[str] = (
+    [pattern for ext in BLOCKED_RESOURCE_EXTENSIONS for pattern in (f'*.{ext}', f'*.{ext}?*')] +
+    [pattern for host in TRACKER_HOSTS for pattern in (f'*://{host}/*', f'*://*.{host}/*')]
+)
+# Requests and bytes over the network, from the Resource Timing API. Resources served from the browser's
+# cache, and cross-origin resources that do not allow timing, count as 0 bytes.
+PAGE_STATS_SCRIPT: str = """
+const entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+return {requests: entries.length, bytes: entries.reduce((sum, entry) => sum + (entry.transferSize || 0), 0)};
+"""
+
+# --- Per-Host Rate Limiting ---
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` acquisitions per second with bursts of up to `burst`."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Blocks until a token is available and returns the number of seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+class HostRateLimiter:
+    """Keeps one token bucket per host, so concurrent sessions share each host's request budget."""
+
+    def __init__(self, rate: float = DEFAULT_HOST_RATE, burst: int = DEFAULT_HOST_BURST):
+        self.rate = rate
+        self.burst = burst
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, url: str) -> float:
+        """Blocks until a request to the host of `url` is allowed and returns the seconds spent waiting."""
+        host = urlparse(url).netloc.lower()
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = self.buckets[host] = TokenBucket(self.rate, self.burst)
+        return bucket.acquire()
+
+# --- Scrape Manifest ---
+class ScrapeManifest:
+    """
+    Persistent record, per URL, of the HTTP validators (ETag, Last-Modified) and the hash of the Markdown last
+    produced, plus the outputs that changed in the current run. Safe to update from concurrent sessions.
+    With `force`, the recorded validators are not offered for revalidation, so every page is loaded in full,
+    but the run is still recorded.
+    """
+
+    def __init__(self, path: str = MANIFEST_FILE, force: bool = False):
+        self.path = path
+        self.force = force
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.changed: List[str] = []
+        self.unchanged: List[str] = []
+        self.lock = threading.Lock()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.pages = json.load(f).get('pages', {})
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, AttributeError) as e:
+            logging.warning(f"Ignoring unreadable scrape manifest '{path}': {e}")
+
+    def get(self, url: str) -> Dict[str, Any]:
+        """Returns the recorded entry for a URL, or an empty dict."""
+        with self.lock:
+            return dict(self.pages.get(url, {}))
+
+    def record(self, url: str, output: str, etag: Optional[str], last_modified: Optional[str],
+               content_hash: Optional[str], changed: bool) -> None:
+        """Records the validators and content hash of a URL and whether its output changed in this run."""
+        entry = {"output": output, "etag": etag, "lastModified": last_modified, "contentHash": content_hash}
+        with self.lock:
+            self.pages[url] = {key: value for key, value in entry.items() if value is not None}
+            (self.changed if changed else self.unchanged).append(output)
+
+    def save(self) -> None:
+        """Writes the manifest, with the outputs changed in this run listed under "changed"."""
+        with self.lock:
+            data = {"pages": self.pages, "changed": sorted(self.changed)}
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+def revalidate(url: str, entry: Dict[str, Any], rate_limiter: HostRateLimiter) -> Tuple[bool, Optional[str], Optional[str]]:
+    """
+    Sends a conditional HEAD request with the recorded validators. Returns (unchanged, etag, last_modified),
+    where `unchanged` is True only if the server answered 304 Not Modified. Network errors count as changed.
+    """
+    headers = {'User-Agent': USER_AGENT}
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('lastModified'):
+        headers['If-Modified-Since'] = entry['lastModified']
+    rate_limiter.acquire(url)
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers, method='HEAD'), timeout=15) as response:
+            return False, response.headers.get('ETag'), response.headers.get('Last-Modified')
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return True, e.headers.get('ETag') or entry.get('etag'), e.headers.get('Last-Modified') or entry.get('lastModified')
+        logging.info(f"Revalidation of {url} returned HTTP {e.code}; loading it in full.")
+    except Exception as e:
+        logging.info(f"Could not revalidate {url} ({e}); loading it in full.")
+    return False, None, None
+
+def write_if_changed(output_path: str, content: str) -> bool:
+    """Writes content unless the file already holds exactly that text, so unchanged outputs keep their mtime."""
+    try:
+        with open(output_path, 'r', encoding='utf-8', newline='') as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(output_path, 'w', encoding='utf-8', newline='') as f:
+        f.write(content)
+    return True
+
+# --- Plain HTTP Fetching ---
+# Server-rendered pages are fetched with a keep-alive requests.Session (one per thread, each with its own
+# connection pool). The browser is only used for targets marked "render": true, or when the plain response
+# is unusable: an error status, a block page, or HTML without the configured content selector.
+_http_local = threading.local()
+
+def get_http_session() -> requests.Session:
+    """Returns this thread's pooled keep-alive HTTP session."""
+    session = getattr(_http_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({'User-Agent': USER_AGENT, 'Accept': 'text/html,application/xhtml+xml;q=0.9,*/*;q=0.8'})
+        _http_local.session = session
+    return session
+
+def fetch_over_http(url: str, entry: Dict[str, Any], rate_limiter: HostRateLimiter) -> Optional[requests.Response]:
+    """
+    Fetches a page with a conditional GET using the validators in `entry`. Returns the response, which
+    may be 304 Not Modified, or None if the request failed.
+    """
+    headers = {}
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('lastModified'):
+        headers['If-Modified-Since'] = entry['lastModified']
+    rate_limiter.acquire(url)
+    try:
+        return get_http_session().get(url, headers=headers, timeout=HTTP_TIMEOUT)
+    except requests.RequestException as e:
+        logging.info(f"Plain HTTP fetch of {url} failed ({type(e).__name__}).")
+        return None
+
+def response_html(response: requests.Response) -> str:
+    """Decodes a response body, assuming UTF-8 when the server does not declare a charset."""
+    declared = 'charset' in response.headers.get('Content-Type', '').lower()
+    return response.content.decode(response.encoding if declared and response.encoding else 'utf-8', errors='replace')
+
+def browser_escalation_reason(response: requests.Response, html: str) -> Optional[str]:
+    """
+    Returns why a plain HTTP response cannot be used and the page must be rendered, or None if it can.
+    A missing content selector is detected when the page is converted.
+    """
+    if response.status_code != 200:
+        return f"HTTP {response.status_code}"
+    if any(sig in html.lower() for sig in BLOCK_PAGE_SIGNATURES):
+        return "block page signature"
+    return None
+
+# --- Browser Sessions ---
+# The chromedriver resolved by webdriver-manager is recorded in DRIVER_CACHE_FILE, so later runs start it
+# without asking webdriver-manager (and the network) again; if it no longer matches the installed Chrome, it is
+# resolved afresh. Each browser session runs in a persistent profile under BROWSER_PROFILE_DIR, so its HTTP cache
+# and cookies (such as dismissed consent banners) carry over from page to page and from run to run. Concurrent
+# sessions each claim their own profile, since Chrome cannot share one between processes.
+_driver_path: Optional[str] = None
+_driver_path_lock = threading.Lock()
+
+def _read_cached_driver_path() -> Optional[str]:
+    try:
+        with open(DRIVER_CACHE_FILE, 'r', encoding='utf-8') as f:
+            path = json.load(f).get('path')
+    except (OSError, ValueError, AttributeError):
+        return None
+    return path if isinstance(path, str) and os.access(path, os.X_OK) else None
+
+def resolve_driver_path(refresh: bool = False) -> str:
+    """
+    Resolves the chromedriver binary once per run, however many sessions start, reusing the one recorded by an
+    earlier run if it is still there. With `refresh`, it is resolved through webdriver-manager again.
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None or refresh:
+            cached = None if refresh else _read_cached_driver_path()
+            if cached is not None:
+                _driver_path = cached
+                logging.info(f"Using cached chromedriver {cached}")
+            else:
+                start = time.perf_counter()
+                _driver_path = ChromeDriverManager().install()
+                logging.info(f"Resolved chromedriver {_driver_path} in {time.perf_counter() - start:.2f}s")
+                os.makedirs(BROWSER_CACHE_DIR, exist_ok=True)
+                with open(DRIVER_CACHE_FILE, 'w', encoding='utf-8') as f:
+                    json.dump({"path": _driver_path}, f)
+        return _driver_path
+
+class ProfilePool:
+    """Hands out persistent browser profile directories, one per live session, reusing the lowest free one."""
+
+    def __init__(self, root: str = BROWSER_PROFILE_DIR):
+        self.root = root
+        self.in_use: Set[str] = set()
+        self.owners: Dict[int, str] = {}
+        self.lock = threading.Lock()
+
+    def claim(self) -> str:
+        """Claims a free profile directory, creating it if needed."""
+        with self.lock:
+            index = 1
+            while os.path.join(self.root, f"session-{index}") in self.in_use:
+                index += 1
+            path = os.path.join(self.root, f"session-{index}")
+            self.in_use.add(path)
+        os.makedirs(path, exist_ok=True)
+        # A browser that was killed, or a profile restored from another machine's cache, leaves lock files that
+        # would make Chrome refuse the profile; no other session in this process can be using it.
+        for name in ('SingletonLock', 'SingletonSocket', 'SingletonCookie'):
+            try:
+                os.remove(os.path.join(path, name))
+            except FileNotFoundError:
+                pass
+        return path
+
+    def assign(self, driver: webdriver.Chrome, path: str) -> None:
+        with self.lock:
+            self.owners[id(driver)] = path
+
+    def release(self, path: Optional[str] = None, driver: Optional[webdriver.Chrome] = None) -> None:
+        """Frees a profile directory, given directly or as the one assigned to `driver`."""
+        with self.lock:
+            if driver is not None:
+                path = self.owners.pop(id(driver), None)
+            self.in_use.discard(path)
+
+BROWSER_PROFILES = ProfilePool()
+
+class LazyDriver:
+    """Starts a browser session on first use, so runs served entirely over plain HTTP never launch Chrome."""
+
+    def __init__(self, factory: Callable[[], Optional[webdriver.Chrome]]):
+        self.factory = factory
+        self.driver: Optional[webdriver.Chrome] = None
+        self.failed = False
+
+    def get(self) -> Optional[webdriver.Chrome]:
+        """Returns the browser session, starting it if needed, or None if it could not be started."""
+        if self.driver is None and not self.failed:
+            self.driver = self.factory()
+            self.failed = self.driver is None
+        return self.driver
+
+    def quit(self) -> None:
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            finally:
+                BROWSER_PROFILES.release(driver=self.driver)
+
+def initialize_driver(driver_path: Optional[str] = None, block_resources: bool = True) -> Optional[webdriver.Chrome]:
     """
     Initializes a stealth-configured Selenium WebDriver.
     Adds type hinting for clarity on the return type.
+    `driver_path` defaults to the chromedriver resolved once per run by `resolve_driver_path`. The session runs in a
+    persistent profile from BROWSER_PROFILES. With `block_resources`, it uses the lean profile described above.
     """
     chrome_options = webdriver.ChromeOptions()
     chrome_options.add_argument('--headless=new')
@@ -55,13 +383,25 @@ def initialize_driver() -> Optional[webdriver.Chrome]:
     chrome_options.add_argument('--disable-blink-features=AutomationControlled')
     chrome_options.add_argument('--disable-gpu')
     chrome_options.add_argument('--window-size=1920,1080')
-    chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36')
+    chrome_options.add_argument(f'user-agent={USER_AGENT}')
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
+    if block_resources:
+        chrome_options.page_load_strategy = 'eager'
+    profile_dir = BROWSER_PROFILES.claim()
+    chrome_options.add_argument(f'--user-data-dir={os.path.abspath(profile_dir)}')
     
     try:
-        service = ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        start = time.perf_counter()
+        try:
+            driver = webdriver.Chrome(service=ChromeService(driver_path or resolve_driver_path()), options=chrome_options)
+        except SessionNotCreatedException:
+            if driver_path is not None:
+                raise
+            # The cached chromedriver no longer matches the installed Chrome.
+            logging.info("Cached chromedriver could not start a session; resolving it again.")
+            driver = webdriver.Chrome(service=ChromeService(resolve_driver_path(refresh=True)), options=chrome_options)
+        BROWSER_PROFILES.assign(driver, profile_dir)
 
         # Apply selenium-stealth modifications
         stealth(driver,
@@ -72,73 +412,94 @@ def initialize_driver() -> Optional[webdriver.Chrome]:
                 renderer="Intel Iris OpenGL Engine",
                 fix_hairline=True,
         )
+        if block_resources:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        logging.info(f"Started browser session in {time.perf_counter() - start:.2f}s with profile {profile_dir}")
         return driver
     except Exception as e:
+        BROWSER_PROFILES.release(profile_dir)
         logging.error(f"Failed to initialize WebDriver: {e}")
         return None
 
-def clean_html_content(html: str) -> str:
+# --- HTML Cleaning ---
+# Pages are parsed with lxml. When a target's selector is a simple tag, #id or .class selector, only the
+# matching container is built into a tree. Excluded elements are removed in one traversal with a combined
+# selector, and the cleaned tree goes straight to markdownify without being serialised and parsed again.
+EXCLUDE_SELECTOR = soupsieve.compile(', '.join(TAGS_TO_EXCLUDE))
+SIMPLE_SELECTOR = re.compile(r'^([A-Za-z][\w-]*)?(?:#([\w-]+)|\.([\w-]+))?$')
+MARKDOWN_CONVERTER = MarkdownConverter(heading_style="ATX")
+
+def content_strainer(selector: str) -> Optional[SoupStrainer]:
+    """Returns a strainer keeping only the elements a simple selector can match, or None for other selectors."""
+    match = SIMPLE_SELECTOR.match(selector.strip())
+    if not match or not any(match.groups()):
+        return None
+    name, element_id, class_name = match.groups()
+    attrs = {'id': element_id} if element_id else {'class': class_name} if class_name else {}
+    return SoupStrainer(name, attrs=attrs) if name else SoupStrainer(attrs=attrs)
+
+def extract_content(html: str, selector: Optional[str] = None) -> Optional[Tag]:
     """
-    Uses BeautifulSoup to parse HTML and remove unwanted tags.
-    Adds type hinting for input and output strings.
+    Parses a page and returns its content container, the first element matching `selector` or else <body>,
+    with every element in TAGS_TO_EXCLUDE removed. Returns None if there is no such container.
     """
-    soup = BeautifulSoup(html, 'html.parser')
-    page_body = soup.body
-    if page_body:
-        for tag_selector in TAGS_TO_EXCLUDE:
-            for tag in page_body.select(tag_selector):
-                tag.decompose()
-        return str(page_body)
-    return ""
+    if selector:
+        strainer = content_strainer(selector)
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=strainer) if strainer else BeautifulSoup(html, HTML_PARSER)
+        container = soup.select_one(selector)
+    else:
+        container = BeautifulSoup(html, HTML_PARSER).body
+    if container is None:
+        return None
+    for tag in EXCLUDE_SELECTOR.select(container):
+        if not tag.decomposed:  # Skips elements already removed with an excluded ancestor.
+            tag.decompose()
+    return container
 
-def scrape_url(driver: webdriver.Chrome, target: Dict[str, str]) -> None:
+def html_to_markdown(html: str, selector: Optional[str] = None) -> Optional[str]:
+    """Converts the cleaned content container of a page to Markdown, or returns None if it has none."""
+    container = extract_content(html, selector)
+    if container is None:
+        return None
+    # Converted as the only element of a document, as markdownify converts the HTML it parses itself, so the
+    # Markdown is the same as converting the serialised container, without newlines added at either end.
+    document = BeautifulSoup('', HTML_PARSER)
+    document.append(container.extract())
+    return MARKDOWN_CONVERTER.convert_soup(document)
+
+def fetch_with_browser(driver: Union[webdriver.Chrome, LazyDriver], url: str, rate_limiter: HostRateLimiter,
+                       selector: Optional[str] = None) -> Optional[str]:
     """
-    Scrapes a single URL using the provided Selenium driver.
-    Adds type hinting for the driver and target dictionary.
+    Loads a page in the browser, retrying with exponential backoff, and returns its rendered HTML,
+    or None if every attempt failed. Every attempt first waits for the host's token bucket. The page is ready
+    once an element matches `selector`, or without one, once it has finished loading.
     """
-    url = target['url']
-    output_filename = target['output']
-
-    if url.lower().endswith('.pdf'):
-        logging.warning(f"Skipping PDF link: {url}")
-        return
+    if isinstance(driver, LazyDriver):
+        driver = driver.get()
+        if driver is None:
+            logging.error(f"No browser session available to render {url}.")
+            return None
 
-    logging.info(f"Processing URL: {url}")
     for attempt in range(MAX_RETRIES + 1):
         try:
+            waited = rate_limiter.acquire(url)
+            if waited > 0:
+                logging.info(f"Rate limited {url} for {waited:.2f} seconds")
+            start = time.perf_counter()
             driver.get(url)
-            WebDriverWait(driver, 45).until(EC.presence_of_element_located((By.TAG_NAME, 'body')))
-
-            # Human-like interaction
-            logging.info(f"Simulating user interaction for {url}")
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight / 4);")
-            time.sleep(random.uniform(1.5, 3.5))
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight / 2);")
-            time.sleep(random.uniform(1.0, 2.5))
-
-            html_content = driver.page_source
-            
-            if any(sig in html_content.lower() for sig in BLOCK_PAGE_SIGNATURES):
-                logging.warning(f"Block page detected at {url}. Aborting.")
-                return
-
-            cleaned_html = clean_html_content(html_content)
-            
-            if not cleaned_html:
-                logging.warning(f"Could not extract body content from {url}. Skipping.")
-                return
-
-            markdown_content = md(cleaned_html, heading_style="ATX")
-
-            if not os.path.exists(OUTPUT_DIR):
-                os.makedirs(OUTPUT_DIR)
-
-            output_path = os.path.join(OUTPUT_DIR, output_filename)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
-
-            logging.info(f"Successfully saved content to {output_path}")
-            return # Success
+            wait = WebDriverWait(driver, PAGE_LOAD_TIMEOUT)
+            if selector:
+                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+            else:
+                wait.until(EC.presence_of_element_located((By.TAG_NAME, 'body')))
+                wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
+            html = driver.page_source
+            elapsed = time.perf_counter() - start
+            stats = driver.execute_script(PAGE_STATS_SCRIPT) or {}
+            logging.info(f"Rendered {url} in {elapsed:.2f}s ({stats.get('requests', 0)} requests, "
+                         f"{stats.get('bytes', 0) / 1024:.0f} KB transferred)")
+            return html
 
         except TimeoutException:
             logging.error(f"Attempt {attempt + 1}/{MAX_RETRIES + 1}: Timed out loading {url}")
@@ -153,12 +514,197 @@ def scrape_url(driver: webdriver.Chrome, target: Dict[str, str]) -> None:
             time.sleep(wait_time)
         else:
             logging.error(f"Failed to scrape {url} after {MAX_RETRIES + 1} attempts.")
+    return None
 
-def main() -> None:
+def scrape_url(driver: Union[webdriver.Chrome, LazyDriver], target: Dict[str, str], rate_limiter: HostRateLimiter,
+               manifest: Optional[ScrapeManifest] = None, use_http: bool = False) -> Optional[str]:
+    """
+    Scrapes a single URL using the provided Selenium driver.
+    Adds type hinting for the driver and target dictionary.
+    Every request to the page's host (including retries) first waits for its token bucket in `rate_limiter`.
+    With a `manifest`, a page whose server confirms it is unchanged since the last run is skipped (unless the
+    manifest is forced), and the output file is only rewritten if its Markdown changed.
+    With `use_http`, the page is first fetched over plain HTTP and only rendered in the browser if needed.
+    Returns the path of the page's Markdown file once it is up to date on disk, or None if the page was not scraped.
+    """
+    url = target['url']
+    output_filename = target['output']
+
+    if url.lower().endswith('.pdf'):
+        logging.warning(f"Skipping PDF link: {url}")
+        return None
+
+    entry: Dict[str, Any] = {}
+    if manifest is not None and not manifest.force:
+        recorded = manifest.get(url)
+        if recorded.get('output') == output_filename and os.path.exists(os.path.join(OUTPUT_DIR, output_filename)):
+            entry = recorded
+
+    output_path = os.path.join(OUTPUT_DIR, output_filename)
+    etag, last_modified = None, None
+    selector = target.get('selector')
+    markdown_content = None
+    if use_http and not target.get('render'):
+        response = fetch_over_http(url, entry, rate_limiter)
+        if response is not None and response.status_code == 304 and entry:
+            logging.info(f"Not modified since last scrape, skipping: {url}")
+            manifest.record(url, output_filename, entry.get('etag'), entry.get('lastModified'), entry.get('contentHash'), changed=False)
+            return output_path
+        if response is not None:
+            etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+            html = response_html(response)
+            reason = browser_escalation_reason(response, html)
+            if reason is None:
+                markdown_content = html_to_markdown(html, selector)
+                if markdown_content is None:
+                    reason = f"content selector '{selector}' not found" if selector else "no <body>"
+            if reason is None:
+                logging.info(f"Fetched {url} over plain HTTP in {response.elapsed.total_seconds():.2f}s ({len(response.content) / 1024:.0f} KB)")
+            else:
+                # The validators belong to the rejected response, not to the rendered content; recording them could
+                # let a block page answer 304 on later runs and keep the real content from being fetched.
+                etag, last_modified = None, None
+                logging.info(f"Rendering {url} in the browser: {reason}")
+    elif manifest is not None and (entry.get('etag') or entry.get('lastModified')):
+        # The browser exposes no response headers, so a page loaded in it is recorded without validators unless
+        # they come from this revalidation; no request is sent just to collect them.
+        unchanged, etag, last_modified = revalidate(url, entry, rate_limiter)
+        if unchanged:
+            logging.info(f"Not modified since last scrape, skipping: {url}")
+            manifest.record(url, output_filename, etag, last_modified, entry.get('contentHash'), changed=False)
+            return output_path
+
+    logging.info(f"Processing URL: {url}")
+    if markdown_content is None:
+        html_content = fetch_with_browser(driver, url, rate_limiter, selector)
+        if html_content is None:
+            return None
+
+        if any(sig in html_content.lower() for sig in BLOCK_PAGE_SIGNATURES):
+            logging.warning(f"Block page detected at {url}. Aborting.")
+            return None
+
+        markdown_content = html_to_markdown(html_content, selector)
+
+        if markdown_content is None:
+            logging.warning(f"Could not extract body content from {url}. Skipping.")
+            return None
+
+    if not os.path.exists(OUTPUT_DIR):
+        os.makedirs(OUTPUT_DIR)
+
+    if manifest is None:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(markdown_content)
+        logging.info(f"Successfully saved content to {output_path}")
+        return output_path
+
+    changed = write_if_changed(output_path, markdown_content)
+    content_hash = hashlib.sha256(markdown_content.encode('utf-8')).hexdigest()
+    manifest.record(url, output_filename, etag, last_modified, content_hash, changed)
+    if changed:
+        logging.info(f"Successfully saved content to {output_path}")
+    else:
+        logging.info(f"Content unchanged, left {output_path} untouched")
+    return output_path
+
+def scrape_concurrently(targets: List[Dict[str, str]], sessions: int, rate_limiter: HostRateLimiter,
+                        driver_factory: Callable[[], Optional[webdriver.Chrome]] = initialize_driver,
+                        manifest: Optional[ScrapeManifest] = None, use_http: bool = False,
+                        on_document: Optional[Callable[[str], None]] = None) -> None:
+    """
+    Scrapes targets with `sessions` sessions pulling from a shared work queue. Each session is a thread with its
+    own HTTP connection pool and its own driver from `driver_factory`, started the first time it needs to render
+    a page; the rate limiter spaces out requests to each host across all of them. `on_document` is called from
+    the session's thread with the path of each Markdown file as soon as it is up to date.
+    """
+    work: "queue.Queue[Dict[str, str]]" = queue.Queue()
+    for target in targets:
+        work.put(target)
+
+    def worker() -> None:
+        driver = LazyDriver(driver_factory)
+        try:
+            while True:
+                try:
+                    target = work.get_nowait()
+                except queue.Empty:
+                    return
+                output_path = scrape_url(driver, target, rate_limiter, manifest, use_http)
+                if output_path is not None and on_document is not None:
+                    on_document(output_path)
+        finally:
+            driver.quit()
+
+    threads = [threading.Thread(target=worker, name=f"scrape-session-{i + 1}") for i in range(max(1, min(sessions, len(targets))))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def scrape_targets(targets: List[Dict[str, str]], sessions: int, rate_limiter: HostRateLimiter,
+                   manifest: Optional[ScrapeManifest] = None, use_http: bool = False,
+                   on_document: Optional[Callable[[str], None]] = None, block_resources: bool = True) -> None:
+    """
+    Scrapes targets in order with one session, or concurrently with several, calling `on_document` like `scrape_concurrently`.
+    With `block_resources`, browser sessions use the lean profile.
+    """
+    driver_factory = functools.partial(initialize_driver, block_resources=block_resources)
+    if sessions > 1:
+        logging.info(f"Scraping {len(targets)} targets with {sessions} sessions.")
+        scrape_concurrently(targets, sessions, rate_limiter, driver_factory, manifest, use_http, on_document)
+        return
+    driver = LazyDriver(driver_factory)
+    try:
+        for target in targets:
+            output_path = scrape_url(driver, target, rate_limiter, manifest, use_http)
+            if output_path is not None and on_document is not None:
+                on_document(output_path)
+    finally:
+        driver.quit()
+
+def create_rate_limiter(host_rate: float, host_burst: int) -> HostRateLimiter:
+    """Returns the per-host rate limiter every session shares, however many sessions there are."""
+    return HostRateLimiter(host_rate, host_burst)
+
+
+def positive_float(value: str) -> float:
+    """Parses a command-line value that must be a number greater than zero."""
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"expected a number greater than 0, got {value}")
+    return number
+
+def add_scrape_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the scraper's command-line options to `parser`."""
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS,
+                        help=f"Number of concurrent browser sessions (default: {DEFAULT_SESSIONS}).")
+    parser.add_argument("--host-rate", type=positive_float, default=DEFAULT_HOST_RATE,
+                        help=f"Requests per second allowed to each host, across all sessions (default: {DEFAULT_HOST_RATE}).")
+    parser.add_argument("--host-burst", type=int, default=DEFAULT_HOST_BURST,
+                        help=f"Requests allowed to a host in a burst (default: {DEFAULT_HOST_BURST}).")
+    parser.add_argument("--fetch", choices=("auto", "browser"), default="auto",
+                        help="'auto' fetches pages over plain HTTP and renders them in the browser only when needed; "
+                             "'browser' renders every page (default: auto).")
+    parser.add_argument("--load-all-resources", action="store_true",
+                        help="Let the browser load images, fonts, stylesheets, media and trackers and wait for the full page "
+                             "load, instead of blocking them and waiting only for the content selector.")
+    parser.add_argument("--force", action="store_true",
+                        help="Load every page in full, without revalidating it against the scrape manifest. Outputs are still only "
+                             "rewritten if their Markdown changed, and the manifest is updated.")
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parses command-line options for the scraper."""
+    parser = argparse.ArgumentParser(description="Scrape the pages in config.json to Markdown.")
+    add_scrape_arguments(parser)
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> None:
     """
     Main function to orchestrate the scraping process.
     Adds type hinting.
     """
+    args = parse_args(argv)
     try:
         with open(CONFIG_FILE, 'r') as f:
             targets = json.load(f)
@@ -166,18 +712,15 @@ def main() -> None:
         logging.error(f"Configuration file '{CONFIG_FILE}' not found. Exiting.")
         return
 
-    driver = initialize_driver()
-    if not driver:
-        logging.error("Could not start the browser. Aborting scrape.")
-        return
-        
-    try:
-        for target in targets:
-            scrape_url(driver, target)
-    finally:
-        if driver:
-            driver.quit()
-        
+    manifest = ScrapeManifest(force=args.force)
+    if args.force:
+        logging.info("Forced scrape: loading every page without revalidating it.")
+
+    rate_limiter = create_rate_limiter(args.host_rate, args.host_burst)
+    scrape_targets(targets, args.sessions, rate_limiter, manifest, args.fetch == "auto", block_resources=not args.load_all_resources)
+
+    manifest.save()
+    logging.info(f"{len(manifest.changed)} outputs changed, {len(manifest.unchanged)} unchanged: {', '.join(sorted(manifest.changed)) or 'none'}")
     logging.info("Scraping process complete.")
 
 if __name__ == "__main__":
@@ -0,0 +1,69 @@
+# tests/test_chunked_lint.py
+
+"""
+Tests for chunked linting in scripts/lint.py: files are chunked by their length in characters, and linting a file
+in chunks reports the findings of linting it whole. The heuristic parity test parses with the spaCy model and is
+skipped unless it is installed.
+"""
+
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from typing import Any, Dict, List, Tuple
+
+REPO_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+import lint  # noqa: E402
+
+FIXTURES_GLOB: str = os.path.join(REPO_DIR, 'scraped', '*.md')
+RULEBOOK_FILE: str = os.path.join(REPO_DIR, 'Trinity.json')
+CHUNK_SIZES: List[int] = [2000, 500]  # Characters; the fixtures are 1 to 15 KB
+LARGEST_FIXTURES: int = 6
+
+def model_installed() -> bool:
+    import spacy
+    try:
+        spacy.load(lint.SPACY_MODEL)
+    except OSError:
+        return False
+    return True
+
+def finding_keys(findings: List[Dict[str, Any]]) -> List[Tuple[str, int, str, str]]:
+    return sorted((f['fileName'], f['lineNumber'], f['ruleId'], f['offendingText']) for f in findings)
+
+def largest_fixtures() -> List[str]:
+    return sorted(glob.glob(FIXTURES_GLOB), key=os.path.getsize, reverse=True)[:LARGEST_FIXTURES]
+
+class ChunkedLintTest(unittest.TestCase):
+
+    def assert_chunked_parity(self, linting_rules: List[Dict[str, Any]]) -> None:
+        for path in largest_fixtures():
+            file_name = os.path.basename(path)
+            whole = finding_keys(lint.lint_file(path, file_name, linting_rules, chunk_chars=0))
+            for chunk_chars in CHUNK_SIZES:
+                with self.subTest(fixture=file_name, chunk_chars=chunk_chars):
+                    self.assertEqual(finding_keys(lint.lint_file_chunked(path, file_name, linting_rules, chunk_chars)), whole)
+
+    def test_chunking_counts_characters(self) -> None:
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        path = os.path.join(temp_dir, 'page.md')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('é' * 60 + '\n')  # 61 characters in 121 bytes
+        self.assertFalse(lint._needs_chunking(path, 100))
+        self.assertFalse(lint._needs_chunking(path, 61))
+        self.assertTrue(lint._needs_chunking(path, 60))
+        self.assertFalse(lint._needs_chunking(path, 0))
+
+    def test_regex_rules_chunked_like_whole_file(self) -> None:
+        self.assert_chunked_parity(lint.load_rules_from_rulebook(RULEBOOK_FILE, ['*-R-*']))
+
+    @unittest.skipUnless(model_installed(), f"the spaCy model {lint.SPACY_MODEL} is not installed")
+    def test_heuristic_rules_chunked_like_whole_file(self) -> None:
+        self.assert_chunked_parity(lint.load_rules_from_rulebook(RULEBOOK_FILE))
+
+if __name__ == '__main__':
+    unittest.main()
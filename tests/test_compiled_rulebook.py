@@ -0,0 +1,91 @@
+# tests/test_compiled_rulebook.py
+
+"""
+Tests for compiled rulebook artifacts in scripts/lint.py: an artifact is reused while the rulebook and lint.py are
+unchanged, rebuilt when either changes, and a corrupt artifact falls back to compiling the source rulebook.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from typing import Any, Dict, List
+from unittest import mock
+
+REPO_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+import lint  # noqa: E402
+
+def rulebook(*words: str) -> List[Dict[str, Any]]:
+    return [{"RuleSet": "Test", "rules": [
+        {"id": f"TEST-R-{index:03d}", "category": "regex", "severity": "warn", "message": f"Avoid {word}.", "pattern": fr"\b{word}\b"}
+        for index, word in enumerate(words, 1)
+    ]}]
+
+class CompiledRulebookTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.artifact_dir = os.path.join(self.temp_dir, 'rulebooks')
+        self.rulebook_file = os.path.join(self.temp_dir, 'Test.json')
+        self.write_rulebook(rulebook("utilise"))
+
+    def write_rulebook(self, rule_sets: List[Dict[str, Any]]) -> None:
+        with open(self.rulebook_file, 'w', encoding='utf-8') as f:
+            json.dump(rule_sets, f)
+
+    def load(self) -> Dict[str, Any]:
+        """Loads the rulebook, returning its compiled form and whether it had to be compiled."""
+        with mock.patch.object(lint, 'compile_rulebook', wraps=lint.compile_rulebook) as compile_rulebook:
+            compiled = lint.load_compiled_rulebook(self.rulebook_file, self.artifact_dir)
+        return {"ids": [spec['id'] for spec in compiled['rules']], "compiled": compile_rulebook.called}
+
+    def artifacts(self) -> List[str]:
+        return sorted(os.listdir(self.artifact_dir))
+
+    def test_unchanged_rulebook_reuses_the_artifact(self) -> None:
+        self.assertEqual(self.load(), {"ids": ["TEST-R-001"], "compiled": True})
+        self.assertEqual(self.load(), {"ids": ["TEST-R-001"], "compiled": False})
+        self.assertEqual(len(self.artifacts()), 1)
+
+    def test_edited_rulebook_is_recompiled(self) -> None:
+        self.load()
+        self.write_rulebook(rulebook("utilise", "leverage"))
+        self.assertEqual(self.load(), {"ids": ["TEST-R-001", "TEST-R-002"], "compiled": True})
+        self.assertEqual(self.load()["compiled"], False)
+        self.assertEqual(len(self.artifacts()), 2)
+
+    def test_edited_linter_is_recompiled(self) -> None:
+        self.load()
+        edited_linter = os.path.join(self.temp_dir, 'lint.py')
+        with open(lint.__file__, 'r', encoding='utf-8') as f:
+            source = f.read()
+        with open(edited_linter, 'w', encoding='utf-8') as f:
+            f.write(source + "\n# An edit.\n")
+        with mock.patch.object(lint, '__file__', edited_linter):
+            self.assertEqual(self.load(), {"ids": ["TEST-R-001"], "compiled": True})
+        self.assertEqual(len(self.artifacts()), 2)
+
+    def test_corrupt_artifact_falls_back_to_the_rulebook(self) -> None:
+        self.load()
+        artifact_path = lint.compiled_rulebook_path(self.rulebook_file, self.artifact_dir)
+        for name, corrupt in (("truncated", '{"rules": [{"id": "TEST-R-0'), ("not a compiled rulebook", '[]'), ("empty", '')):
+            with self.subTest(artifact=name):
+                with open(artifact_path, 'w', encoding='utf-8') as f:
+                    f.write(corrupt)
+                self.assertEqual(self.load(), {"ids": ["TEST-R-001"], "compiled": True})
+                # The rebuilt artifact replaced the corrupt one.
+                self.assertEqual(self.load(), {"ids": ["TEST-R-001"], "compiled": False})
+
+    def test_rules_from_a_corrupt_artifact_lint_like_the_rulebook(self) -> None:
+        expected = lint.compile_rulebook(lint.read_rule_sets(self.rulebook_file))
+        os.makedirs(self.artifact_dir)
+        with open(lint.compiled_rulebook_path(self.rulebook_file, self.artifact_dir), 'w', encoding='utf-8') as f:
+            f.write('{')
+        self.assertEqual(lint.load_compiled_rulebook(self.rulebook_file, self.artifact_dir), expected)
+
+if __name__ == '__main__':
+    unittest.main()
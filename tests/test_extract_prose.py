@@ -0,0 +1,60 @@
+# tests/test_extract_prose.py
+
+"""
+Tests for `extract_prose` in scripts/lint.py: Markdown markup is removed from the prose the heuristic checks
+parse, while every source line keeps its place, so prose offsets still map to source line numbers.
+"""
+
+import os
+import sys
+import unittest
+from typing import List
+
+REPO_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+import lint  # noqa: E402
+
+# A link whose text spans a heading and a paragraph, as on the scraped options listing pages.
+MULTI_LINE_LINK: str = """Displaying 1 - 9 of 72
+
+[Apply for a patent
+
+## Apply for a patent to protect your invention
+
+Prepare and submit formal patent applications.](/options/apply-patent-protect-your-invention)
+
+Read the `guide` and ![a
+diagram](diagram.png) first."""
+
+class ExtractProseTest(unittest.TestCase):
+
+    def assert_lines_kept(self, content: str, prose: str, line_offsets: List[int]) -> None:
+        source_lines = content.splitlines()
+        self.assertEqual(prose.count('\n') + 1, len(source_lines))
+        for line_num, line in enumerate(prose.split('\n'), 1):
+            if line:
+                self.assertEqual(lint.get_line_number_from_offset(prose.index(line), line_offsets), line_num)
+                self.assertIn(line.split()[0], source_lines[line_num - 1])
+
+    def test_single_line_markup(self) -> None:
+        content = "# Title\n\n- A [link](https://example.com) with **bold** text.\n| a | b |\n| --- | --- |"
+        prose, line_offsets = lint.extract_prose(content)
+        self.assertEqual(prose, "Title\n\nA link with bold text.\na b\n")
+        self.assert_lines_kept(content, prose, line_offsets)
+
+    def test_multi_line_link(self) -> None:
+        prose, line_offsets = lint.extract_prose(MULTI_LINE_LINK)
+        self.assertNotIn('](', prose)
+        self.assertNotIn('[', prose)
+        self.assertNotIn('diagram', prose)
+        self.assertEqual(prose.split('\n')[6], "Prepare and submit formal patent applications.")
+        self.assertEqual(prose.split('\n')[8:], ["Read the and", "first."])
+        self.assert_lines_kept(MULTI_LINE_LINK, prose, line_offsets)
+
+    def test_empty_content(self) -> None:
+        prose, line_offsets = lint.extract_prose('')
+        self.assertEqual(prose, '')
+        self.assertEqual(list(line_offsets), [0])
+
+if __name__ == '__main__':
+    unittest.main()
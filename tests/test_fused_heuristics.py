@@ -0,0 +1,112 @@
+# tests/test_fused_heuristics.py
+
+"""
+Tests for the fused heuristic engine in scripts/lint.py: running every heuristic check in one traversal of a
+document gives each check the findings it gets when run on its own, and a check shared by several rule IDs runs
+once. The checks run on the fixtures' prose parsed by a sentencizer with lowercase lemmas, and, when the spaCy
+model is installed, on the model's parse.
+"""
+
+import functools
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from typing import Any, Dict, List
+from unittest import mock
+
+REPO_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+import lint  # noqa: E402
+
+FIXTURES_GLOB: str = os.path.join(REPO_DIR, 'scraped', '*.md')
+RULEBOOK_FILE: str = os.path.join(REPO_DIR, 'Trinity.json')
+
+def model_installed() -> bool:
+    import spacy
+    try:
+        spacy.load(lint.SPACY_MODEL)
+    except OSError:
+        return False
+    return True
+
+def sentencized(text: str):
+    """Parses text into sentences, with each token's lemma set to its lowercase text, without the spaCy model."""
+    import spacy
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    doc = nlp(text)
+    for token in doc:
+        token.lemma_ = token.lower_
+    return doc
+
+class FusedHeuristicsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.temp_dir = tempfile.mkdtemp()
+        load = functools.partial(lint.load_compiled_rulebook, artifact_dir=os.path.join(cls.temp_dir, 'rulebooks'))
+        with mock.patch.object(lint, 'load_compiled_rulebook', load):
+            pattern_rules = [rule for rule in lint.load_rules_from_rulebook(RULEBOOK_FILE) if rule.get('type') == 'heuristic']
+        # Every distinct check once, in the order of HEURISTIC_CHECKS, then the rulebook's pattern checks.
+        cls.checks = list(dict.fromkeys(lint.HEURISTIC_CHECKS.values())) + [rule['check'] for rule in pattern_rules]
+        cls.prose = []
+        for path in sorted(glob.glob(FIXTURES_GLOB)):
+            with open(path, 'r', encoding='utf-8') as f:
+                cls.prose.append((os.path.basename(path), *lint.extract_prose(f.read())))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def assert_fused_like_each_check(self, parse) -> None:
+        found = set()
+        for file_name, prose, line_offsets in self.prose:
+            doc = parse(prose)
+            results, errors = lint.run_heuristic_checks(doc, line_offsets, self.checks)
+            for check in self.checks:
+                with self.subTest(file=file_name, check=check.__name__):
+                    try:
+                        alone = check(doc, line_offsets)
+                    except Exception as e:
+                        self.assertIn(check, errors)
+                        self.assertEqual(type(errors[check]), type(e))
+                        continue
+                    self.assertNotIn(check, errors)
+                    self.assertEqual(results[check], alone)
+                    if alone:
+                        found.add(check)
+        self.assertGreaterEqual(len(found), 3, "too few checks found anything to compare")
+
+    def test_fused_like_each_check_on_sentences(self) -> None:
+        self.assert_fused_like_each_check(sentencized)
+
+    @unittest.skipUnless(model_installed(), f"the spaCy model {lint.SPACY_MODEL} is not installed")
+    def test_fused_like_each_check_on_the_model_parse(self) -> None:
+        self.assert_fused_like_each_check(lint.load_spacy_model())
+
+    def test_shared_check_runs_once(self) -> None:
+        doc = sentencized("It is an car! A apple a day, e.g. an orange.")
+        shared = lint.HEURISTIC_CHECKS["APS-GPC-Determiners-R-001"]
+        rule_ids = [rule_id for rule_id, check in lint.HEURISTIC_CHECKS.items() if check is shared]
+        self.assertEqual(len(rule_ids), 6)
+        callback = mock.Mock(wraps=lint.TOKEN_CALLBACKS[shared])
+        with mock.patch.dict(lint.TOKEN_CALLBACKS, {shared: callback}):
+            results, errors = lint.run_heuristic_checks(doc, [0], [lint.HEURISTIC_CHECKS[rule_id] for rule_id in rule_ids])
+        self.assertEqual(errors, {})
+        self.assertEqual(callback.call_count, len(doc))
+        self.assertEqual([finding['offending_text'] for finding in results[shared]], ["an car", "A apple"])
+
+    def test_failing_check_keeps_the_others(self) -> None:
+        doc = sentencized("It is great! A apple a day.")
+        failing = lint.HEURISTIC_CHECKS["APS-GPC-Exclamationmarks-H-001"]
+        shared = lint.HEURISTIC_CHECKS["APS-GPC-Determiners-R-001"]
+        with mock.patch.dict(lint.TOKEN_CALLBACKS, {failing: mock.Mock(side_effect=ValueError("broken"))}):
+            results, errors = lint.run_heuristic_checks(doc, [0], [failing, shared])
+        self.assertEqual(list(errors), [failing])
+        self.assertEqual([finding['offending_text'] for finding in results[shared]], ["A apple"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+# tests/test_incremental_lint.py
+
+"""
+Tests for incremental linting in scripts/lint.py: a file edited after it was linted, and linted again with
+--incremental, gets the findings of a cold lint of the edited file. The heuristic test parses with the spaCy
+model and is skipped unless it is installed.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from typing import Any, Callable, Dict, List, Tuple
+
+REPO_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+import lint  # noqa: E402
+
+FIXTURE_FILE: str = os.path.join(REPO_DIR, 'scraped', 'Infringement101.md')
+RULEBOOK_FILE: str = os.path.join(REPO_DIR, 'Trinity.json')
+
+def model_installed() -> bool:
+    import spacy
+    try:
+        spacy.load(lint.SPACY_MODEL)
+    except OSError:
+        return False
+    return True
+
+def finding_keys(findings: List[Dict[str, Any]]) -> List[Tuple[str, int, str, str, str]]:
+    return sorted((f['fileName'], f['lineNumber'], f['ruleId'], f['offendingText'], f['githubUrl']) for f in findings)
+
+def paragraph_starts(lines: List[str]) -> List[int]:
+    return [index for index, line in enumerate(lines) if line.strip() and (index == 0 or not lines[index - 1].strip())]
+
+def edit_sentence(lines: List[str]) -> List[str]:
+    index = paragraph_starts(lines)[len(paragraph_starts(lines)) * 2 // 5]
+    return lines[:index] + [lines[index] + " Its owner basically utilise it only on weekends!"] + lines[index + 1:]
+
+def insert_paragraph(lines: List[str]) -> List[str]:
+    index = paragraph_starts(lines)[len(paragraph_starts(lines)) * 3 // 5]
+    return lines[:index] + ["A new paragraph was inserted here, i.e. by an edit. It are very unique.", ""] + lines[index:]
+
+def delete_paragraph(lines: List[str]) -> List[str]:
+    starts = paragraph_starts(lines)
+    index = len(starts) // 5
+    return lines[:starts[index]] + lines[starts[index + 1]:]
+
+EDITS: Dict[str, Callable[[List[str]], List[str]]] = {
+    "edited sentence": edit_sentence,
+    "inserted paragraph": insert_paragraph,
+    "deleted paragraph": delete_paragraph,
+    "all three": lambda lines: delete_paragraph(insert_paragraph(edit_sentence(lines))),
+}
+
+class IncrementalLintTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        with open(FIXTURE_FILE, 'r', encoding='utf-8') as f:
+            self.original = f.read()
+
+    def lint_page(self, content: str, linting_rules: List[Dict[str, Any]], cache_dir: str = '') -> List[Dict[str, Any]]:
+        path = os.path.join(self.temp_dir, 'page.md')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        cache = lint.create_lint_cache(linting_rules, cache_dir) if cache_dir else None
+        return [finding for _, findings in lint.lint_files([(path, 'page.md')], linting_rules, cache=cache, incremental=True)
+                for finding in findings]
+
+    def assert_incremental_parity(self, linting_rules: List[Dict[str, Any]]) -> None:
+        for name, edit in EDITS.items():
+            with self.subTest(edit=name):
+                cache_dir = os.path.join(self.temp_dir, name)
+                self.lint_page(self.original, linting_rules, cache_dir)
+                edited = '\n'.join(edit(self.original.splitlines())) + '\n'
+                with self.assertLogs(level='INFO') as logs:
+                    incremental = self.lint_page(edited, linting_rules, cache_dir)
+                self.assertTrue(any("Re-linted" in message for message in logs.output), "the file was not linted incrementally")
+                self.assertEqual(finding_keys(incremental), finding_keys(self.lint_page(edited, linting_rules)))
+
+    def test_regex_rules_incremental_like_cold_lint(self) -> None:
+        self.assert_incremental_parity(lint.load_rules_from_rulebook(RULEBOOK_FILE, ['*-R-*']))
+
+    @unittest.skipUnless(model_installed(), f"the spaCy model {lint.SPACY_MODEL} is not installed")
+    def test_heuristic_rules_incremental_like_cold_lint(self) -> None:
+        self.assert_incremental_parity(lint.load_rules_from_rulebook(RULEBOOK_FILE))
+
+if __name__ == '__main__':
+    unittest.main()
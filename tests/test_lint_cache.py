@@ -0,0 +1,104 @@
+# tests/test_lint_cache.py
+
+"""
+Tests for the lint cache in scripts/lint.py: a file linted again is a hit with the same findings, edited content
+or other rules are a miss, and eviction and clearing remove least recently used entries but never the compiled
+rulebooks kept in the same directory.
+"""
+
+import functools
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from typing import Any, Dict, List, Optional
+from unittest import mock
+
+REPO_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+import lint  # noqa: E402
+
+FIXTURE_FILE: str = os.path.join(REPO_DIR, 'scraped', 'Infringement101.md')
+RULEBOOK_FILE: str = os.path.join(REPO_DIR, 'Trinity.json')
+
+class LintCacheTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.cache_dir = os.path.join(self.temp_dir, 'cache')
+        self.artifact_dir = os.path.join(self.cache_dir, 'rulebooks')
+        load = functools.partial(lint.load_compiled_rulebook, artifact_dir=self.artifact_dir)
+        patcher = mock.patch.object(lint, 'load_compiled_rulebook', load)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.linting_rules = lint.load_rules_from_rulebook(RULEBOOK_FILE, ['*-R-*'])
+        self.page = os.path.join(self.temp_dir, 'page.md')
+        shutil.copyfile(FIXTURE_FILE, self.page)
+
+    def lint_page(self, cache: lint.LintCache) -> List[Dict[str, Any]]:
+        return lint.lint_file(self.page, 'page.md', self.linting_rules, cache=cache)
+
+    def cache(self, linting_rules: Optional[List[Dict[str, Any]]] = None) -> lint.LintCache:
+        return lint.create_lint_cache(linting_rules or self.linting_rules, self.cache_dir)
+
+    def artifacts(self) -> List[str]:
+        return sorted(os.listdir(self.artifact_dir))
+
+    def test_hit_returns_the_findings_of_the_miss(self) -> None:
+        cold = self.cache()
+        findings = self.lint_page(cold)
+        self.assertTrue(findings)
+        self.assertEqual((cold.hits, cold.misses), (0, 1))
+        warm = self.cache()
+        self.assertEqual(self.lint_page(warm), findings)
+        self.assertEqual((warm.hits, warm.misses), (1, 0))
+
+    def test_edited_content_is_a_miss(self) -> None:
+        self.lint_page(self.cache())
+        with open(self.page, 'a', encoding='utf-8') as f:
+            f.write("\nA new line, e.g. this one.\n")
+        cache = self.cache()
+        findings = self.lint_page(cache)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        self.assertEqual(findings, lint.lint_file(self.page, 'page.md', self.linting_rules))
+
+    def test_other_rules_are_a_miss(self) -> None:
+        self.lint_page(self.cache())
+        other_rules = self.linting_rules[:len(self.linting_rules) // 2]
+        cache = self.cache(other_rules)
+        self.assertEqual(lint.lint_file(self.page, 'page.md', other_rules, cache=cache),
+                         lint.lint_file(self.page, 'page.md', other_rules))
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+    def test_clear_keeps_the_compiled_rulebooks(self) -> None:
+        self.lint_page(self.cache())
+        artifacts = self.artifacts()
+        self.assertTrue(artifacts)
+        self.cache().clear()
+        self.assertEqual(self.artifacts(), artifacts)
+        cache = self.cache()
+        self.lint_page(cache)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+    def test_evicts_least_recently_used_entries_only(self) -> None:
+        cache = self.cache()
+        for age, content in enumerate(["oldest", "older", "newest"]):
+            content_hash = lint.LintCache.hash_content(content)
+            cache.put_findings(content_hash, [])
+            path = cache._path('findings', content_hash, cache.rules_fingerprint, cache.model_fingerprint)
+            os.utime(path, (1_000_000_000 + age, 1_000_000_000 + age))
+        artifacts = self.artifacts()
+        artifact_size = sum(os.path.getsize(os.path.join(self.artifact_dir, name)) for name in artifacts)
+        # The bound holds one entry, far less than the compiled rulebook, which must not count towards it.
+        cache.max_bytes = len(b"[]")
+        self.assertGreater(artifact_size, cache.max_bytes)
+        cache.evict()
+        self.assertEqual(self.artifacts(), artifacts)
+        self.assertIsNone(cache.get_findings(lint.LintCache.hash_content("oldest"), 'page.md'))
+        self.assertIsNone(cache.get_findings(lint.LintCache.hash_content("older"), 'page.md'))
+        self.assertEqual(cache.get_findings(lint.LintCache.hash_content("newest"), 'page.md'), [])
+
+if __name__ == '__main__':
+    unittest.main()
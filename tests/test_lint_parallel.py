@@ -0,0 +1,62 @@
+# tests/test_lint_parallel.py
+
+"""
+Tests for linting in worker processes in scripts/lint.py, with the regex rules of Trinity.json so no spaCy model
+is needed: the findings match linting in one process, and the workers' lint cache hits and misses are counted.
+"""
+
+import functools
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+REPO_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+import lint  # noqa: E402
+
+FIXTURES_GLOB: str = os.path.join(REPO_DIR, 'scraped', '*.md')
+RULEBOOK_FILE: str = os.path.join(REPO_DIR, 'Trinity.json')
+REGEX_RULES: list = ['*-R-*']  # Rule ID patterns selecting the regex rules only
+JOBS: int = 2
+
+class ParallelLintTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        # Workers are forked from this process, so they compile the rulebook into the temporary directory too.
+        load = functools.partial(lint.load_compiled_rulebook, artifact_dir=os.path.join(self.temp_dir, 'rulebooks'))
+        patcher = mock.patch.object(lint, 'load_compiled_rulebook', load)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.linting_rules = lint.load_rules_from_rulebook(RULEBOOK_FILE, REGEX_RULES)
+        self.files = [(path, os.path.basename(path)) for path in sorted(glob.glob(FIXTURES_GLOB))]
+        self.cache_settings = (os.path.join(self.temp_dir, 'cache'), lint.CACHE_MAX_MB)
+
+    def lint_parallel(self, cache: lint.LintCache) -> dict:
+        return dict(lint.lint_files_parallel(self.files, JOBS, cache_settings=self.cache_settings, rulebook_file=RULEBOOK_FILE,
+                                             rule_ids=REGEX_RULES, cache=cache))
+
+    def test_rules_and_fixtures_loaded(self) -> None:
+        self.assertTrue(self.linting_rules)
+        self.assertFalse(lint._has_heuristics(self.linting_rules))
+        self.assertGreater(len(self.files), 1)
+
+    def test_findings_match_one_process(self) -> None:
+        expected = dict(lint.lint_files(self.files, self.linting_rules))
+        self.assertEqual(self.lint_parallel(lint.create_lint_cache(self.linting_rules, *self.cache_settings)), expected)
+
+    def test_worker_cache_counters(self) -> None:
+        cold = lint.create_lint_cache(self.linting_rules, *self.cache_settings)
+        self.lint_parallel(cold)
+        self.assertEqual((cold.hits, cold.misses), (0, len(self.files)))
+        warm = lint.create_lint_cache(self.linting_rules, *self.cache_settings)
+        self.lint_parallel(warm)
+        self.assertEqual((warm.hits, warm.misses), (len(self.files), 0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+# tests/test_lint_profile.py
+
+"""
+Tests for --profile in scripts/lint.py: profiling leaves the findings unchanged, records for every rule on every
+file the findings it reported and the lines it scanned, splits the time of a shared check between its rules, and
+flags rules over the time budget in the profile artifact and the log.
+"""
+
+import functools
+import glob
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from unittest import mock
+
+REPO_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+import lint  # noqa: E402
+
+FIXTURES_GLOB: str = os.path.join(REPO_DIR, 'scraped', '*.md')
+RULEBOOK_FILE: str = os.path.join(REPO_DIR, 'Trinity.json')
+HEURISTIC_RULE_IDS: List[str] = ["APS-GPC-Determiners-R-001", "APS-GPC-Determiners-R-002", "APS-GPC-Exclamationmarks-H-001"]
+
+def lint_all(files: List[Tuple[str, str]], linting_rules: List[Dict[str, Any]],
+             profile: Optional[lint.LintProfile] = None) -> Dict[str, List[Dict[str, Any]]]:
+    return {file_name: findings for file_name, findings in lint.lint_files(files, linting_rules, profile=profile)}
+
+class LintProfileTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        load = functools.partial(lint.load_compiled_rulebook, artifact_dir=os.path.join(self.temp_dir, 'rulebooks'))
+        patcher = mock.patch.object(lint, 'load_compiled_rulebook', load)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.files = [(path, os.path.basename(path)) for path in sorted(glob.glob(FIXTURES_GLOB))]
+
+    def heuristic_rules(self) -> List[Dict[str, Any]]:
+        rulebook_file = os.path.join(self.temp_dir, 'heuristics.json')
+        with open(rulebook_file, 'w', encoding='utf-8') as f:
+            json.dump([{"RuleSet": "Test", "rules": [{"id": rule_id, "category": "heuristic", "severity": "warn", "message": "Check it."}
+                                                     for rule_id in HEURISTIC_RULE_IDS]}], f)
+        return lint.load_rules_from_rulebook(rulebook_file)
+
+    def stand_in_model(self):
+        import spacy
+        model = spacy.blank("en")
+        model.add_pipe("sentencizer")
+        return model
+
+    def test_regex_rules_profile_their_findings(self) -> None:
+        linting_rules = lint.load_rules_from_rulebook(RULEBOOK_FILE, ['*-R-*'])
+        profile = lint.LintProfile()
+        profiled = lint_all(self.files, linting_rules, profile)
+        self.assertEqual(profiled, lint_all(self.files, linting_rules))
+        rule_ids = {rule['id'] for rule in linting_rules}
+        for path, file_name in self.files:
+            with self.subTest(file=file_name):
+                with open(path, 'r', encoding='utf-8') as f:
+                    line_count = len(f.read().splitlines())
+                stats = profile.rules[file_name]
+                self.assertEqual(set(stats), rule_ids)
+                found = Counter(finding['ruleId'] for finding in profiled[file_name])
+                self.assertEqual({rule_id: int(s[3]) for rule_id, s in stats.items() if s[3]}, dict(found))
+                self.assertTrue(all(0 <= s[1] == s[2] <= line_count for s in stats.values()))
+                self.assertTrue(any(s[1] for s in stats.values()))
+
+    def test_shared_check_time_is_split_between_its_rules(self) -> None:
+        linting_rules = self.heuristic_rules()
+        profile = lint.LintProfile()
+        with mock.patch.object(lint, 'load_spacy_model', return_value=self.stand_in_model()):
+            profiled = lint_all(self.files, linting_rules, profile)
+            self.assertEqual(profiled, lint_all(self.files, linting_rules))
+        self.assertEqual(set(profile.parse_seconds), {file_name for _, file_name in self.files})
+        for _, file_name in self.files:
+            with self.subTest(file=file_name):
+                first, second, exclamation = (profile.rules[file_name][rule_id] for rule_id in HEURISTIC_RULE_IDS)
+                self.assertEqual(first[:3], second[:3])
+                self.assertGreater(first[1], 0)
+                self.assertEqual(exclamation[1], first[1], "both checks run once per token")
+                found = Counter(finding['ruleId'] for finding in profiled[file_name])
+                self.assertEqual([int(stats[3]) for stats in (first, second, exclamation)], [found[rule_id] for rule_id in HEURISTIC_RULE_IDS])
+
+    def test_rules_over_budget_are_flagged(self) -> None:
+        profile = lint.LintProfile()
+        profile.add_rule('a.md', 'SLOW', 0.3, 1, 10, 2)
+        profile.add_rule('b.md', 'SLOW', 0.1, 1, 5, 0)
+        profile.add_rule('a.md', 'FAST', 0.001, 4, 10, 1)
+        profile.add_parse('a.md', 0.02)
+        other = lint.LintProfile()
+        other.merge(profile)
+        profile_file = os.path.join(self.temp_dir, 'profile.json')
+        with self.assertLogs(level='INFO') as logs:
+            other.write(profile_file, top_n=1, budget_ms=250)
+        with open(profile_file, 'r', encoding='utf-8') as f:
+            written = json.load(f)
+        self.assertEqual(list(written['rules']), ['SLOW', 'FAST'])
+        self.assertEqual(written['rules']['SLOW'], {"timeMs": 400.0, "calls": 2, "linesScanned": 15, "findings": 2,
+                                                    "slowestFile": 'a.md', "slowestFileMs": 300.0, "overBudget": True})
+        self.assertFalse(written['rules']['FAST']['overBudget'])
+        self.assertEqual(written['files']['a.md']['parseMs'], 20.0)
+        self.assertEqual(len([message for message in logs.output if "Slowest rules" in message]), 1)
+        self.assertTrue(any("Rule 'SLOW' took 300.0 ms on a.md" in message for message in logs.output))
+        self.assertFalse(any("Rule 'FAST'" in message for message in logs.output))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+# tests/test_lint_server.py
+
+"""
+Tests for the lint server in scripts/lint_server.py, run on a local port with a small regex-only rulebook so no
+spaCy model is needed: malformed requests are rejected, and a rulebook edit that cannot be compiled keeps the
+last good rules.
+"""
+
+import functools
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+from typing import Any, Dict, Tuple
+from unittest import mock
+
+REPO_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+import lint  # noqa: E402
+import lint_server  # noqa: E402
+
+RULEBOOK: list = [{"RuleSet": "Test", "rules": [
+    {"id": "TEST-R-001", "category": "regex", "severity": "warn", "pattern": r"\butilise\b", "message": "Use 'use'."},
+]}]
+
+class LintServerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        load = functools.partial(lint.load_compiled_rulebook, artifact_dir=os.path.join(self.temp_dir, 'rulebooks'))
+        patcher = mock.patch.object(lint, 'load_compiled_rulebook', load)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.rulebook_file = os.path.join(self.temp_dir, 'rulebook.json')
+        self.writes = 0
+        self.write_rulebook(RULEBOOK)
+        self.linter = lint_server.WarmLinter(self.rulebook_file)
+        self.server = lint_server.LintServer(('127.0.0.1', 0), self.linter)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def write_rulebook(self, rule_sets: Any) -> None:
+        # A distinct modification time, so the server sees every rewrite as a change.
+        with open(self.rulebook_file, 'w', encoding='utf-8') as f:
+            json.dump(rule_sets, f)
+        self.writes += 1
+        stamp = time.time_ns() + self.writes * 1_000_000_000
+        os.utime(self.rulebook_file, ns=(stamp, stamp))
+
+    def post(self, body: Any) -> Tuple[int, Dict[str, Any]]:
+        request = urllib.request.Request(f"http://127.0.0.1:{self.server.server_port}/lint",
+                                         data=json.dumps(body).encode('utf-8'), method='POST')
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                return response.status, json.load(response)
+        except urllib.error.HTTPError as e:
+            return e.code, json.load(e)
+
+    def test_lints_text(self) -> None:
+        status, body = self.post({"text": "We utilise it.", "fileName": "page.md"})
+        self.assertEqual(status, 200)
+        self.assertEqual([(f['ruleId'], f['lineNumber']) for f in body['findings']], [("TEST-R-001", 1)])
+
+    def test_paths_must_be_a_list_of_strings(self) -> None:
+        for paths in ("scraped", [None], ["page.md", 1], {"path": "page.md"}):
+            with self.subTest(paths=paths):
+                status, body = self.post({"paths": paths})
+                self.assertEqual(status, 400)
+                self.assertIn("'paths'", body['error'])
+
+    def test_uncompilable_rulebook_keeps_last_good_rules(self) -> None:
+        for rule_sets in ([1], [{"rules": "TEST"}], [{"rules": [{"category": "regex", "pattern": 5}]}]):
+            with self.subTest(rulebook=rule_sets):
+                self.write_rulebook(rule_sets)
+                status, body = self.post({"text": "We utilise it."})
+                self.assertEqual(status, 200)
+                self.assertEqual(body['rules'], 1)
+                self.assertEqual(len(body['findings']), 1)
+
+if __name__ == '__main__':
+    unittest.main()
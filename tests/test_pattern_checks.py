@@ -0,0 +1,78 @@
+# tests/test_pattern_checks.py
+
+"""
+Tests for declarative pattern heuristics in scripts/lint.py: each loaded rulebook's checks are answered by its own
+matcher, and a matcher is freed with the rules that use it, so reloading a rulebook does not accumulate matchers.
+"""
+
+import functools
+import gc
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import weakref
+from typing import Any, Dict, List
+from unittest import mock
+
+REPO_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+import lint  # noqa: E402
+
+def phrase_rulebook(phrase: str) -> List[Dict[str, Any]]:
+    return [{"RuleSet": "Test", "rules": [
+        {"id": "TEST-H-001", "category": "heuristic", "severity": "warn", "message": "Avoid it.", "phrases": [phrase]},
+    ]}]
+
+class PatternCheckTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        load = functools.partial(lint.load_compiled_rulebook, artifact_dir=os.path.join(self.temp_dir, 'rulebooks'))
+        patcher = mock.patch.object(lint, 'load_compiled_rulebook', load)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def load_rules(self, rule_sets: List[Dict[str, Any]], name: str) -> List[Dict[str, Any]]:
+        rulebook_file = os.path.join(self.temp_dir, f"{name}.json")
+        with open(rulebook_file, 'w', encoding='utf-8') as f:
+            json.dump(rule_sets, f)
+        return lint.load_rules_from_rulebook(rulebook_file)
+
+    def findings(self, rules: List[Dict[str, Any]], text: str) -> List[Dict[str, Any]]:
+        import spacy
+        return lint.lint_content(text, 'page.md', rules, spacy.blank("en")(text))
+
+    def test_each_rulebook_uses_its_own_matcher(self) -> None:
+        old_rules = self.load_rules(phrase_rulebook("utilise"), 'old')
+        new_rules = self.load_rules(phrase_rulebook("leverage"), 'new')
+        text = "We utilise it.\nWe leverage it."
+        self.assertEqual([f['lineNumber'] for f in self.findings(old_rules, text)], [1])
+        self.assertEqual([f['lineNumber'] for f in self.findings(new_rules, text)], [2])
+
+    def test_matcher_freed_with_its_rules(self) -> None:
+        rules = self.load_rules(phrase_rulebook("utilise"), 'rulebook')
+        matcher = weakref.ref(rules[0]['check'].matcher)
+        del rules
+        gc.collect()
+        self.assertIsNone(matcher())
+
+    def test_compiling_keeps_no_matcher(self) -> None:
+        created: List[weakref.ref] = []
+        original_init = lint.PatternMatcher.__init__
+
+        def init(matcher: lint.PatternMatcher) -> None:
+            original_init(matcher)
+            created.append(weakref.ref(matcher))
+        with mock.patch.object(lint.PatternMatcher, '__init__', init):
+            compiled = lint.compile_rulebook(phrase_rulebook("utilise"))
+        self.assertEqual([spec['id'] for spec in compiled['rules']], ["TEST-H-001"])
+        gc.collect()
+        self.assertTrue(created)
+        self.assertTrue(all(matcher() is None for matcher in created))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+# tests/test_regex_engine.py
+
+"""
+Parity test for the regex rule engine: the prefiltered single-scan engine in scripts/lint.py must report exactly
+the findings of the engine it replaced, which searched every line with every rule, on the scraped/*.md fixtures.
+"""
+
+import glob
+import logging
+import os
+import sys
+import unittest
+from typing import Any, Dict, List, Tuple
+
+REPO_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+import lint  # noqa: E402
+
+FIXTURES_GLOB: str = os.path.join(REPO_DIR, 'scraped', '*.md')
+RULEBOOK_FILE: str = os.path.join(REPO_DIR, 'Trinity.json')
+
+def per_rule_findings(lines: List[str], file_name: str, regex_rules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """The reference engine: searches every line with every rule."""
+    findings: List[Dict[str, Any]] = []
+    for rule in regex_rules:
+        compiled_pattern = rule.get("compiled_pattern")
+        if not compiled_pattern: continue
+        try:
+            for line_num, line in enumerate(lines, 1):
+                if compiled_pattern.search(line):
+                    findings.append(lint._regex_finding(file_name, line_num, rule, line.strip()))
+        except Exception as e:
+            logging.error(f"Error applying rule '{rule.get('id', 'N/A')}' to {file_name}: {e}")
+    return findings
+
+def finding_keys(findings: List[Dict[str, Any]]) -> List[Tuple[int, str, str]]:
+    return sorted((finding['lineNumber'], finding['ruleId'], finding['offendingText']) for finding in findings)
+
+class RegexEngineParityTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.regex_rules = [rule for rule in lint.load_rules_from_rulebook(RULEBOOK_FILE) if rule.get('type') == 'regex']
+        cls.fixtures = sorted(glob.glob(FIXTURES_GLOB))
+
+    def assert_parity(self, content: str, file_name: str) -> None:
+        lines = content.splitlines()
+        expected = finding_keys(per_rule_findings(lines, file_name, self.regex_rules))
+        actual = finding_keys(lint.scan_regex_rules(content, lines, file_name, self.regex_rules))
+        self.assertEqual(actual, expected, f"{file_name}: the engines' findings differ")
+
+    def test_rules_and_fixtures_loaded(self) -> None:
+        self.assertTrue(self.regex_rules, "no regex rules were loaded from Trinity.json")
+        self.assertTrue(self.fixtures, "no Markdown fixtures found in scraped/")
+
+    def test_scraped_fixtures(self) -> None:
+        for path in self.fixtures:
+            with self.subTest(fixture=os.path.basename(path)):
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.assert_parity(f.read(), os.path.basename(path))
+
+    def test_case_changed_fixtures(self) -> None:
+        # Every rule is case-insensitive, so the case-folded prefilter must keep each rule that matches in any case.
+        for path in self.fixtures:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            for name, variant in (("upper", content.upper()), ("swapped", content.swapcase())):
+                with self.subTest(fixture=os.path.basename(path), case=name):
+                    self.assert_parity(variant, os.path.basename(path))
+
+    def test_dotted_and_dotless_i(self) -> None:
+        # Characters that IGNORECASE matches against an ASCII 'i' without casefold() mapping them to it.
+        lines = [f"{word} in a sentence." for word in ("İt", "ıt", "ITEM", "ıtem", "İmportant")]
+        self.assert_parity('\n'.join(lines), 'unicode.md')
+
+if __name__ == '__main__':
+    unittest.main()
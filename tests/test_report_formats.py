@@ -0,0 +1,122 @@
+# tests/test_report_formats.py
+
+"""
+Tests for the report formats in scripts/lint.py: the json, jsonl, compact and sarif reports of the regex findings
+on the scraped/*.md fixtures are parsed back, and each holds the same findings in the same order, whether or not
+the writer spilled them to disk.
+"""
+
+import functools
+import glob
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import unittest
+from typing import Any, Dict, List
+from unittest import mock
+
+REPO_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+import lint  # noqa: E402
+
+FIXTURES_GLOB: str = os.path.join(REPO_DIR, 'scraped', '*.md')
+RULEBOOK_FILE: str = os.path.join(REPO_DIR, 'Trinity.json')
+BUFFER_SIZES: List[int] = [lint.REPORT_BUFFER_FINDINGS, 100]  # The second spills several runs
+
+def read_jsonl(path: str) -> List[Dict[str, Any]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+def read_compact(path: str) -> List[Dict[str, Any]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    findings = []
+    for file_index, line_number, rule_index, offending_text in report['findings']:
+        file, rule = report['files'][file_index], report['rules'][rule_index]
+        findings.append({"fileName": file['fileName'], "lineNumber": line_number, "ruleId": rule['ruleId'],
+                         "ruleDescription": rule['ruleDescription'], "severity": rule['severity'],
+                         "offendingText": offending_text, "githubUrl": f"{file['url']}#L{line_number}"})
+    return findings
+
+def read_sarif(path: str) -> List[Dict[str, Any]]:
+    """Returns the findings of a SARIF report with the fields it keeps: no URL, and the severity as a level."""
+    with open(path, 'r', encoding='utf-8') as f:
+        run = json.load(f)['runs'][0]
+    rules = run['tool']['driver']['rules']
+    findings = []
+    for result in run['results']:
+        location = result['locations'][0]['physicalLocation']
+        rule = rules[result['ruleIndex']]
+        findings.append({"fileName": location['artifactLocation']['uri'][len(lint.MARKDOWN_DIR) + 1:],
+                         "lineNumber": location['region']['startLine'], "ruleId": rule['id'],
+                         "ruleDescription": rule['shortDescription']['text'], "level": result['level'],
+                         "offendingText": location['region']['snippet']['text'], "message": result['message']['text']})
+    return findings
+
+class ReportFormatsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.temp_dir = tempfile.mkdtemp()
+        load = functools.partial(lint.load_compiled_rulebook, artifact_dir=os.path.join(cls.temp_dir, 'rulebooks'))
+        with mock.patch.object(lint, 'load_compiled_rulebook', load):
+            linting_rules = lint.load_rules_from_rulebook(RULEBOOK_FILE, ['*-R-*'])
+        cls.findings = [finding for path in sorted(glob.glob(FIXTURES_GLOB))
+                        for finding in lint.lint_file(path, os.path.basename(path), linting_rules)]
+        cls.expected = sorted(cls.findings, key=lambda f: (f['fileName'], f['lineNumber'], f['ruleId']))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def write(self, report_format: str, buffer_findings: int) -> str:
+        report_file = os.path.join(self.temp_dir, f"report-{buffer_findings}.{report_format}")
+        with lint.ReportWriter(report_file, report_format, buffer_findings) as report:
+            report.add(self.findings)
+        return report_file
+
+    def assert_round_trip(self, report_format: str, read) -> None:
+        self.assertGreater(len(self.findings), max(BUFFER_SIZES[1:]))
+        for buffer_findings in BUFFER_SIZES:
+            with self.subTest(buffer_findings=buffer_findings):
+                self.assertEqual(read(self.write(report_format, buffer_findings)), self.expected)
+
+    def test_json(self) -> None:
+        def read(path: str) -> List[Dict[str, Any]]:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        self.assert_round_trip('json', read)
+
+    def test_json_matches_json_dump(self) -> None:
+        with open(self.write('json', BUFFER_SIZES[0]), 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), json.dumps(self.expected, indent=2))
+
+    def test_jsonl(self) -> None:
+        self.assert_round_trip('jsonl', read_jsonl)
+
+    def test_compact(self) -> None:
+        self.assert_round_trip('compact', read_compact)
+
+    def test_sarif(self) -> None:
+        expected = [{"fileName": f['fileName'], "lineNumber": f['lineNumber'], "ruleId": f['ruleId'],
+                     "ruleDescription": f['ruleDescription'], "level": lint.SARIF_LEVELS[f['severity']],
+                     "offendingText": f['offendingText'], "message": lint.ReportWriter._sarif_message(f)}
+                    for f in self.expected]
+        for buffer_findings in BUFFER_SIZES:
+            with self.subTest(buffer_findings=buffer_findings):
+                findings = read_sarif(self.write('sarif', buffer_findings))
+                self.assertEqual(findings, expected)
+                for finding in findings:
+                    self.assertNotRegex(finding['message'], r'[.:;]: ')
+                    self.assertTrue(finding['message'].startswith(re.sub(r'[.:;]$', '', finding['ruleDescription'].strip()) + ': '))
+
+    def test_sarif_message(self) -> None:
+        finding = {"ruleId": "X-R-001", "ruleDescription": "Avoid Latin abbreviations.", "offendingText": "e.g.\n  this"}
+        self.assertEqual(lint.ReportWriter._sarif_message(finding), "Avoid Latin abbreviations: e.g. this")
+        self.assertEqual(lint.ReportWriter._sarif_message(dict(finding, ruleDescription=None)), "X-R-001: e.g. this")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+# tests/test_rule_selection.py
+
+"""
+Tests for rule selection in scripts/lint.py: --rules (with shell-style wildcards) and --severity choose the rules
+to run, the spaCy pipeline is cut down to the components the selected heuristics need, and a run with only regex
+rules never loads spaCy.
+"""
+
+import argparse
+import functools
+import glob
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from typing import Any, Dict, List
+from unittest import mock
+
+REPO_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+import lint  # noqa: E402
+
+FIXTURES_GLOB: str = os.path.join(REPO_DIR, 'scraped', '*.md')
+RULEBOOK_FILE: str = os.path.join(REPO_DIR, 'Trinity.json')
+
+SPECS: List[Dict[str, Any]] = [
+    {"id": "APS-GPC-Adverbs-R-001", "severity": "warn"},
+    {"id": "APS-GPC-Adverbs-H-001", "severity": "info"},
+    {"id": "APS-GPC-Nouns-R-004", "severity": "error"},
+    {"id": "APS-GPC-Nouns-H-001", "severity": "warn"},
+    {"id": None, "severity": "warn"},
+]
+
+def ids(specs: List[Dict[str, Any]]) -> List[Any]:
+    return [spec['id'] for spec in specs]
+
+class SelectRulesTest(unittest.TestCase):
+
+    def test_no_selection_keeps_every_rule(self) -> None:
+        self.assertEqual(lint.select_rules(SPECS), SPECS)
+
+    def test_exact_ids(self) -> None:
+        self.assertEqual(ids(lint.select_rules(SPECS, ["APS-GPC-Nouns-R-004", "APS-GPC-Adverbs-H-001"])),
+                         ["APS-GPC-Adverbs-H-001", "APS-GPC-Nouns-R-004"])
+
+    def test_wildcards(self) -> None:
+        self.assertEqual(ids(lint.select_rules(SPECS, ["*-R-*"])), ["APS-GPC-Adverbs-R-001", "APS-GPC-Nouns-R-004"])
+        self.assertEqual(ids(lint.select_rules(SPECS, ["APS-GPC-Adverbs-*"])), ["APS-GPC-Adverbs-R-001", "APS-GPC-Adverbs-H-001"])
+        self.assertEqual(ids(lint.select_rules(SPECS, ["APS-GPC-Nouns-?-00[1-3]"])), ["APS-GPC-Nouns-H-001"])
+        self.assertEqual(lint.select_rules(SPECS, ["aps-gpc-*"]), [], "rule ids are matched case-sensitively")
+
+    def test_severities(self) -> None:
+        self.assertEqual(ids(lint.select_rules(SPECS, severities=["error", "info"])), ["APS-GPC-Adverbs-H-001", "APS-GPC-Nouns-R-004"])
+
+    def test_ids_and_severities(self) -> None:
+        self.assertEqual(ids(lint.select_rules(SPECS, ["APS-GPC-Adverbs-*"], ["warn"])), ["APS-GPC-Adverbs-R-001"])
+
+    def test_command_line(self) -> None:
+        parser = argparse.ArgumentParser()
+        lint.add_lint_arguments(parser)
+        args = parser.parse_args(["--rules", "APS-GPC-Adverbs-*, *-R-004,", "--severity", "error,warn"])
+        self.assertEqual((args.rules, args.severity), (["APS-GPC-Adverbs-*", "*-R-004"], ["error", "warn"]))
+        args = parser.parse_args([])
+        self.assertEqual((args.rules, args.severity), (None, None))
+
+class LoadSelectedRulesTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        load = functools.partial(lint.load_compiled_rulebook, artifact_dir=os.path.join(self.temp_dir, 'rulebooks'))
+        patcher = mock.patch.object(lint, 'load_compiled_rulebook', load)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def heuristic_rulebook(self, *rule_ids: str) -> str:
+        rulebook_file = os.path.join(self.temp_dir, 'heuristics.json')
+        with open(rulebook_file, 'w', encoding='utf-8') as f:
+            json.dump([{"RuleSet": "Test", "rules": [{"id": rule_id, "category": "heuristic", "severity": "warn", "message": "Check it."}
+                                                     for rule_id in rule_ids]}], f)
+        return rulebook_file
+
+    def test_selection_matches_the_whole_rulebook(self) -> None:
+        every_rule = lint.load_rules_from_rulebook(RULEBOOK_FILE)
+        for rule_ids, severities in ((["*-R-*"], None), (["APS-GPC-Adverbs-*", "APS-GPC-Nouns-R-004"], None),
+                                     (None, ["error"]), (["*-H-*"], ["warn", "info"])):
+            with self.subTest(rules=rule_ids, severity=severities):
+                selected = lint.load_rules_from_rulebook(RULEBOOK_FILE, rule_ids, severities)
+                self.assertTrue(selected)
+                self.assertEqual(ids(selected), ids(lint.select_rules(every_rule, rule_ids, severities)))
+
+    def test_regex_rules_need_no_parse(self) -> None:
+        self.assertEqual(lint.required_spacy_components(lint.load_rules_from_rulebook(RULEBOOK_FILE, ["*-R-*"])), set())
+
+    def test_components_of_the_selected_heuristics(self) -> None:
+        rulebook_file = self.heuristic_rulebook("APS-GPC-Exclamationmarks-H-001", "APS-GPC-Adverbs-H-001", "APS-GPC-Nouns-H-001")
+        self.assertEqual(lint.required_spacy_components(lint.load_rules_from_rulebook(rulebook_file, ["APS-GPC-Exclamationmarks-*"])),
+                         {"tok2vec", "parser"})
+        self.assertEqual(lint.required_spacy_components(lint.load_rules_from_rulebook(rulebook_file, ["APS-GPC-Adverbs-*"])),
+                         {"tok2vec", "parser", "tagger", "attribute_ruler", "lemmatizer"})
+        for rule_ids in (["APS-GPC-Adverbs-*"], ["APS-GPC-Nouns-*"], None):
+            with self.subTest(rules=rule_ids):
+                self.assertNotIn("ner", lint.required_spacy_components(lint.load_rules_from_rulebook(rulebook_file, rule_ids)))
+
+    def test_regex_only_run_never_loads_spacy(self) -> None:
+        linting_rules = lint.load_rules_from_rulebook(RULEBOOK_FILE, ["*-R-*"])
+        files = [(path, os.path.basename(path)) for path in sorted(glob.glob(FIXTURES_GLOB))]
+        with mock.patch.object(lint, 'load_spacy_model', side_effect=AssertionError("spaCy was loaded")):
+            findings = [finding for _, file_findings in lint.lint_files(files, linting_rules) for finding in file_findings]
+        self.assertTrue(findings)
+        self.assertTrue(all(finding['ruleId'].split('-')[-2] == 'R' for finding in findings))
+
+    def test_heuristic_run_loads_only_the_needed_components(self) -> None:
+        import spacy
+        rulebook_file = self.heuristic_rulebook("APS-GPC-Exclamationmarks-H-001")
+        linting_rules = lint.load_rules_from_rulebook(rulebook_file)
+        stand_in = spacy.blank("en")
+        stand_in.add_pipe("sentencizer")
+        path = os.path.join(self.temp_dir, 'page.md')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("# A page\n\nIt is great! It is fine.\n")
+        with mock.patch.object(lint, 'load_spacy_model', return_value=stand_in) as load_spacy_model:
+            findings = [finding for _, file_findings in lint.lint_files([(path, 'page.md')], linting_rules) for finding in file_findings]
+        load_spacy_model.assert_called_once_with({"tok2vec", "parser"})
+        self.assertEqual([(finding['lineNumber'], finding['ruleId']) for finding in findings], [(3, "APS-GPC-Exclamationmarks-H-001")])
+
+if __name__ == '__main__':
+    unittest.main()
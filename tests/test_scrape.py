@@ -0,0 +1,380 @@
+# tests/test_scrape.py
+
+"""
+Tests for the scraper against a local HTTP server serving the saved pages in benchmarks/fixtures/html. Browser
+sessions are replaced by a fake driver that loads pages from the same server, so no Chrome is needed.
+"""
+
+import http.server
+import io
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+from typing import Dict, List, NamedTuple, Optional
+from unittest import mock
+
+from bs4 import BeautifulSoup
+from markdownify import markdownify
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+REPO_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+import scrape  # noqa: E402
+
+FIXTURES_DIR: str = os.path.join(REPO_DIR, 'benchmarks', 'fixtures', 'html')
+FIXTURE_PAGES: List[str] = sorted(name for name in os.listdir(FIXTURES_DIR) if name.endswith('.html'))
+FAKE_BROWSER_AGENT: str = 'FakeBrowser/1.0'
+RENDERED_ID: str = 'rendered-content'  # The container the fake browser's "script" wraps the page body in
+TEST_HOST_RATE: float = 20.0
+BLOCK_PAGE: str = ('<html><head><title>Just a moment...</title></head>'
+                   '<body><p>Checking if the site connection is secure</p></body></html>')
+
+# --- Fixture Server ---
+class ServedRequest(NamedTuple):
+    method: str
+    path: str
+    headers: Dict[str, str]
+    time: float
+
+class FixtureRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """
+    Serves the fixture pages, recording each request's method, path, headers and time on the server. Under
+    /challenge/ and /browser-only/, only the fake browser gets the page: other clients get a block page (with
+    validators of its own) or a 403.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=FIXTURES_DIR, **kwargs)
+
+    def send_head(self):
+        self.server.requests.append(ServedRequest(self.command, self.path, dict(self.headers), time.monotonic()))
+        route, _, page = self.path.lstrip('/').partition('/')
+        if route in ('challenge', 'browser-only'):
+            if self.headers.get('User-Agent') == FAKE_BROWSER_AGENT:
+                self.path = f'/{page}'
+            elif route == 'browser-only':
+                self.send_error(403)
+                return None
+            else:
+                body = BLOCK_PAGE.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', '"challenge"')
+                self.send_header('Last-Modified', self.date_time_string())
+                self.end_headers()
+                return io.BytesIO(body)
+        return super().send_head()
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+class FixtureServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), FixtureRequestHandler)
+        self.requests: List[ServedRequest] = []
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_port}/{path.lstrip('/')}"
+
+# --- Fake Browser ---
+class FakeBrowser:
+    """
+    Stands in for a Chrome session. It loads pages from the fixture server and, like a page script would, wraps
+    the body's content in a <div id="rendered-content">, so a selector can be found only once a page is rendered.
+    """
+
+    def __init__(self):
+        self.loaded: List[str] = []
+        self.page_source = ''
+        self.quit_called = False
+
+    def get(self, url: str) -> None:
+        self.loaded.append(url)
+        request = urllib.request.Request(url, headers={'User-Agent': FAKE_BROWSER_AGENT})
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                html = response.read().decode('utf-8')
+        except urllib.error.HTTPError as e:
+            html = e.read().decode('utf-8')
+        soup = BeautifulSoup(html, 'html.parser')
+        if soup.body is not None:
+            rendered = soup.new_tag('div', id=RENDERED_ID)
+            for child in list(soup.body.contents):
+                rendered.append(child.extract())
+            soup.body.append(rendered)
+        self.page_source = str(soup)
+
+    def find_element(self, by: str, value: str):
+        soup = BeautifulSoup(self.page_source, 'html.parser')
+        element = soup.select_one(value) if by == By.CSS_SELECTOR else soup.find(value)
+        if element is None:
+            raise NoSuchElementException(f"No element matches {value}")
+        return element
+
+    def execute_script(self, script: str):
+        if 'readyState' in script:
+            return 'complete'
+        return {'requests': 1, 'bytes': len(self.page_source)}
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+class FakeBrowserFactory:
+    """A `driver_factory` that records every fake browser it starts."""
+
+    def __init__(self):
+        self.browsers: List[FakeBrowser] = []
+        self.lock = threading.Lock()
+
+    def __call__(self) -> FakeBrowser:
+        browser = FakeBrowser()
+        with self.lock:
+            self.browsers.append(browser)
+        return browser
+
+    @property
+    def loaded(self) -> List[str]:
+        return [url for browser in self.browsers for url in browser.loaded]
+
+class ScrapeTestCase(unittest.TestCase):
+    """Starts the fixture server once per class and gives every test an empty output directory."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = FixtureServer()
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.output_dir = tempfile.mkdtemp(prefix='scrape-test-')
+        self.addCleanup(shutil.rmtree, self.output_dir, ignore_errors=True)
+        patcher = mock.patch.object(scrape, 'OUTPUT_DIR', self.output_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.server.requests.clear()
+        self.factory = FakeBrowserFactory()
+        self.rate_limiter = scrape.HostRateLimiter(TEST_HOST_RATE, 1)
+
+    def target(self, page: str, output: Optional[str] = None, **options) -> Dict[str, str]:
+        return {"url": self.server.url(page), "output": output or os.path.basename(page).replace('.html', '.md'), **options}
+
+    def read_output(self, output: str) -> str:
+        with open(os.path.join(self.output_dir, output), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def expected_markdown(self, page: str, selector: Optional[str] = None) -> str:
+        """The Markdown of a fixture page as served over plain HTTP."""
+        with open(os.path.join(FIXTURES_DIR, page), 'r', encoding='utf-8') as f:
+            return scrape.html_to_markdown(f.read(), selector)
+
+    def rendered_markdown(self, url: str, selector: Optional[str] = None) -> str:
+        """The Markdown of a page as rendered by the fake browser."""
+        browser = FakeBrowser()
+        browser.get(url)
+        return scrape.html_to_markdown(browser.page_source, selector)
+
+# --- HTML Cleaning ---
+class HtmlToMarkdownTest(unittest.TestCase):
+
+    def test_matches_converting_the_serialised_cleaned_body(self) -> None:
+        # The conversion before lxml and the single exclusion pass; existing outputs must not change.
+        for page in FIXTURE_PAGES:
+            with open(os.path.join(FIXTURES_DIR, page), 'r', encoding='utf-8') as f:
+                html = f.read()
+            body = BeautifulSoup(html, 'html.parser').body
+            for tag_selector in scrape.TAGS_TO_EXCLUDE:
+                for tag in body.select(tag_selector):
+                    tag.decompose()
+            with self.subTest(page=page):
+                self.assertEqual(scrape.html_to_markdown(html), markdownify(str(body), heading_style="ATX"))
+
+    def test_missing_selector(self) -> None:
+        self.assertIsNone(scrape.html_to_markdown("<html><body><p>Text</p></body></html>", "#content"))
+
+# --- Concurrency and Rate Limiting ---
+class ConcurrentScrapeTest(ScrapeTestCase):
+
+    def copies(self, count: int, **options) -> List[Dict[str, str]]:
+        """`count` targets cycling through the fixture pages, each with its own URL and output file."""
+        return [self.target(f"{FIXTURE_PAGES[i % len(FIXTURE_PAGES)]}?copy={i}", f"copy-{i}.md", **options) for i in range(count)]
+
+    def test_sessions_share_the_work_queue(self) -> None:
+        targets = self.copies(6, render=True)
+        documents: List[str] = []
+        scrape.scrape_concurrently(targets, 3, self.rate_limiter, self.factory, on_document=documents.append)
+
+        self.assertEqual(sorted(documents), sorted(os.path.join(self.output_dir, t['output']) for t in targets))
+        self.assertEqual(sorted(self.factory.loaded), sorted(t['url'] for t in targets))
+        self.assertTrue(1 <= len(self.factory.browsers) <= 3)
+        self.assertTrue(all(browser.quit_called for browser in self.factory.browsers))
+        for target in targets:
+            self.assertEqual(self.read_output(target['output']), self.rendered_markdown(target['url']))
+
+    def test_rate_limiter_spaces_requests_to_a_host(self) -> None:
+        rate = 10.0
+        for sessions in (1, 3):
+            with self.subTest(sessions=sessions):
+                self.server.requests.clear()
+                targets = self.copies(5)
+                scrape.scrape_targets(targets, sessions, scrape.HostRateLimiter(rate, 1), use_http=True)
+                times = sorted(request.time for request in self.server.requests)
+                self.assertEqual(len(times), len(targets))
+                gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+                # The server records a request a moment after the bucket releases it, so allow for some jitter.
+                self.assertGreater(min(gaps), 0.5 / rate)
+                self.assertGreater(times[-1] - times[0], 0.9 * (len(targets) - 1) / rate)
+
+    def test_browser_loads_are_rate_limited(self) -> None:
+        rate = 10.0
+        targets = self.copies(4, render=True)
+        scrape.scrape_concurrently(targets, 2, scrape.HostRateLimiter(rate, 1), self.factory)
+        times = sorted(request.time for request in self.server.requests)
+        self.assertEqual(len(times), len(targets))
+        self.assertGreater(times[-1] - times[0], 0.9 * (len(targets) - 1) / rate)
+
+    def test_retries_wait_for_the_rate_limiter(self) -> None:
+        class FlakyBrowser(FakeBrowser):
+            def get(self, url: str) -> None:
+                if not self.loaded:
+                    self.loaded.append(url)
+                    raise scrape.WebDriverException("connection reset")
+                super().get(url)
+
+        rate_limiter = mock.Mock(wraps=self.rate_limiter)
+        with mock.patch.object(scrape.time, 'sleep'):
+            html = scrape.fetch_with_browser(FlakyBrowser(), self.server.url(FIXTURE_PAGES[0]), rate_limiter)
+        self.assertIsNotNone(html)
+        self.assertEqual(rate_limiter.acquire.call_count, 2)
+
+# --- Tiered Fetching ---
+class TieredFetchTest(ScrapeTestCase):
+
+    def scrape(self, target: Dict[str, str], manifest: Optional[scrape.ScrapeManifest] = None) -> Optional[str]:
+        return scrape.scrape_url(scrape.LazyDriver(self.factory), target, self.rate_limiter, manifest, use_http=True)
+
+    def plain_requests(self) -> List[ServedRequest]:
+        return [request for request in self.server.requests if request.headers.get('User-Agent') == scrape.USER_AGENT]
+
+    def test_server_rendered_page_skips_the_browser(self) -> None:
+        for page in FIXTURE_PAGES:
+            with self.subTest(page=page):
+                target = self.target(page)
+                self.assertEqual(self.scrape(target), os.path.join(self.output_dir, target['output']))
+                self.assertEqual(self.read_output(target['output']), self.expected_markdown(page))
+        self.assertEqual(self.factory.browsers, [])
+        self.assertEqual([request.method for request in self.plain_requests()], ['GET'] * len(FIXTURE_PAGES))
+
+    def assert_rendered(self, target: Dict[str, str], selector: Optional[str] = None) -> None:
+        self.assertEqual(self.scrape(target), os.path.join(self.output_dir, target['output']))
+        self.assertEqual(self.factory.loaded, [target['url']])
+        self.assertEqual(self.read_output(target['output']), self.rendered_markdown(target['url'], selector))
+
+    def test_block_page_escalates_to_the_browser(self) -> None:
+        self.assert_rendered(self.target(f"challenge/{FIXTURE_PAGES[0]}"))
+
+    def test_missing_selector_escalates_to_the_browser(self) -> None:
+        selector = f"#{RENDERED_ID}"
+        self.assert_rendered(self.target(FIXTURE_PAGES[0], selector=selector), selector)
+
+    def test_error_status_escalates_to_the_browser(self) -> None:
+        self.assert_rendered(self.target(f"browser-only/{FIXTURE_PAGES[0]}"))
+
+    def test_render_true_goes_straight_to_the_browser(self) -> None:
+        self.assert_rendered(self.target(FIXTURE_PAGES[0], render=True))
+        self.assertEqual(self.plain_requests(), [])
+
+    def test_not_modified_page_is_skipped(self) -> None:
+        manifest_path = os.path.join(self.output_dir, '.manifest.json')
+        target = self.target(FIXTURE_PAGES[0])
+        first_run = scrape.ScrapeManifest(manifest_path)
+        self.scrape(target, first_run)
+        first_run.save()
+        output_path = os.path.join(self.output_dir, target['output'])
+        os.utime(output_path, (1_000_000_000, 1_000_000_000))
+        self.server.requests.clear()
+
+        second_run = scrape.ScrapeManifest(manifest_path)
+        self.assertEqual(self.scrape(target, second_run), output_path)
+        self.assertEqual(len(self.plain_requests()), 1)
+        self.assertIn('If-Modified-Since', self.plain_requests()[0].headers)
+        self.assertEqual(self.factory.browsers, [])
+        self.assertEqual(os.path.getmtime(output_path), 1_000_000_000)
+        self.assertEqual((second_run.changed, second_run.unchanged), ([], [target['output']]))
+
+    def test_escalated_response_validators_are_not_recorded(self) -> None:
+        manifest_path = os.path.join(self.output_dir, '.manifest.json')
+        target = self.target(f"challenge/{FIXTURE_PAGES[0]}")
+        manifest = scrape.ScrapeManifest(manifest_path)
+        self.scrape(target, manifest)
+        manifest.save()
+        recorded = scrape.ScrapeManifest(manifest_path).get(target['url'])
+        self.assertNotIn('etag', recorded)
+        self.assertNotIn('lastModified', recorded)
+
+        # The next run loads the page in full rather than revalidating against the block page's validators.
+        self.server.requests.clear()
+        self.scrape(target, scrape.ScrapeManifest(manifest_path))
+        self.assertNotIn('If-None-Match', self.plain_requests()[0].headers)
+        self.assertEqual(len(self.factory.loaded), 2)
+
+# --- Scrape Manifest ---
+class ScrapeManifestTest(ScrapeTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.manifest_path = os.path.join(self.output_dir, '.manifest.json')
+
+    def test_forced_run_still_records_the_manifest(self) -> None:
+        target = self.target(FIXTURE_PAGES[0])
+        scrape.scrape_url(self.factory, target, self.rate_limiter, scrape.ScrapeManifest(self.manifest_path), use_http=True)
+        output_path = os.path.join(self.output_dir, target['output'])
+        os.utime(output_path, (1_000_000_000, 1_000_000_000))
+        self.server.requests.clear()
+
+        manifest = scrape.ScrapeManifest(self.manifest_path, force=True)
+        self.assertEqual(scrape.scrape_url(self.factory, target, self.rate_limiter, manifest, use_http=True), output_path)
+        manifest.save()
+
+        # The page was loaded in full, without a conditional request...
+        self.assertEqual([request.method for request in self.server.requests], ['GET'])
+        self.assertNotIn('If-Modified-Since', self.server.requests[0].headers)
+        # ...but its byte-identical output was left alone, and the run was recorded.
+        self.assertEqual(os.path.getmtime(output_path), 1_000_000_000)
+        self.assertEqual((manifest.changed, manifest.unchanged), ([], [target['output']]))
+        recorded = scrape.ScrapeManifest(self.manifest_path).get(target['url'])
+        self.assertIn('lastModified', recorded)
+        self.assertEqual(recorded['contentHash'], scrape.hashlib.sha256(self.read_output(target['output']).encode('utf-8')).hexdigest())
+
+    def test_browser_scrape_sends_no_head_request(self) -> None:
+        target = self.target(FIXTURE_PAGES[0])
+        for force in (False, True):
+            with self.subTest(force=force):
+                self.server.requests.clear()
+                manifest = scrape.ScrapeManifest(self.manifest_path, force=force)
+                scrape.scrape_url(scrape.LazyDriver(self.factory), target, self.rate_limiter, manifest)
+                manifest.save()
+                # The page is loaded once, in the browser; no HEAD request is sent only to collect validators.
+                self.assertEqual([request.method for request in self.server.requests], ['GET'])
+                self.assertEqual(self.server.requests[0].headers.get('User-Agent'), FAKE_BROWSER_AGENT)
+                recorded = scrape.ScrapeManifest(self.manifest_path).get(target['url'])
+                self.assertNotIn('etag', recorded)
+                self.assertNotIn('lastModified', recorded)
+                self.assertIn('contentHash', recorded)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+# tests/test_shared_segments.py
+
+"""
+Tests for shared segments in scripts/lint.py: when two files share text, the second reuses the first's cached
+segment findings, and both get the findings and line numbers of linting each file on its own. The heuristic test
+parses with the spaCy model and is skipped unless it is installed.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from typing import Any, Dict, List, Tuple
+
+REPO_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+import lint  # noqa: E402
+
+FIXTURE_FILE: str = os.path.join(REPO_DIR, 'scraped', 'Infringement101.md')
+RULEBOOK_FILE: str = os.path.join(REPO_DIR, 'Trinity.json')
+
+# The second file replaces the first one's heading with an introduction of its own, moving the rest down the page.
+SECOND_INTRO: str = "# Another page\n\nThis page starts with its own introduction. It are very unique!\n\nIt has a second paragraph, e.g. this one.\n\n"
+
+def model_installed() -> bool:
+    import spacy
+    try:
+        spacy.load(lint.SPACY_MODEL)
+    except OSError:
+        return False
+    return True
+
+def finding_keys(findings: List[Dict[str, Any]]) -> List[Tuple[str, int, str, str, str]]:
+    return sorted((f['fileName'], f['lineNumber'], f['ruleId'], f['offendingText'], f['githubUrl']) for f in findings)
+
+class SharedSegmentsTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        with open(FIXTURE_FILE, 'r', encoding='utf-8') as f:
+            first = f.read()
+        lines = first.splitlines()
+        second = SECOND_INTRO + '\n'.join(lines[4:]) + '\n'
+        self.files = []
+        for file_name, content in (('first.md', first), ('second.md', second)):
+            path = os.path.join(self.temp_dir, file_name)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            self.files.append((path, file_name))
+
+    def assert_segment_parity(self, linting_rules: List[Dict[str, Any]]) -> None:
+        separately = {file_name: finding_keys(lint.lint_file(path, file_name, linting_rules)) for path, file_name in self.files}
+        cache = lint.create_lint_cache(linting_rules, os.path.join(self.temp_dir, 'cache'))
+        # One file per window, so the second is linted after the first one's segments are cached.
+        shared = {file_name: finding_keys(findings) for file_name, findings
+                  in lint.lint_files(self.files, linting_rules, batch_size=1, cache=cache, segments=True)}
+        self.assertGreater(cache.segment_hits, 0, "the second file reused no segment")
+        self.assertTrue(separately['second.md'])
+        self.assertEqual(shared, separately)
+
+    def test_regex_rules_segments_like_separate_lints(self) -> None:
+        self.assert_segment_parity(lint.load_rules_from_rulebook(RULEBOOK_FILE, ['*-R-*']))
+
+    @unittest.skipUnless(model_installed(), f"the spaCy model {lint.SPACY_MODEL} is not installed")
+    def test_heuristic_rules_segments_like_separate_lints(self) -> None:
+        self.assert_segment_parity(lint.load_rules_from_rulebook(RULEBOOK_FILE))
+
+if __name__ == '__main__':
+    unittest.main()